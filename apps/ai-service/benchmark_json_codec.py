@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the Prisma client's JSON codecs on quote payloads.
+
+Times decoding a findMany response of quotes (itemized JSON ``items``, email
+``rawData``, ``terms``) and encoding a createMany query of the same quotes,
+once with the stdlib codec and once with orjson. No database is needed:
+
+    python benchmark_json_codec.py --quotes 500 --runs 20
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from prisma_client import Json, models
+from prisma_client._builder import QueryBuilder, serializer
+from prisma_client._codec import JSONCodec, OrjsonCodec, StdlibCodec, set_codec
+from prisma_client.client import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+
+def line_items(quote: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"Item {item} — ergonomic office chair, mesh back",
+            "quantity": 10 + item,
+            "unit_price": 149.99 + item,
+            "total_price": (149.99 + item) * (10 + item),
+            "sku": f"SKU-{quote:05d}-{item:02d}",
+            "specifications": {"color": "graphite", "warranty_years": 5, "certifications": ["BIFMA", "GREENGUARD"]},
+        }
+        for item in range(12)
+    ]
+
+
+def raw_email(quote: int) -> Dict[str, Any]:
+    return {
+        "id": f"msg-{quote}",
+        "thread_id": f"thread-{quote // 3}",
+        "from": f"Sales Team <sales{quote % 40}@vendor.example.com>",
+        "subject": f"RE: RFQ #{quote} - Office furniture",
+        "body": "Thank you for your request. Please find our quotation below.\n" * 40,
+        "attachments": [{"filename": "quote.pdf", "mime_type": "application/pdf", "size": 182_044}],
+        "classification": {"is_quote": True, "confidence": 0.93},
+    }
+
+
+def quote_row(quote: int, created: datetime) -> Dict[str, Any]:
+    """A Quote row as the query engine returns it, with JSON columns as strings."""
+    return {
+        "id": f"quote-{quote}",
+        "orgId": "org-1",
+        "requestId": f"request-{quote // 5}",
+        "vendorId": f"vendor-{quote % 40}",
+        "items": json.dumps(line_items(quote)),
+        "totalAmount": "24318.60",
+        "currency": "USD",
+        "deliveryDays": 14,
+        "validUntil": (created + timedelta(days=30)).isoformat(),
+        "terms": json.dumps({"payment": "Net 30", "incoterms": "DAP", "notes": ["Prices exclude VAT"]}),
+        "source": "EMAIL",
+        "rawData": json.dumps(raw_email(quote)),
+        "confidence": 0.91,
+        "status": "PENDING",
+        "createdAt": created.isoformat(),
+        "updatedAt": created.isoformat(),
+    }
+
+
+def quote_create(quote: int, created: datetime) -> Dict[str, Any]:
+    """createMany data for a quote as the quote processing workflow builds it."""
+    return {
+        "orgId": "org-1",
+        "requestId": f"request-{quote // 5}",
+        "vendorId": f"vendor-{quote % 40}",
+        "items": Json(line_items(quote)),
+        "totalAmount": Decimal("24318.60"),
+        "validUntil": created + timedelta(days=30, microseconds=123456),
+        "terms": Json({"payment": "Net 30", "incoterms": "DAP"}),
+        "rawData": Json(raw_email(quote)),
+        "confidence": 0.91,
+    }
+
+
+def median_ms(action: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def build_create_many(data: List[Dict[str, Any]]) -> str:
+    return QueryBuilder(
+        method="create_many",
+        model=models.Quote,
+        arguments={"data": data},
+        prisma_models=PRISMA_MODELS,
+        relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+    ).build()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quotes", type=int, default=500, help="quotes per payload")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    created = datetime(2026, 10, 17, 9, 30)
+    body = json.dumps({"data": {"result": [quote_row(q, created) for q in range(args.quotes)]}}).encode()
+    data = [quote_create(q, created) for q in range(args.quotes)]
+    print(f"📦 {args.quotes} quotes: response {len(body) / 1024:.0f} KiB")
+
+    codecs: List[JSONCodec] = [StdlibCodec(), OrjsonCodec()]
+
+    # Both codecs must agree on every value, including datetimes and decimals
+    decoded = [codec.loads(body) for codec in codecs]
+    assert decoded[0] == decoded[1]
+    encoded = [json.loads(codec.dumps(data, default=serializer)) for codec in codecs]
+    assert encoded[0] == encoded[1]
+
+    results = {}
+    for codec in codecs:
+        previous = set_codec(codec)
+        try:
+            results[codec.name] = (
+                median_ms(lambda: codec.loads(body), args.runs),
+                median_ms(lambda: build_create_many(data), args.runs),
+            )
+        finally:
+            set_codec(previous)
+
+    print(f"{'codec':<8} {'decode ms':>10} {'encode ms':>10}")
+    for name, (decode, encode) in results.items():
+        print(f"{name:<8} {decode:>10.2f} {encode:>10.2f}")
+
+    (stdlib_decode, stdlib_encode), (fast_decode, fast_encode) = results["json"], results["orjson"]
+    print(f"speedup  {stdlib_decode / fast_decode:>9.1f}x {stdlib_encode / fast_encode:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the Prisma query builder's template cache.
+
+Builds the query text of the service's common query shapes repeatedly with
+the shape-keyed template cache disabled and enabled, and prints the mean
+build time per query. No database or query engine is needed:
+
+    python benchmark_query_builder.py --iterations 20000
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+from prisma_client import Json, models
+from prisma_client._builder import QueryBuilder, query_template_cache
+from prisma_client.client import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+# (name, method, model, arguments factory) - arguments change on every call
+SHAPES: List[Tuple[str, str, Any, Any]] = [
+    (
+        "execution by id",
+        "find_unique",
+        models.WorkflowExecution,
+        lambda: {"where": {"id": uuid4().hex}, "include": None},
+    ),
+    (
+        "active vendors",
+        "find_many",
+        models.Vendor,
+        lambda: {"where": {"orgId": uuid4().hex, "isActive": True}, "order_by": [{"name": "asc"}], "include": None},
+    ),
+    (
+        "waiting executions",
+        "find_first",
+        models.WorkflowExecution,
+        lambda: {
+            "where": {
+                "entityId": uuid4().hex,
+                "entityType": "ProcurementRequest",
+                "status": {"in": ["PENDING", "RUNNING"]},
+            },
+            "order_by": [{"startedAt": "desc"}],
+            "include": None,
+        },
+    ),
+    (
+        "request with quotes",
+        "find_unique",
+        models.ProcurementRequest,
+        lambda: {"where": {"id": uuid4().hex}, "include": {"quotes": {"include": {"vendor": True}}}},
+    ),
+    (
+        "execution state update",
+        "update",
+        models.WorkflowExecution,
+        lambda: {
+            "where": {"id": uuid4().hex},
+            "data": {
+                "currentState": "select_vendors",
+                "stateData": Json({"data": {"vendors": [uuid4().hex]}}),
+                "status": "RUNNING",
+            },
+            "include": None,
+        },
+    ),
+    (
+        "audit log",
+        "create",
+        models.AuditLog,
+        lambda: {
+            "data": {
+                "orgId": uuid4().hex,
+                "action": "WORKFLOW_STEP",
+                "entityType": "ProcurementRequest",
+                "entityId": uuid4().hex,
+                "metadata": Json({"step": "validate_request"}),
+                "createdAt": datetime.now(),
+            },
+            "include": None,
+        },
+    ),
+]
+
+
+def build(method: str, model: Any, arguments: Dict[str, Any]) -> str:
+    return QueryBuilder(
+        method=method,
+        model=model,
+        arguments=arguments,
+        prisma_models=PRISMA_MODELS,
+        relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+    ).build_query()
+
+
+def measure(method: str, model: Any, factory: Any, iterations: int, enabled: bool) -> float:
+    """Mean microseconds per build, excluding the time to create the arguments."""
+    query_template_cache.enabled = enabled
+    query_template_cache.clear()
+    arguments = [factory() for _ in range(iterations)]
+    calls = iter(arguments)
+    seconds = timeit.timeit(lambda: build(method, model, next(calls)), number=iterations)
+    return seconds / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="builds per shape and mode")
+    args = parser.parse_args()
+
+    print(f"{'query':<26} {'uncached µs':>12} {'cached µs':>10} {'speedup':>8}")
+    for name, method, model, factory in SHAPES:
+        # same text either way, the cache only changes how it is produced
+        sample = factory()
+        query_template_cache.enabled = False
+        expected = build(method, model, sample)
+        query_template_cache.enabled = True
+        assert build(method, model, sample) == expected, name
+
+        uncached = measure(method, model, factory, args.iterations, enabled=False)
+        cached = measure(method, model, factory, args.iterations, enabled=True)
+        print(f"{name:<26} {uncached:>12.1f} {cached:>10.1f} {uncached / cached:>7.1f}x")
+
+    query_template_cache.enabled = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark of row and columnar deserialization of raw query results.
+
+Times deserializing a monthly spend-per-vendor aggregate (bigint counts,
+decimal totals, double prices, JSON terms) into row dictionaries with
+``query_raw`` semantics, into row dictionaries followed by building NumPy
+arrays from them, and directly into columns with ``query_raw_columnar``
+semantics. No database is needed:
+
+    python benchmark_raw_columns.py --rows 100000 --runs 5
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from prisma_client._raw_query import deserialize_raw_columns, deserialize_raw_results
+
+COLUMNS = ["vendor_id", "month", "currency", "quote_count", "total_spend", "avg_unit_price", "terms"]
+TYPES = ["string", "datetime", "string", "bigint", "decimal", "double", "json"]
+NUMERIC = ["quote_count", "total_spend", "avg_unit_price"]
+
+
+def spend_result(rows: int) -> Dict[str, Any]:
+    """A raw result as the query engine returns it for a spend-per-vendor query."""
+    start = datetime(2024, 1, 1)
+    return {
+        "columns": COLUMNS,
+        "types": TYPES,
+        "rows": [
+            [
+                f"vendor-{row % 2000}",
+                (start + timedelta(days=30 * (row // 2000))).isoformat() + "+00:00",
+                "USD",
+                str(1 + row % 37),
+                f"{(row % 9973) * 131.07:.2f}",
+                # every 50th vendor has no priced quotes that month
+                None if row % 50 == 0 else 12.5 + row % 400 * 0.25,
+                {"payment": "Net 30", "incoterms": "DAP"},
+            ]
+            for row in range(rows)
+        ],
+    }
+
+
+def median_ms(action: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def rows_to_arrays(result: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    rows = deserialize_raw_results(result)
+    return {name: np.array([row[name] for row in rows], dtype=np.float64) for name in NUMERIC}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="rows per result")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    result = spend_result(args.rows)
+    print(f"📦 {args.rows} rows x {len(COLUMNS)} columns")
+
+    # Both paths must agree on every numeric value
+    columns = deserialize_raw_columns(result)
+    arrays = rows_to_arrays(result)
+    for name in NUMERIC:
+        np.testing.assert_allclose(columns[name], arrays[name], equal_nan=True)
+
+    results: List[tuple] = [
+        ("rows", median_ms(lambda: deserialize_raw_results(result), args.runs)),
+        ("rows+numpy", median_ms(lambda: rows_to_arrays(result), args.runs)),
+        ("columnar", median_ms(lambda: deserialize_raw_columns(result), args.runs)),
+    ]
+
+    print(f"{'mode':<12} {'ms':>10}")
+    for name, elapsed in results:
+        print(f"{name:<12} {elapsed:>10.2f}")
+
+    columnar = results[-1][1]
+    print(f"speedup      {results[0][1] / columnar:>9.1f}x vs rows, {results[1][1] / columnar:.1f}x vs rows+numpy")
+
+
+if __name__ == "__main__":
+    main()
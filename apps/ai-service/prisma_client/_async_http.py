@@ -4,6 +4,7 @@ from typing_extensions import override
 
 import httpx
 
+from ._codec import get_codec
 from ._types import Method
 from .http_abstract import AbstractHTTP, AbstractResponse
 
@@ -61,6 +62,8 @@ class Response(AbstractResponse[httpx.Response]):
 
     @override
     async def json(self, **kwargs: Any) -> Any:
+        if not kwargs:
+            return get_codec().loads(await self.original.aread())
         return json.loads(await self.original.aread(), **kwargs)
 
     @override
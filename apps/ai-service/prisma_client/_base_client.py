@@ -21,6 +21,7 @@ from .engine import (
 from .errors import ClientNotConnectedError, ClientNotRegisteredError
 from ._compat import model_parse, removeprefix
 from ._builder import QueryBuilder
+from ._loader import FindUniqueLoader
 from ._metrics import Metrics
 from ._registry import get_client
 from .generator.models import EngineType
@@ -76,6 +77,8 @@ class BasePrisma(Generic[_EngineT]):
     _http_config: HttpConfig
     _internal_engine: _EngineT | None
     _copied: bool
+    _batch_find_unique: bool
+    _find_unique_loader: FindUniqueLoader | None
 
     # from generation
     _schema_path: Path
@@ -89,6 +92,8 @@ class BasePrisma(Generic[_EngineT]):
     __slots__ = (
         '_copied',
         '_tx_id',
+        '_batch_find_unique',
+        '_find_unique_loader',
         '_datasource',
         '_log_queries',
         '_http_config',
@@ -112,6 +117,7 @@ class BasePrisma(Generic[_EngineT]):
         datasource: DatasourceOverride | None,
         connect_timeout: int | timedelta,
         http: HttpConfig | None,
+        batch_find_unique: bool = False,
     ) -> None:
         # NOTE: if you add any more properties here then you may also need to forward
         # them in the `_copy()` method.
@@ -132,6 +138,8 @@ class BasePrisma(Generic[_EngineT]):
         self._http_config: HttpConfig = http or {}
         self._tx_id: TransactionId | None = None
         self._copied: bool = False
+        self._batch_find_unique = batch_find_unique
+        self._find_unique_loader = None
 
         if use_dotenv:
             load_env()
@@ -214,6 +222,9 @@ class BasePrisma(Generic[_EngineT]):
             datasource=self._datasource,
             log_queries=self._log_queries,
             connect_timeout=self._connect_timeout,
+            # a transaction runs its queries one at a time on its own
+            # connection, so there is nothing for a loader to coalesce
+            batch_find_unique=False,
         )
         new._copied = True
 
@@ -536,6 +547,26 @@ class AsyncBasePrisma(BasePrisma[AsyncAbstractEngine]):
         arguments: dict[str, Any],
         model: type[BaseModel] | None = None,
         root_selection: list[str] | None = None,
+    ) -> Any:
+        if self._batch_find_unique and method == 'find_unique' and root_selection is None:
+            if self._find_unique_loader is None:
+                self._find_unique_loader = FindUniqueLoader(self)
+
+            pending = self._find_unique_loader.load(model=model, arguments=arguments)
+            if pending is not None:
+                return await pending
+
+        return await self._execute_unbatched(
+            method=method, model=model, arguments=arguments, root_selection=root_selection
+        )
+
+    async def _execute_unbatched(
+        self,
+        *,
+        method: PrismaMethod,
+        arguments: dict[str, Any],
+        model: type[BaseModel] | None = None,
+        root_selection: list[str] | None = None,
     ) -> Any:
         builder = self._make_query_builder(
             method=method, model=model, arguments=arguments, root_selection=root_selection
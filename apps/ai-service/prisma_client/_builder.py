@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import re
 import json
 import decimal
 import inspect
 import logging
 import datetime
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Union, Mapping, Iterable, ForwardRef, cast
+from typing import TYPE_CHECKING, Any, Union, Mapping, Iterable, Iterator, ForwardRef, cast
 from datetime import timezone
 from textwrap import indent
 from functools import singledispatch
@@ -19,6 +20,7 @@ from . import fields
 from ._types import PrismaMethod
 from .errors import InvalidModelError, UnknownModelError, UnknownRelationalFieldError
 from ._compat import get_args, is_union, get_origin, model_fields, model_field_type
+from ._codec import get_codec
 from ._typing import is_list_type
 from ._constants import QUERY_BUILDER_ALIASES
 
@@ -73,6 +75,8 @@ METHOD_FORMAT_MAPPING: dict[PrismaMethod, str] = {
     'find_unique_or_raise': 'findUnique{model}OrThrow',
 }
 
+RAW_METHODS: set[PrismaMethod] = {'execute_raw', 'query_raw', 'query_first'}
+
 MISSING = object()
 Operation = Literal['query', 'mutation']
 
@@ -185,10 +189,46 @@ class QueryBuilder:
           }
         }
         """
-        query = self._create_root_node().render()
+        if query_template_cache.enabled and self.method not in RAW_METHODS:
+            query = self._build_cached_query()
+        else:
+            query = self._create_root_node().render()
+
         log.debug('Generated query: \n%s', query)
         return query
 
+    def _build_cached_query(self) -> str:
+        """Render the query from a cached template of the same shape
+
+        The shape of a query is everything but the scalar argument values, the
+        template is the query rendered with a placeholder for each of these values.
+        """
+        leaves: list[Any] = []
+        try:
+            key = (
+                self.method,
+                self.model,
+                _shape_mapping(self.arguments, leaves),
+                dumps(self.include),
+                tuple(self.root_selection) if self.root_selection is not None else None,
+            )
+            template = query_template_cache.get(key)
+        except TypeError:
+            # unhashable argument keys or an include that cannot be serialised
+            return self._create_root_node().render()
+
+        if template is None:
+            arguments = self.arguments
+            self.arguments = _slotted_mapping(arguments, iter(range(len(leaves))))
+            try:
+                template = QueryTemplate(self._create_root_node().render())
+            finally:
+                self.arguments = arguments
+
+            query_template_cache.set(key, template)
+
+        return template.render(leaves)
+
     def _create_root_node(self) -> 'RootNode':
         root = RootNode(builder=self)
         root.add(ResultNode.create(self))
@@ -279,6 +319,122 @@ class QueryBuilder:
         return transformed
 
 
+class QueryTemplate:
+    """A rendered query with placeholders in place of argument values"""
+
+    parts: list[str]
+    """Literal query text surrounding the placeholders"""
+
+    slots: list[int]
+    """Index of the argument value rendered after each part but the last"""
+
+    __slots__ = ('parts', 'slots')
+
+    def __init__(self, query: str) -> None:
+        split = _SLOT_PATTERN.split(query)
+        self.parts = split[::2]
+        self.slots = [int(index) for index in split[1::2]]
+
+    def render(self, values: list[Any]) -> str:
+        strings = [self.parts[0]]
+        for index, part in zip(self.slots, self.parts[1:]):
+            strings.append(dumps(values[index]))
+            strings.append(part)
+        return ''.join(strings)
+
+
+class QueryTemplateCache:
+    """Bounded mapping of query shapes to rendered query templates"""
+
+    enabled: bool
+    maxsize: int
+
+    __slots__ = ('enabled', 'maxsize', '_templates')
+
+    def __init__(self, *, maxsize: int = 1024, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.maxsize = maxsize
+        self._templates: dict[Any, QueryTemplate] = {}
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, key: Any) -> QueryTemplate | None:
+        return self._templates.get(key)
+
+    def set(self, key: Any, template: QueryTemplate) -> None:
+        if len(self._templates) >= self.maxsize:
+            # evict the oldest shape, e.g. one of many `in` filters of different lengths
+            self._templates.pop(next(iter(self._templates)), None)
+        self._templates[key] = template
+
+    def clear(self) -> None:
+        self._templates.clear()
+
+
+query_template_cache = QueryTemplateCache()
+
+# placeholder for the nth argument value, its JSON encoding cannot come from user data
+# as the template is rendered without any argument values
+_SLOT_MARKER = '\x00{}\x00'
+_SLOT_PATTERN = re.compile(r'"\\u0000(\d+)\\u0000"')
+
+
+def _shape_mapping(data: Mapping[str, Any], leaves: list[Any]) -> tuple[Any, ...]:
+    """The structure of arguments rendered by `Arguments` / `Data`, collecting the values into `leaves`"""
+    return tuple((key, _shape_value(value, leaves)) for key, value in data.items())
+
+
+def _shape_value(value: Any, leaves: list[Any]) -> Any:
+    if isinstance(value, dict):
+        return (dict, _shape_mapping(value, leaves))
+
+    if isinstance(value, ITERABLES):
+        # mirrors `ListNode`, which renders anything but a dict item as a single value
+        return (
+            list,
+            tuple(
+                (dict, _shape_mapping(item, leaves)) if isinstance(item, dict) else _shape_leaf(item, leaves)
+                for item in value
+            ),
+        )
+
+    return _shape_leaf(value, leaves)
+
+
+def _shape_leaf(value: Any, leaves: list[Any]) -> Any:
+    # None is part of the shape as `Arguments` skips it
+    if value is None:
+        return None
+
+    leaves.append(value)
+    return ...
+
+
+def _slotted_mapping(data: Mapping[str, Any], slots: Iterator[int]) -> dict[str, Any]:
+    """Replace the values collected by `_shape_mapping()` with placeholders, in the same order"""
+    return {key: _slotted_value(value, slots) for key, value in data.items()}
+
+
+def _slotted_value(value: Any, slots: Iterator[int]) -> Any:
+    if isinstance(value, dict):
+        return _slotted_mapping(value, slots)
+
+    if isinstance(value, ITERABLES):
+        return [
+            _slotted_mapping(item, slots) if isinstance(item, dict) else _slotted_leaf(item, slots)
+            for item in value
+        ]
+
+    return _slotted_leaf(value, slots)
+
+
+def _slotted_leaf(value: Any, slots: Iterator[int]) -> Any:
+    if value is None:
+        return None
+    return _SLOT_MARKER.format(next(slots))
+
+
 def _prisma_model_for_field(
     field: FieldInfo,
     *,
@@ -869,6 +1025,9 @@ def serialize_decimal(obj: decimal.Decimal) -> str:
 
 
 def dumps(obj: Any, **kwargs: Any) -> str:
+    if not kwargs:
+        return get_codec().dumps(obj, default=serializer)
+
     kwargs.setdefault('default', serializer)
     kwargs.setdefault('ensure_ascii', False)
     return json.dumps(obj, **kwargs)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+from typing_extensions import override
+
+log: logging.Logger = logging.getLogger(__name__)
+
+__all__ = ('JSONCodec', 'StdlibCodec', 'OrjsonCodec', 'get_codec', 'set_codec')
+
+
+class JSONCodec(ABC):
+    """Encodes queries to and decodes responses from the query engine.
+
+    Implementations must produce the same JSON values as the stdlib `json` module
+    with `ensure_ascii=False`, calling `default` for every type that is not a
+    plain JSON type, e.g. `datetime` and `Decimal`.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any]) -> str: ...
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any: ...
+
+
+class StdlibCodec(JSONCodec):
+    """Codec backed by the stdlib `json` module"""
+
+    name = 'json'
+
+    @override
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any]) -> str:
+        return json.dumps(obj, default=default, ensure_ascii=False)
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by `orjson`
+
+    Datetimes and dataclasses are passed through to `default` so they are serialised
+    exactly like the stdlib codec would, e.g. datetimes are converted to UTC and
+    truncated to milliseconds. Anything orjson rejects that the stdlib accepts,
+    such as integers larger than 64 bits, falls back to the stdlib codec.
+
+    Output is compact (no spaces after separators) and NaN / infinity are encoded
+    as `null` instead of the non-standard tokens the stdlib emits.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibCodec()
+
+    @override
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any]) -> str:
+        try:
+            return self._orjson.dumps(obj, default=default, option=self._options).decode('utf-8')
+        except self._orjson.JSONEncodeError:
+            # re-raises the same error the stdlib codec would if the object is invalid
+            return self._fallback.dumps(obj, default=default)
+
+    @override
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return self._fallback.loads(data)
+
+
+def _create_codec(name: str) -> JSONCodec:
+    if name == 'json':
+        return StdlibCodec()
+
+    if name == 'orjson':
+        return OrjsonCodec()
+
+    if name == 'auto':
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibCodec()
+
+    raise ValueError(f'Unknown JSON codec: {name}; expected one of auto, orjson, json')
+
+
+_codec: JSONCodec = _create_codec(os.environ.get('PRISMA_PY_JSON_CODEC', 'auto'))
+log.debug('using %s JSON codec', _codec.name)
+
+
+def get_codec() -> JSONCodec:
+    """Returns the codec used for query engine payloads"""
+    return _codec
+
+
+def set_codec(codec: JSONCodec | str) -> JSONCodec:
+    """Set the codec used for query engine payloads, returns the previous codec
+
+    `codec` may be a `JSONCodec` instance or one of `auto`, `orjson`, `json`.
+    """
+    global _codec
+
+    previous = _codec
+    _codec = _create_codec(codec) if isinstance(codec, str) else codec
+    return previous
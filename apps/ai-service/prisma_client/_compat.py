@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import sys
 from typing import TYPE_CHECKING, Any, TypeVar, Callable, cast
+from functools import lru_cache
 from asyncio import get_running_loop as get_running_loop
 
 import pydantic
@@ -292,6 +293,19 @@ def model_parse(model: type[_ModelT], obj: Any) -> _ModelT:
         return model.parse_obj(obj)  # pyright: ignore[reportDeprecated]
 
 
+def model_parse_many(model: type[_ModelT], objs: list[Any]) -> list[_ModelT]:
+    """Parse a list of records, validating all of them in a single call on pydantic v2"""
+    if PYDANTIC_V2:
+        return _list_adapter(model).validate_python(objs)
+    else:
+        return [model.parse_obj(obj) for obj in objs]  # pyright: ignore[reportDeprecated]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[_ModelT]) -> pydantic.TypeAdapter[list[_ModelT]]:
+    return pydantic.TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
 def model_parse_json(model: type[_ModelT], obj: str) -> _ModelT:
     if PYDANTIC_V2:
         return model.model_validate_json(obj)
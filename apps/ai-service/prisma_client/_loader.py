@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Optional
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from ._base_client import AsyncBasePrisma
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# (model, unique field, serialized include)
+_GroupKey = Tuple[type, str, str]
+
+
+class FindUniqueLoader:
+    """Coalesces concurrent `find_unique()` calls into one `find_many()` per model.
+
+    Calls made in the same event loop iteration that look up a model by a single
+    scalar unique field, e.g. `where={'id': ...}`, are collected and resolved with a
+    single `find_many(where={'id': {'in': [...]}})` query. Each caller then receives
+    the same response shape `find_unique()` would have returned.
+
+    This should never be created manually, instead it is enabled with
+    `Prisma(batch_find_unique=True)`. Only lookups on that client are batched,
+    clients used for interactive transactions never are.
+    """
+
+    __slots__ = ('_client', '_pending', '_tasks', '_scheduled')
+
+    def __init__(self, client: AsyncBasePrisma) -> None:
+        self._client = client
+        self._pending: Dict[_GroupKey, Dict[Any, List[asyncio.Future[Any]]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._scheduled = False
+
+    def load(self, *, model: type[BaseModel] | None, arguments: dict[str, Any]) -> Optional[asyncio.Future[Any]]:
+        """Queue a `find_unique()` query, returns None if it cannot be batched"""
+        key = self._group_key(model, arguments)
+        if key is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        value = next(iter(arguments['where'].values()))
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.setdefault(key, {}).setdefault(value, []).append(future)
+
+        if not self._scheduled:
+            # runs after every callback that is already ready, i.e. the other
+            # tasks started in this iteration get to queue their lookups first
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    @staticmethod
+    def _group_key(model: type[BaseModel] | None, arguments: dict[str, Any]) -> Optional[_GroupKey]:
+        where = arguments.get('where')
+        if model is None or not isinstance(where, dict) or len(where) != 1:
+            return None
+
+        field, value = next(iter(where.items()))
+        # compound unique inputs are dicts and booleans cannot be unique lookups
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            return None
+
+        try:
+            include = json.dumps(arguments.get('include'), sort_keys=True)
+        except TypeError:
+            return None
+
+        return model, field, include
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+
+        for key, waiters in pending.items():
+            task = asyncio.ensure_future(self._load(key, waiters))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, key: _GroupKey, waiters: Dict[Any, List[asyncio.Future[Any]]]) -> None:
+        model, field, include = key
+        values = list(waiters)
+
+        try:
+            if len(values) == 1:
+                resp = await self._client._execute_unbatched(
+                    method='find_unique',
+                    model=model,
+                    arguments={'where': {field: values[0]}, 'include': json.loads(include)},
+                )
+                rows = {values[0]: resp['data']['result']}
+            else:
+                log.debug('batching %s find_unique() calls on %s.%s', len(values), model.__name__, field)
+                resp = await self._client._execute_unbatched(
+                    method='find_many',
+                    model=model,
+                    arguments={'where': {field: {'in': values}}, 'include': json.loads(include)},
+                )
+                rows = {row[field]: row for row in resp['data']['result']}
+        except BaseException as exc:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+
+        for value, futures in waiters.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result({'data': {'result': rows.get(value)}})
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Callable, overload
+from typing import TYPE_CHECKING, Any, Callable, overload
 from typing_extensions import Literal
 
 from ._types import BaseModelT
 from ._compat import model_parse
+from ._builder import dumps
+
+if TYPE_CHECKING:
+    import numpy
 
 # from https://github.com/prisma/prisma/blob/7da6f030350931eff8574e805acb9c0de9087e8e/packages/client/src/runtime/utils/deserializeRawResults.ts
 PrismaType = Literal[
@@ -94,6 +97,84 @@ def deserialize_raw_results(
     return [_deserialize_prisma_object(obj, result=result, for_model=False) for obj in result.rows]
 
 
+def deserialize_raw_columns(raw_result: dict[str, Any]) -> dict[str, Any]:
+    """Deserialize raw query results into a mapping of column name to column values.
+
+    Numeric columns (`int`, `bigint`, `float`, `double` and `decimal`) are decoded in bulk
+    into NumPy arrays. Integer columns are `int64` arrays unless they contain NULLs, in
+    which case they are `float64` arrays with NULLs as `nan` if every value is within
+    +/-2**53 and so exactly representable. Otherwise, and for integers that do not fit in
+    64 bits, they are `object` arrays of Python ints and `None`. Floating point and decimal
+    columns are always `float64` arrays with NULLs as `nan`.
+
+    Every other column is a list of values deserialized like `deserialize_raw_results()`
+    does, JSON values are returned as the database decoded them.
+
+    Requires `numpy` to be installed.
+    """
+    np = _import_numpy()
+    columns: list[str] = raw_result['columns']
+    types: list[PrismaType] = raw_result['types']
+    rows: list[list[object]] = raw_result['rows']
+
+    # NOTE: gathering each column separately is much cheaper than transposing with
+    # `zip(*rows)` which creates an iterator for every row
+    return {
+        key: _deserialize_column(np, key=key, prisma_type=prisma_type, values=[row[index] for row in rows])
+        for index, (key, prisma_type) in enumerate(zip(columns, types))
+    }
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError('`numpy` must be installed in order to deserialize raw results into columns.') from exc
+
+    return numpy
+
+
+def _deserialize_column(
+    np: Any,
+    *,
+    key: str,
+    prisma_type: PrismaType,
+    values: list[object],
+) -> numpy.ndarray[Any, Any] | list[object]:
+    if prisma_type in _INTEGER_TYPES:
+        try:
+            return np.array(values, dtype=np.int64)
+        except (TypeError, OverflowError):
+            # NULLs or integers beyond 64 bits, which one is raised depends on which comes first
+            pass
+
+        integers = [None if value is None else int(value) for value in values]
+        if None in integers and all(value is None or -_MAX_EXACT_FLOAT <= value <= _MAX_EXACT_FLOAT for value in integers):
+            # NULLs cannot be represented in an integer array
+            return np.array(integers, dtype=np.float64)
+
+        return np.array(integers, dtype=object)
+
+    if prisma_type in _FLOAT_TYPES:
+        # decimals are given as strings which numpy parses without creating
+        # intermediate Python floats, NULLs become `nan`
+        return np.array(values, dtype=np.float64)
+
+    if prisma_type.endswith('-array'):
+        result = RawQueryResult(columns=[key], types=[prisma_type], rows=[])
+        return [_deserialize_prisma_object([field], result=result, for_model=False)[key] for field in values]
+
+    # the remaining types, including JSON, are already decoded with the response
+    return values
+
+
+_INTEGER_TYPES: frozenset[PrismaType] = frozenset({'int', 'bigint'})
+_FLOAT_TYPES: frozenset[PrismaType] = frozenset({'float', 'double', 'decimal'})
+
+# largest magnitude up to which every integer is exactly representable as a float64
+_MAX_EXACT_FLOAT = 2**53
+
+
 # NOTE: this very weird `for_model` API is simply here as a workaround for
 # https://github.com/RobertCraigie/prisma-client-py/issues/638
 #
@@ -181,7 +262,7 @@ def _deserialize_json(value: object, for_model: bool) -> object:
         # Pydantic expects Json fields to be a `str`, we should implement
         # an actual workaround for this validation instead of wasting compute
         # on re-serializing the data.
-        return json.dumps(value)
+        return dumps(value)
 
     # This may or may not have already been deserialized by the database
     return value
@@ -3,6 +3,7 @@ from typing_extensions import override
 
 import httpx
 
+from ._codec import get_codec
 from ._types import Method
 from .http_abstract import AbstractHTTP, AbstractResponse
 
@@ -58,6 +59,8 @@ class Response(AbstractResponse[httpx.Response]):
 
     @override
     def json(self, **kwargs: Any) -> Any:
+        if not kwargs:
+            return get_codec().loads(self.original.read())
         return self.original.json(**kwargs)
 
     @override
@@ -39,11 +39,11 @@ from typing_extensions import TypedDict, Literal
 
 LiteralString = str
 # -- template actions.py.jinja --
-from typing import TypeVar
+from typing import TypeVar, AsyncIterator
 import warnings
 
 from . import types, errors, bases
-from ._compat import model_parse
+from ._compat import model_parse, model_parse_many
 from ._constants import CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED
 
 if TYPE_CHECKING:
@@ -478,7 +478,78 @@ class OrganizationActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.OrganizationWhereInput] = None,
+        include: Optional[types.OrganizationInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all Organization records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            Organization filter to select records
+        include
+            Specifies which relations should be loaded on the returned Organization model
+        batch_size
+            Maximum number of Organization records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.Organization]
+            Every Organization record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for organization in Organization.prisma().find_many_iter(batch_size=1000):
+            print(organization.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.OrganizationWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -1506,7 +1577,78 @@ class UserActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.UserWhereInput] = None,
+        include: Optional[types.UserInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all User records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            User filter to select records
+        include
+            Specifies which relations should be loaded on the returned User model
+        batch_size
+            Maximum number of User records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.User]
+            Every User record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for user in User.prisma().find_many_iter(batch_size=1000):
+            print(user.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.UserWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -2537,7 +2679,78 @@ class VendorActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.VendorWhereInput] = None,
+        include: Optional[types.VendorInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all Vendor records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            Vendor filter to select records
+        include
+            Specifies which relations should be loaded on the returned Vendor model
+        batch_size
+            Maximum number of Vendor records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.Vendor]
+            Every Vendor record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for vendor in Vendor.prisma().find_many_iter(batch_size=1000):
+            print(vendor.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.VendorWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -3573,7 +3786,78 @@ class ProcurementRequestActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.ProcurementRequestWhereInput] = None,
+        include: Optional[types.ProcurementRequestInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all ProcurementRequest records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            ProcurementRequest filter to select records
+        include
+            Specifies which relations should be loaded on the returned ProcurementRequest model
+        batch_size
+            Maximum number of ProcurementRequest records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.ProcurementRequest]
+            Every ProcurementRequest record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for procurementrequest in ProcurementRequest.prisma().find_many_iter(batch_size=1000):
+            print(procurementrequest.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.ProcurementRequestWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -4614,7 +4898,78 @@ class QuoteActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.QuoteWhereInput] = None,
+        include: Optional[types.QuoteInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all Quote records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            Quote filter to select records
+        include
+            Specifies which relations should be loaded on the returned Quote model
+        batch_size
+            Maximum number of Quote records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.Quote]
+            Every Quote record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for quote in Quote.prisma().find_many_iter(batch_size=1000):
+            print(quote.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.QuoteWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -5654,7 +6009,78 @@ class PaymentActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.PaymentWhereInput] = None,
+        include: Optional[types.PaymentInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all Payment records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            Payment filter to select records
+        include
+            Specifies which relations should be loaded on the returned Payment model
+        batch_size
+            Maximum number of Payment records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.Payment]
+            Every Payment record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for payment in Payment.prisma().find_many_iter(batch_size=1000):
+            print(payment.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.PaymentWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -6692,7 +7118,78 @@ class AuditLogActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.AuditLogWhereInput] = None,
+        include: Optional[types.AuditLogInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all AuditLog records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            AuditLog filter to select records
+        include
+            Specifies which relations should be loaded on the returned AuditLog model
+        batch_size
+            Maximum number of AuditLog records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.AuditLog]
+            Every AuditLog record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for auditlog in AuditLog.prisma().find_many_iter(batch_size=1000):
+            print(auditlog.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.AuditLogWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -7733,7 +8230,78 @@ class EmailThreadActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.EmailThreadWhereInput] = None,
+        include: Optional[types.EmailThreadInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all EmailThread records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            EmailThread filter to select records
+        include
+            Specifies which relations should be loaded on the returned EmailThread model
+        batch_size
+            Maximum number of EmailThread records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.EmailThread]
+            Every EmailThread record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for emailthread in EmailThread.prisma().find_many_iter(batch_size=1000):
+            print(emailthread.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.EmailThreadWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -8782,7 +9350,78 @@ class EmailMessageActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.EmailMessageWhereInput] = None,
+        include: Optional[types.EmailMessageInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all EmailMessage records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            EmailMessage filter to select records
+        include
+            Specifies which relations should be loaded on the returned EmailMessage model
+        batch_size
+            Maximum number of EmailMessage records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.EmailMessage]
+            Every EmailMessage record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for emailmessage in EmailMessage.prisma().find_many_iter(batch_size=1000):
+            print(emailmessage.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.EmailMessageWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
@@ -9832,7 +10471,78 @@ class WorkflowExecutionActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return model_parse_many(self._model, resp['data']['result'])
+
+    async def find_many_iter(
+        self,
+        where: Optional[types.WorkflowExecutionWhereInput] = None,
+        include: Optional[types.WorkflowExecutionInclude] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Iterate over all WorkflowExecution records matching the filter, fetching them in batches.
+
+        Records are fetched `batch_size` at a time in `id` order, each batch selecting
+        the records after the last `id` of the previous one, so records deleted in
+        between never end the iteration early. Records are parsed one at a time as they
+        are iterated over, so memory use is bounded by the batch size.
+
+        Parameters
+        ----------
+        where
+            WorkflowExecution filter to select records
+        include
+            Specifies which relations should be loaded on the returned WorkflowExecution model
+        batch_size
+            Maximum number of WorkflowExecution records fetched per query
+
+        Returns
+        -------
+        AsyncIterator[prisma.models.WorkflowExecution]
+            Every WorkflowExecution record that matches the filter
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for workflowexecution in WorkflowExecution.prisma().find_many_iter(batch_size=1000):
+            print(workflowexecution.id)
+        ```
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        last: Any = None
+        while True:
+            page_where = where
+            if last is not None:
+                after: types.WorkflowExecutionWhereInput = {'id': {'gt': last}}
+                page_where = {'AND': [where, after]} if where else after
+
+            resp = await self._client._execute(
+                method='find_many',
+                model=self._model,
+                arguments={
+                    'take': batch_size,
+                    'where': page_where,
+                    'order_by': {'id': 'asc'},
+                    'include': include,
+                },
+            )
+            rows = resp['data']['result']
+            del resp
+
+            last = rows[-1]['id'] if len(rows) == batch_size else None
+            for index, row in enumerate(rows):
+                # drop each raw record once its model has been created
+                rows[index] = None
+                yield model_parse(self._model, row)
+
+            if last is None:
+                return
 
     async def find_first(
         self,
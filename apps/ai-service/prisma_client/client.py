@@ -57,7 +57,7 @@ from ._builder import QueryBuilder, dumps
 from .generator.models import EngineType, OptionalValueFromEnvVar, BinaryPaths
 from ._compat import removeprefix, model_parse
 from ._constants import CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED, DEFAULT_CONNECT_TIMEOUT, DEFAULT_TX_MAX_WAIT, DEFAULT_TX_TIMEOUT
-from ._raw_query import deserialize_raw_results
+from ._raw_query import deserialize_raw_columns, deserialize_raw_results
 from ._metrics import Metrics
 from .metadata import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
 from ._transactions import AsyncTransactionManager, SyncTransactionManager
@@ -127,6 +127,7 @@ class Prisma(AsyncBasePrisma):
         datasource: DatasourceOverride | None = None,
         connect_timeout: int | timedelta = DEFAULT_CONNECT_TIMEOUT,
         http: HttpConfig | None = None,
+        batch_find_unique: bool = False,
     ) -> None:
         super().__init__(
             http=http,
@@ -134,6 +135,7 @@ class Prisma(AsyncBasePrisma):
             log_queries=log_queries,
             datasource=datasource,
             connect_timeout=connect_timeout,
+            batch_find_unique=batch_find_unique,
         )
         self._set_generated_properties(
             schema_path=SCHEMA_PATH,
@@ -261,6 +263,28 @@ class Prisma(AsyncBasePrisma):
 
         return deserialize_raw_results(result)
 
+    async def query_raw_columnar(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> dict[str, Any]:
+        """Execute a raw SQL query against the database and return the results by column.
+
+        Numeric columns are decoded in bulk into NumPy arrays and every other column is
+        returned as a list, see `deserialize_raw_columns()` for the details. This is much
+        cheaper than `query_raw()` for aggregate queries over many rows.
+
+        Requires `numpy` to be installed.
+        """
+        resp = await self._execute(
+            method='query_raw',
+            arguments={
+                'query': query,
+                'parameters': args,
+            },
+        )
+        return deserialize_raw_columns(resp['data']['result'])
+
     def batch_(self) -> Batch:
         """Returns a context manager for grouping write queries into a single transaction."""
         return Batch(client=self)
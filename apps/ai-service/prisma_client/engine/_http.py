@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, NoReturn
 from datetime import timedelta
@@ -10,6 +9,7 @@ import httpx
 
 from . import utils, errors
 from ..utils import is_dict
+from .._codec import get_codec
 from .._types import Method
 from ._abstract import SyncAbstractEngine, AsyncAbstractEngine
 from .._sync_http import SyncHTTP
@@ -77,7 +77,7 @@ class BaseHTTPEngine:
     ) -> Any:
         if isinstance(data, str):
             # workaround for https://github.com/prisma/prisma-engines/pull/4246
-            data = json.loads(data)
+            data = get_codec().loads(data)
 
         if not is_dict(data):
             raise TypeError(f'Expected deserialised engine response to be a dictionary, got {type(data)} - {data}')
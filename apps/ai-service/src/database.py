@@ -1,7 +1,10 @@
 """Database client management for the AI Service."""
 
 import asyncio
+from contextvars import ContextVar
+from datetime import timedelta
 from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import structlog
 import sys
@@ -19,13 +22,37 @@ except ImportError as e:
     logger.error(f"Failed to import Prisma from generated client: {e}")
     raise ImportError(f"Could not import Prisma client: {e}") from e
 
-from .config import get_settings
+from .config import Settings, get_settings
 
 logger = structlog.get_logger(__name__)
 
 # Global database client instance
 _db_client: Optional[Prisma] = None
 
+
+def pool_size(settings: Settings) -> int:
+    """
+    Connections the query engine may open.
+    
+    Every ``with_tenant`` block pins a connection for its whole transaction
+    (up to ``database_tx_timeout``), so the pool must cover every workflow
+    that can run at once plus concurrent API requests; otherwise blocks queue
+    for ``database_tx_max_wait`` and then fail.
+    """
+    if settings.database_connection_limit is not None:
+        return settings.database_connection_limit
+    
+    return sum(settings.workflow_concurrency_limits.values()) + settings.database_api_connections
+
+
+def _pooled_url(url: str, connection_limit: int) -> str:
+    """Database URL with the pool size, unless the URL already sets one."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.setdefault("connection_limit", str(connection_limit))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
 async def get_db_client() -> Prisma:
     """Get or create a database client instance."""
     global _db_client
@@ -35,11 +62,15 @@ async def get_db_client() -> Prisma:
         
         logger.info("🔌 Connecting to database", url=settings.database_url.split("@")[-1])
         
-        _db_client = Prisma()
+        connection_limit = pool_size(settings)
+        _db_client = Prisma(
+            datasource={"url": _pooled_url(settings.database_url, connection_limit)},
+            batch_find_unique=settings.database_batch_find_unique,
+        )
         
         await _db_client.connect()
         
-        logger.info("✅ Database connection established")
+        logger.info("✅ Database connection established", connection_limit=connection_limit)
     
     return _db_client
 
@@ -58,25 +89,73 @@ async def get_db() -> Prisma:
     return await get_db_client()
 
 
+class _TenantTransaction:
+    """An open tenant-scoped transaction, shared by nested tenant blocks."""
+    
+    def __init__(self, org_id: str, client: Prisma):
+        self.org_id = org_id
+        self.client = client
+        self.active = True
+
+
+# Tenant transaction of the current task, so nested blocks reuse it
+_current_tenant_tx: ContextVar[Optional[_TenantTransaction]] = ContextVar(
+    "current_tenant_tx", default=None
+)
+
+
 class TenantContext:
-    """Context manager for multi-tenant database operations."""
+    """
+    Context manager for multi-tenant database operations.
+    
+    The block runs in one interactive transaction whose tenant is set with
+    ``set_config(..., is_local => true)``, so Row-Level Security sees it only on
+    that transaction's connection and it is cleared on commit. Concurrent
+    requests of different tenants never share session state. A nested block
+    for the same tenant reuses the open transaction.
+    """
     
     def __init__(self, org_id: str):
         self.org_id = org_id
+        self._transaction = None
+        self._tenant_tx: Optional[_TenantTransaction] = None
+        self._token = None
     
-    async def __aenter__(self):
-        """Set tenant context for RLS."""
+    async def __aenter__(self) -> Prisma:
+        """Open a tenant-scoped transaction, or join the current one."""
+        current = _current_tenant_tx.get()
+        if current is not None and current.active and current.org_id == self.org_id:
+            return current.client
+        
+        settings = get_settings()
         db = await get_db_client()
-        # Set the tenant context for Row-Level Security
-        await db.execute_raw(f"SET app.current_tenant = '{self.org_id}'")
-        return db
+        self._transaction = db.tx(
+            max_wait=timedelta(seconds=settings.database_tx_max_wait),
+            timeout=timedelta(seconds=settings.database_tx_timeout),
+        )
+        tx = await self._transaction.__aenter__()
+        
+        try:
+            await tx.execute_raw("SELECT set_config('app.current_tenant', $1, true)", self.org_id)
+        except BaseException as e:
+            await self._transaction.__aexit__(type(e), e, e.__traceback__)
+            raise
+        
+        self._tenant_tx = _TenantTransaction(self.org_id, tx)
+        self._token = _current_tenant_tx.set(self._tenant_tx)
+        return tx
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Reset tenant context."""
-        db = await get_db_client()
-        await db.execute_raw("RESET app.current_tenant")
+        """Commit, or roll back if the block raised."""
+        if self._transaction is None:
+            return
+        
+        # Tasks spawned inside the block inherit the contextvar; don't let them reuse a closed transaction
+        self._tenant_tx.active = False
+        _current_tenant_tx.reset(self._token)
+        await self._transaction.__aexit__(exc_type, exc_val, exc_tb)
 
 
 def with_tenant(org_id: str) -> TenantContext:
     """Create a tenant context for database operations."""
-    return TenantContext(org_id)
\ No newline at end of file
+    return TenantContext(org_id)
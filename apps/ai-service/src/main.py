@@ -20,7 +20,10 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from .config import get_settings
 from .database import get_db_client, close_db_client
-from .workflows import WorkflowManager
+from .valkey import close_valkey_client
+from .metrics import start_metrics_server
+from .services.vendor_cache import get_vendor_cache
+from .workflows import get_workflow_manager, get_timer_service, get_progress_hub
 from .routers import procurement, quotes, workflows, health
 
 # Configure structured logging
@@ -55,16 +58,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database connection
     await get_db_client()
     
-    # Initialize workflow manager
-    workflow_manager = WorkflowManager()
+    # Initialize the process-wide workflow manager and compile all graphs once
+    workflow_manager = get_workflow_manager()
+    await workflow_manager.warmup()
+    await workflow_manager.start_cancellation_listener()
     app.state.workflow_manager = workflow_manager
     
+    # Fire workflow deadlines (e.g. quote timeouts) registered in Valkey
+    timer_service = get_timer_service()
+    timer_service.start()
+    
+    start_metrics_server()
+    
     logger.info("✅ AI Service startup complete")
     
     yield
     
     # Cleanup
     logger.info("🛑 Shutting down AI Service")
+    await timer_service.stop()
+    await get_progress_hub().stop()
+    await get_vendor_cache().stop()
+    await workflow_manager.shutdown()
+    await close_valkey_client()
     await close_db_client()
     logger.info("✅ AI Service shutdown complete")
 
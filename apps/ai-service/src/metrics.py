@@ -0,0 +1,128 @@
+"""Prometheus metrics for the AI Service.
+
+Prefork Celery workers run with ``PROMETHEUS_MULTIPROC_DIR`` set, so every
+worker process writes its samples to that directory and the exporter serves
+them summed across processes.
+"""
+
+import os
+import shutil
+
+import structlog
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, multiprocess, start_http_server
+
+from .config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+
+# Workflow executor
+WORKFLOW_QUEUE_DEPTH = Gauge(
+    "workflow_queue_depth",
+    "Workflow executions waiting for a concurrency slot",
+    ["workflow_type"],
+    multiprocess_mode="livesum",
+)
+WORKFLOW_RUNNING = Gauge(
+    "workflow_running",
+    "Workflow executions currently running",
+    ["workflow_type"],
+    multiprocess_mode="livesum",
+)
+WORKFLOW_QUEUE_WAIT_SECONDS = Histogram(
+    "workflow_queue_wait_seconds",
+    "Time a workflow execution waited for a concurrency slot",
+    ["workflow_type"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+WORKFLOW_REJECTED_TOTAL = Counter(
+    "workflow_rejected_total",
+    "Workflow executions rejected by admission control",
+    ["workflow_type", "reason"],
+)
+
+# Workflow state persistence
+WORKFLOW_STATE_BYTES_WRITTEN = Histogram(
+    "workflow_state_bytes_written",
+    "Bytes of workflow state written to the database per execution run",
+    ["workflow_type"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
+# Workflow nodes
+WORKFLOW_NODE_DURATION_SECONDS = Histogram(
+    "workflow_node_duration_seconds",
+    "Duration of a workflow node run",
+    ["workflow_type", "node", "outcome"],
+    buckets=(0.005, 0.025, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+WORKFLOW_NODE_ERRORS_TOTAL = Counter(
+    "workflow_node_errors_total",
+    "Workflow node runs that raised or handled an error",
+    ["workflow_type", "node"],
+)
+WORKFLOW_NODE_RETRIES_TOTAL = Counter(
+    "workflow_node_retries_total",
+    "Retries recorded by workflow nodes after handled errors",
+    ["workflow_type", "node"],
+)
+WORKFLOW_NODE_STATE_BYTES = Histogram(
+    "workflow_node_state_bytes",
+    "Size of the workflow data returned by a node",
+    ["workflow_type", "node"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
+# Vendor directory cache
+VENDOR_CACHE_LOOKUPS_TOTAL = Counter(
+    "vendor_cache_lookups_total",
+    "Vendor directory lookups by the tier that served them (memory, valkey or database)",
+    ["source"],
+)
+
+# Email ingestion
+EMAIL_INGEST_ROWS_TOTAL = Counter(
+    "email_ingest_rows_total",
+    "Email thread and message rows written by email ingestion",
+)
+
+
+def _multiprocess_dir() -> str:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR", "")
+
+
+def start_metrics_server() -> None:
+    """Expose metrics on the configured port for Prometheus to scrape."""
+    settings = get_settings()
+
+    if not settings.metrics_port:
+        return
+
+    registry = REGISTRY
+    if _multiprocess_dir():
+        # Serve the samples of every process in this container, not just this one
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    try:
+        start_http_server(settings.metrics_port, registry=registry)
+        logger.info("📈 Metrics server started", port=settings.metrics_port, multiprocess=bool(_multiprocess_dir()))
+    except OSError as e:
+        # Another worker process in this container already serves the port
+        logger.warning("Metrics server not started", port=settings.metrics_port, error=str(e))
+
+
+def reset_multiprocess_metrics() -> None:
+    """Remove samples left by a previous run, before worker processes are forked."""
+    directory = _multiprocess_dir()
+    if not directory:
+        return
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def mark_metrics_process_dead() -> None:
+    """Drop this exiting process from live gauges such as ``workflow_running``."""
+    if _multiprocess_dir():
+        multiprocess.mark_process_dead(os.getpid())
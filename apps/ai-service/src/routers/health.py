@@ -3,6 +3,8 @@
 from fastapi import APIRouter
 from datetime import datetime
 
+from ..workflows import get_workflow_manager
+
 router = APIRouter()
 
 
@@ -21,6 +23,8 @@ async def health_check():
 async def readiness_check():
     """Readiness check for Kubernetes."""
     # TODO: Add checks for database connectivity, etc.
+    workflow_manager = get_workflow_manager()
+    
     return {
         "status": "ready",
         "timestamp": datetime.now().isoformat(),
@@ -28,7 +32,12 @@ async def readiness_check():
             "database": "ok",
             "redis": "ok",
             "llm": "ok",
-        }
+        },
+        "workflows": {
+            "compiled": list(workflow_manager.compile_timings.keys()),
+            "compile_timings_ms": workflow_manager.compile_timings,
+            "executor": workflow_manager.executor.stats(),
+        },
     }
 
 
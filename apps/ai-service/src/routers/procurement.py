@@ -1,10 +1,20 @@
 """Procurement workflow endpoints."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ..workflows import WorkflowManager
+from ..workflows import (
+    WorkflowManager,
+    get_workflow_manager,
+    emit_workflow_event,
+    stream_progress,
+    WorkflowQueueFull,
+    WorkflowStartTimeout,
+    ExecutorShuttingDown,
+)
+from ..config import get_settings
 from ..database import with_tenant
 
 router = APIRouter()
@@ -27,15 +37,11 @@ def get_tenant_id(x_tenant_id: str = Header(...)) -> str:
     return x_tenant_id
 
 
-def get_workflow_manager() -> WorkflowManager:
-    """Get workflow manager instance."""
-    return WorkflowManager()
-
-
 @router.post("/start", response_model=ProcurementResponse)
 async def start_procurement_workflow(
     request: StartProcurementRequest,
     org_id: str = Depends(get_tenant_id),
+    idempotency_key: Optional[str] = Header(None),
     workflow_manager: WorkflowManager = Depends(get_workflow_manager),
 ):
     """Start a procurement workflow for a request."""
@@ -69,6 +75,7 @@ async def start_procurement_workflow(
             entity_id=request.request_id,
             entity_type="ProcurementRequest",
             initial_state=initial_state,
+            idempotency_key=idempotency_key,
         )
         
         return ProcurementResponse(
@@ -80,6 +87,12 @@ async def start_procurement_workflow(
         
     except HTTPException:
         raise
+    except WorkflowQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except WorkflowStartTimeout as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ExecutorShuttingDown as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -125,6 +138,15 @@ async def approve_quote(
                 data={"status": "APPROVED"}
             )
         
+        # Wake up the procurement workflow waiting for this approval
+        await emit_workflow_event(
+            org_id,
+            "ProcurementRequest",
+            request_id,
+            "quote_approved",
+            {"quote_id": quote_id},
+        )
+        
         return {
             "request_id": request_id,
             "quote_id": quote_id,
@@ -203,4 +225,48 @@ async def get_procurement_status(
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{request_id}/events")
+async def stream_procurement_events(
+    request_id: str,
+    org_id: str = Depends(get_tenant_id),
+):
+    """Stream workflow progress of a procurement request as server-sent events."""
+    async with with_tenant(org_id) as db:
+        request = await db.procurementrequest.find_unique(where={"id": request_id})
+    
+    if not request or request.orgId != org_id:
+        raise HTTPException(status_code=404, detail="Procurement request not found")
+    
+    async def snapshot() -> Optional[Dict[str, Any]]:
+        async with with_tenant(org_id) as db:
+            execution = await db.workflowexecution.find_first(
+                where={"entityId": request_id, "entityType": "ProcurementRequest"},
+                order={"startedAt": "desc"},
+            )
+        
+        if not execution:
+            return None
+        
+        return {
+            "execution_id": execution.id,
+            "workflow_type": execution.workflowType,
+            "entity_type": execution.entityType,
+            "entity_id": execution.entityId,
+            "status": execution.status,
+            "current_step": execution.currentState,
+            "error_message": execution.errorMessage,
+        }
+    
+    return StreamingResponse(
+        stream_progress(
+            org_id,
+            lambda event: event["entity_id"] == request_id,
+            snapshot=snapshot,
+            keepalive=get_settings().workflow_progress_keepalive,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,10 +1,18 @@
 """Quote processing endpoints."""
 
+import hashlib
 from typing import Dict, Any, List, Optional
+from uuid import uuid4
 from fastapi import APIRouter, HTTPException, Depends, Header, UploadFile, File
 from pydantic import BaseModel
 
-from ..workflows import WorkflowManager
+from ..workflows import (
+    WorkflowManager,
+    get_workflow_manager,
+    WorkflowQueueFull,
+    WorkflowStartTimeout,
+    ExecutorShuttingDown,
+)
 from ..services import DoclingService, LLMService
 from ..database import with_tenant
 
@@ -27,11 +35,6 @@ def get_tenant_id(x_tenant_id: str = Header(...)) -> str:
     return x_tenant_id
 
 
-def get_workflow_manager() -> WorkflowManager:
-    """Get workflow manager instance."""
-    return WorkflowManager()
-
-
 @router.post("/process-email", response_model=QuoteResponse)
 async def process_quote_email(
     request: ProcessQuoteRequest,
@@ -58,7 +61,8 @@ async def process_quote_email(
         execution_id = await workflow_manager.start_workflow(
             workflow_type="quote_processing",
             org_id=org_id,
-            entity_id=request.email_data.get("id", "unknown"),
+            # Starts are deduplicated per entity, so emails without an ID must not share one
+            entity_id=request.email_data.get("id") or f"email_{uuid4().hex}",
             entity_type="email",
             initial_state=initial_state,
         )
@@ -71,6 +75,12 @@ async def process_quote_email(
         
     except HTTPException:
         raise
+    except WorkflowQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except WorkflowStartTimeout as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ExecutorShuttingDown as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -96,9 +106,13 @@ async def process_quote_document(
         # Read file content
         file_content = await file.read()
         
+        # Starts are deduplicated per entity: a retried upload of the same file for this
+        # request maps to the same ID, any other upload (even with the same name) does not
+        content_hash = hashlib.sha256(file_content).hexdigest()[:16]
+        
         # Create mock email data for document processing
         email_data = {
-            "id": f"doc_{file.filename}",
+            "id": f"doc_{request_id}_{content_hash}",
             "subject": f"Quote Document: {file.filename}",
             "from": "document_upload",
             "body": "",
@@ -133,6 +147,12 @@ async def process_quote_document(
         
     except HTTPException:
         raise
+    except WorkflowQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except WorkflowStartTimeout as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ExecutorShuttingDown as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -269,13 +289,15 @@ async def validate_quote(
             # Update quote with validation results
             validation = normalized_data.get("validation", {})
             
-            await db.quote.update(
-                where={"id": quote_id},
-                data={
-                    "confidence": validation.get("confidence_score", quote.confidence),
-                    "status": "REVIEWED" if validation.get("is_valid") else "PENDING",
-                }
-            )
+            # The LLM call runs outside any transaction so it cannot outlive the tenant block's timeout
+            async with with_tenant(org_id) as db:
+                await db.quote.update(
+                    where={"id": quote_id},
+                    data={
+                        "confidence": validation.get("confidence_score", quote.confidence),
+                        "status": "REVIEWED" if validation.get("is_valid") else "PENDING",
+                    }
+                )
             
             return {
                 "quote_id": quote_id,
@@ -1,10 +1,18 @@
 """Workflow management endpoints."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ..workflows import WorkflowManager
+from ..workflows import (
+    WorkflowManager,
+    get_workflow_manager,
+    stream_progress,
+    WorkflowQueueFull,
+    WorkflowStartTimeout,
+    ExecutorShuttingDown,
+)
 from ..config import get_settings
 
 router = APIRouter()
@@ -24,21 +32,26 @@ class WorkflowResponse(BaseModel):
     message: str
 
 
+class StartWorkflowBatchRequest(BaseModel):
+    workflows: List[StartWorkflowRequest]
+
+
+class WorkflowBatchResponse(BaseModel):
+    execution_ids: List[str]
+    status: str
+    message: str
+
+
 def get_tenant_id(x_tenant_id: str = Header(...)) -> str:
     """Extract tenant ID from header."""
     return x_tenant_id
 
 
-def get_workflow_manager() -> WorkflowManager:
-    """Get workflow manager instance."""
-    # This would typically be injected from the app state
-    return WorkflowManager()
-
-
 @router.post("/start", response_model=WorkflowResponse)
 async def start_workflow(
     request: StartWorkflowRequest,
     org_id: str = Depends(get_tenant_id),
+    idempotency_key: Optional[str] = Header(None),
     workflow_manager: WorkflowManager = Depends(get_workflow_manager),
 ):
     """Start a new workflow execution."""
@@ -50,6 +63,7 @@ async def start_workflow(
             entity_type=request.entity_type,
             initial_state=request.initial_state,
             thread_id=request.thread_id,
+            idempotency_key=idempotency_key,
         )
         
         return WorkflowResponse(
@@ -58,6 +72,45 @@ async def start_workflow(
             message=f"Workflow {request.workflow_type} started successfully"
         )
         
+    except WorkflowQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except WorkflowStartTimeout as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ExecutorShuttingDown as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/start/batch", response_model=WorkflowBatchResponse)
+async def start_workflow_batch(
+    request: StartWorkflowBatchRequest,
+    org_id: str = Depends(get_tenant_id),
+    idempotency_key: Optional[str] = Header(None),
+    workflow_manager: WorkflowManager = Depends(get_workflow_manager),
+):
+    """Start many workflow executions with one request (e.g. backfills)."""
+    try:
+        execution_ids = await workflow_manager.start_many(
+            org_id=org_id,
+            requests=[workflow.model_dump() for workflow in request.workflows],
+            idempotency_key=idempotency_key,
+        )
+        
+        return WorkflowBatchResponse(
+            execution_ids=execution_ids,
+            status="started",
+            message=f"{len(execution_ids)} workflows started successfully"
+        )
+        
+    except WorkflowQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except WorkflowStartTimeout as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ExecutorShuttingDown as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -79,6 +132,43 @@ async def get_workflow_status(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{execution_id}/events")
+async def stream_workflow_events(
+    execution_id: str,
+    org_id: str = Depends(get_tenant_id),
+    workflow_manager: WorkflowManager = Depends(get_workflow_manager),
+):
+    """Stream progress of a workflow execution as server-sent events."""
+    try:
+        await workflow_manager.get_workflow_status(execution_id, org_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    async def snapshot() -> Dict[str, Any]:
+        execution = await workflow_manager.get_workflow_status(execution_id, org_id)
+        return {
+            "execution_id": execution_id,
+            "workflow_type": execution["workflow_type"],
+            "entity_type": execution["entity_type"],
+            "entity_id": execution["entity_id"],
+            "status": execution["status"],
+            "current_step": execution["current_state"],
+            "error_message": execution["error_message"],
+        }
+    
+    return StreamingResponse(
+        stream_progress(
+            org_id,
+            lambda event: event["execution_id"] == execution_id,
+            snapshot=snapshot,
+            until_terminal=True,
+            keepalive=get_settings().workflow_progress_keepalive,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{execution_id}/resume", response_model=WorkflowResponse)
 async def resume_workflow(
     execution_id: str,
@@ -95,6 +185,10 @@ async def resume_workflow(
             message="Workflow resumed successfully"
         )
         
+    except WorkflowQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except ExecutorShuttingDown as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
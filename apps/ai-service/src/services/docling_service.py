@@ -1,6 +1,8 @@
 """Docling service for document processing and quote extraction."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Union
+import asyncio
 import tempfile
 import os
 
@@ -9,8 +11,33 @@ from docling.document_converter import DocumentConverter
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 
+from ..config import get_settings
+
 logger = structlog.get_logger(__name__)
 
+# Conversions shared by every DoclingService in the process. A conversion
+# keeps its worker until Docling returns, even if the workflow awaiting it
+# was cancelled, so abandoned documents cannot pile up past the limit.
+_conversion_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_conversion_pool() -> ThreadPoolExecutor:
+    """Get the process-wide pool documents are converted in."""
+    global _conversion_pool
+
+    if _conversion_pool is None:
+        _conversion_pool = ThreadPoolExecutor(
+            max_workers=get_settings().docling_max_conversions,
+            thread_name_prefix="docling",
+        )
+
+    return _conversion_pool
+
+
+def _remove_file(path: str) -> None:
+    if os.path.exists(path):
+        os.unlink(path)
+
 
 class DoclingService:
     """Service for processing documents using Docling."""
@@ -20,6 +47,8 @@ class DoclingService:
         pipeline_options = PdfPipelineOptions()
         pipeline_options.do_ocr = True
         pipeline_options.do_table_structure = True
+        # Stop runaway conversions instead of holding a worker slot indefinitely
+        pipeline_options.document_timeout = get_settings().docling_document_timeout
         
         self.converter = DocumentConverter(
             format_options={
@@ -42,36 +71,38 @@ class DoclingService:
                 temp_file.write(document_content)
                 temp_file_path = temp_file.name
             
+            # Convert off the event loop so cancelling the workflow returns
+            # immediately; the file is removed once Docling is done with it
             try:
-                # Convert document using Docling
-                result = self.converter.convert(temp_file_path)
-                
-                # Extract structured data
-                document_data = {
-                    "filename": filename,
-                    "content_type": content_type,
-                    "text": result.document.export_to_text(),
-                    "markdown": result.document.export_to_markdown(),
-                    "tables": self._extract_tables(result.document),
-                    "metadata": {
-                        "page_count": len(result.document.pages) if hasattr(result.document, 'pages') else 1,
-                        "processing_status": "success",
-                    }
+                conversion = get_conversion_pool().submit(self.converter.convert, temp_file_path)
+            except Exception:
+                # e.g. the pool was shut down, so no callback will clean up
+                _remove_file(temp_file_path)
+                raise
+            conversion.add_done_callback(lambda _: _remove_file(temp_file_path))
+            result = await asyncio.wrap_future(conversion)
+            
+            # Extract structured data
+            document_data = {
+                "filename": filename,
+                "content_type": content_type,
+                "text": result.document.export_to_text(),
+                "markdown": result.document.export_to_markdown(),
+                "tables": self._extract_tables(result.document),
+                "metadata": {
+                    "page_count": len(result.document.pages) if hasattr(result.document, 'pages') else 1,
+                    "processing_status": "success",
                 }
-                
-                logger.info(
-                    "Document processed successfully",
-                    filename=filename,
-                    page_count=document_data["metadata"]["page_count"],
-                    text_length=len(document_data["text"]),
-                )
-                
-                return document_data
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            }
+            
+            logger.info(
+                "Document processed successfully",
+                filename=filename,
+                page_count=document_data["metadata"]["page_count"],
+                text_length=len(document_data["text"]),
+            )
+            
+            return document_data
                     
         except Exception as e:
             logger.error("Failed to process document", filename=filename, error=str(e))
@@ -1,11 +1,14 @@
 """Gmail API service for email integration."""
 
+import asyncio
 import base64
 import email
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import httplib2
 import structlog
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
@@ -144,10 +147,15 @@ class GmailService:
                 attachments=attachments,
             )
             
-            result = self.service.users().messages().send(
+            request = self.service.users().messages().send(
                 userId="me",
                 body=message
-            ).execute()
+            )
+            # Send off the event loop so concurrent sends overlap; httplib2
+            # connections are not thread-safe, so each send gets its own
+            result = await asyncio.to_thread(
+                request.execute, http=AuthorizedHttp(self._credentials, http=httplib2.Http())
+            )
             
             logger.info("Email sent successfully", message_id=result["id"], to=to)
             return result["id"]
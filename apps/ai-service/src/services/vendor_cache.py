@@ -0,0 +1,240 @@
+"""Tenant-scoped read-through cache of vendor directories."""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import parseaddr
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from ..config import get_settings
+from ..database import with_tenant
+from ..metrics import VENDOR_CACHE_LOOKUPS_TOTAL
+from ..valkey import get_valkey_client
+
+logger = structlog.get_logger(__name__)
+
+# Valkey channel announcing orgs whose vendors changed
+INVALIDATE_CHANNEL = "vendors:invalidate"
+
+
+def normalize_email(address: str) -> str:
+    """Bare, lower-cased address ("Acme <Sales@Acme.com>" -> "sales@acme.com")."""
+    return parseaddr(address or "")[1].strip().lower()
+
+
+# Vendor fields stored as ISO strings in the shared Valkey copy
+TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+
+def vendor_to_dict(vendor: Any) -> Dict[str, Any]:
+    """Vendor representation shared by the cache and VendorService."""
+    return {
+        "id": vendor.id,
+        "name": vendor.name,
+        "email": vendor.email,
+        "phone": vendor.phone,
+        "website": vendor.website,
+        "address": vendor.address,
+        "metadata": vendor.metadata,
+        "is_active": vendor.isActive,
+        "created_at": vendor.createdAt,
+        "updated_at": vendor.updatedAt,
+    }
+
+
+def _dump_vendors(vendors: List[Dict[str, Any]]) -> str:
+    return json.dumps(vendors, default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value))
+
+
+def _load_vendors(payload: bytes) -> List[Dict[str, Any]]:
+    vendors = json.loads(payload)
+    for vendor in vendors:
+        for field in TIMESTAMP_FIELDS:
+            if isinstance(vendor.get(field), str):
+                vendor[field] = datetime.fromisoformat(vendor[field])
+    return vendors
+
+
+class VendorDirectory:
+    """All vendors of one org with an index by normalized email."""
+
+    def __init__(self, vendors: List[Dict[str, Any]]):
+        self.vendors = vendors
+        self.by_email: Dict[str, Dict[str, Any]] = {}
+        for vendor in vendors:
+            # Active vendors win over deactivated ones with the same address
+            key = normalize_email(vendor["email"])
+            if key not in self.by_email or vendor["is_active"]:
+                self.by_email[key] = vendor
+
+
+class VendorCache:
+    """
+    Per-org vendor directories in a process-local LRU, backed by Valkey.
+
+    Lookups are served from memory; a miss loads the directory from Valkey,
+    or from the database (writing it back to Valkey) if no replica has it.
+    Writes call :meth:`invalidate`, which bumps the org's generation, drops
+    the Valkey copy and tells every replica to evict its local copy. A
+    directory loaded from the database is only shared or kept locally if the
+    generation did not move while it was being read, so a load racing a
+    write cannot re-publish the old vendors. The local TTL bounds staleness
+    if an invalidation message is lost.
+    """
+
+    def __init__(self, client: Redis, max_orgs: int = 256, ttl: float = 300.0):
+        self.client = client
+        self.max_orgs = max_orgs
+        self.ttl = ttl
+
+        self._directories: "OrderedDict[str, Tuple[float, VendorDirectory]]" = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(org_id: str) -> str:
+        return f"vendors:{org_id}"
+
+    @staticmethod
+    def _generation_key(org_id: str) -> str:
+        return f"vendors:{org_id}:generation"
+
+    async def directory(self, org_id: str) -> VendorDirectory:
+        """The org's vendor directory, loading it on a miss."""
+        self._ensure_listener()
+
+        cached = self._directories.get(org_id)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            self._directories.move_to_end(org_id)
+            VENDOR_CACHE_LOOKUPS_TOTAL.labels("memory").inc()
+            return cached[1]
+
+        vendors = await self._load_shared(org_id)
+        if vendors is not None:
+            VENDOR_CACHE_LOOKUPS_TOTAL.labels("valkey").inc()
+        else:
+            VENDOR_CACHE_LOOKUPS_TOTAL.labels("database").inc()
+            generation = await self._generation(org_id)
+            vendors = await self._load_database(org_id)
+            if not await self._store_shared(org_id, vendors, generation):
+                # Invalidated mid-load: serve what was read, but don't keep it
+                return VendorDirectory(vendors)
+
+        directory = VendorDirectory(vendors)
+        self._directories[org_id] = (time.monotonic(), directory)
+        self._directories.move_to_end(org_id)
+        while len(self._directories) > self.max_orgs:
+            self._directories.popitem(last=False)
+
+        return directory
+
+    async def get_vendors(self, org_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
+        """Vendors of an org, optionally only active ones."""
+        directory = await self.directory(org_id)
+        return [vendor for vendor in directory.vendors if vendor["is_active"] or not active_only]
+
+    async def find_by_email(self, org_id: str, email: str) -> Optional[Dict[str, Any]]:
+        """Vendor with this (normalized) email address, if any."""
+        key = normalize_email(email)
+        if not key:
+            return None
+        return (await self.directory(org_id)).by_email.get(key)
+
+    async def invalidate(self, org_id: str) -> None:
+        """Forget the org's directory here, in Valkey and on every other replica."""
+        self._directories.pop(org_id, None)
+
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.incr(self._generation_key(org_id))
+                pipe.delete(self._key(org_id))
+                await pipe.execute()
+            await self.client.publish(INVALIDATE_CHANNEL, org_id)
+        except Exception as e:
+            logger.warning("⚠️ Failed to invalidate shared vendor cache", org_id=org_id, error=str(e))
+
+    async def _load_shared(self, org_id: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            payload = await self.client.get(self._key(org_id))
+        except Exception as e:
+            logger.warning("⚠️ Shared vendor cache unavailable", org_id=org_id, error=str(e))
+            return None
+        return _load_vendors(payload) if payload else None
+
+    async def _generation(self, org_id: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(self._generation_key(org_id))
+        except Exception as e:
+            logger.warning("⚠️ Shared vendor cache unavailable", org_id=org_id, error=str(e))
+            return None
+
+    async def _store_shared(self, org_id: str, vendors: List[Dict[str, Any]], generation: Optional[bytes]) -> bool:
+        """Share a directory read at `generation`; False if it was invalidated since."""
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                await pipe.watch(self._generation_key(org_id))
+                if await pipe.get(self._generation_key(org_id)) != generation:
+                    return False
+                pipe.multi()
+                pipe.set(self._key(org_id), _dump_vendors(vendors), ex=int(self.ttl))
+                await pipe.execute()
+        except WatchError:
+            return False
+        except Exception as e:
+            logger.warning("⚠️ Failed to share vendor directory", org_id=org_id, error=str(e))
+        return True
+
+    @staticmethod
+    async def _load_database(org_id: str) -> List[Dict[str, Any]]:
+        async with with_tenant(org_id) as db:
+            vendors = await db.vendor.find_many(where={"orgId": org_id})
+        return [vendor_to_dict(vendor) for vendor in vendors]
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(), name="vendor-cache-invalidations")
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATE_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._directories.pop(message["data"].decode(), None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("❌ Vendor cache invalidation listener failed", error=str(e))
+                await asyncio.sleep(1)
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+
+# Process-wide vendor cache
+_vendor_cache: Optional[VendorCache] = None
+
+
+def get_vendor_cache() -> VendorCache:
+    """Get the process-wide vendor cache."""
+    global _vendor_cache
+
+    if _vendor_cache is None:
+        settings = get_settings()
+        _vendor_cache = VendorCache(
+            get_valkey_client(),
+            max_orgs=settings.vendor_cache_max_orgs,
+            ttl=settings.vendor_cache_ttl,
+        )
+
+    return _vendor_cache
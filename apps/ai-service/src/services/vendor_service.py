@@ -5,6 +5,7 @@ from typing import Dict, Any, List, Optional
 import structlog
 
 from ..database import with_tenant
+from .vendor_cache import get_vendor_cache, vendor_to_dict
 
 logger = structlog.get_logger(__name__)
 
@@ -14,28 +15,7 @@ class VendorService:
     
     async def get_vendors_for_org(self, org_id: str, active_only: bool = True) -> List[Dict[str, Any]]:
         """Get all vendors for an organization."""
-        async with with_tenant(org_id) as db:
-            where_clause = {"orgId": org_id}
-            if active_only:
-                where_clause["isActive"] = True
-            
-            vendors = await db.vendor.find_many(where=where_clause)
-            
-            return [
-                {
-                    "id": vendor.id,
-                    "name": vendor.name,
-                    "email": vendor.email,
-                    "phone": vendor.phone,
-                    "website": vendor.website,
-                    "address": vendor.address,
-                    "metadata": vendor.metadata,
-                    "is_active": vendor.isActive,
-                    "created_at": vendor.createdAt,
-                    "updated_at": vendor.updatedAt,
-                }
-                for vendor in vendors
-            ]
+        return await get_vendor_cache().get_vendors(org_id, active_only=active_only)
     
     async def create_vendor(self, org_id: str, vendor_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new vendor."""
@@ -52,21 +32,11 @@ class VendorService:
                     "isActive": vendor_data.get("is_active", True),
                 }
             )
-            
-            logger.info("Vendor created", vendor_id=vendor.id, name=vendor.name)
-            
-            return {
-                "id": vendor.id,
-                "name": vendor.name,
-                "email": vendor.email,
-                "phone": vendor.phone,
-                "website": vendor.website,
-                "address": vendor.address,
-                "metadata": vendor.metadata,
-                "is_active": vendor.isActive,
-                "created_at": vendor.createdAt,
-                "updated_at": vendor.updatedAt,
-            }
+        
+        await get_vendor_cache().invalidate(org_id)
+        logger.info("Vendor created", vendor_id=vendor.id, name=vendor.name)
+        
+        return vendor_to_dict(vendor)
     
     async def update_vendor(
         self,
@@ -83,24 +53,14 @@ class VendorService:
                     if key in ["name", "email", "phone", "website", "address", "metadata", "isActive"]
                 }
             )
+        
+        if vendor:
+            await get_vendor_cache().invalidate(org_id)
+            logger.info("Vendor updated", vendor_id=vendor.id, name=vendor.name)
             
-            if vendor:
-                logger.info("Vendor updated", vendor_id=vendor.id, name=vendor.name)
-                
-                return {
-                    "id": vendor.id,
-                    "name": vendor.name,
-                    "email": vendor.email,
-                    "phone": vendor.phone,
-                    "website": vendor.website,
-                    "address": vendor.address,
-                    "metadata": vendor.metadata,
-                    "is_active": vendor.isActive,
-                    "created_at": vendor.createdAt,
-                    "updated_at": vendor.updatedAt,
-                }
-            
-            return None
+            return vendor_to_dict(vendor)
+        
+        return None
     
     async def delete_vendor(self, org_id: str, vendor_id: str) -> bool:
         """Delete a vendor (soft delete by setting inactive)."""
@@ -109,32 +69,14 @@ class VendorService:
                 where={"id": vendor_id, "orgId": org_id},
                 data={"isActive": False}
             )
-            
-            if vendor:
-                logger.info("Vendor deactivated", vendor_id=vendor.id, name=vendor.name)
-                return True
-            
-            return False
+        
+        if vendor:
+            await get_vendor_cache().invalidate(org_id)
+            logger.info("Vendor deactivated", vendor_id=vendor.id, name=vendor.name)
+            return True
+        
+        return False
     
     async def find_vendor_by_email(self, org_id: str, email: str) -> Optional[Dict[str, Any]]:
-        """Find a vendor by email address."""
-        async with with_tenant(org_id) as db:
-            vendor = await db.vendor.find_first(
-                where={"orgId": org_id, "email": email}
-            )
-            
-            if vendor:
-                return {
-                    "id": vendor.id,
-                    "name": vendor.name,
-                    "email": vendor.email,
-                    "phone": vendor.phone,
-                    "website": vendor.website,
-                    "address": vendor.address,
-                    "metadata": vendor.metadata,
-                    "is_active": vendor.isActive,
-                    "created_at": vendor.createdAt,
-                    "updated_at": vendor.updatedAt,
-                }
-            
-            return None
\ No newline at end of file
+        """Find a vendor by email address (case-insensitive)."""
+        return await get_vendor_cache().find_by_email(org_id, email)
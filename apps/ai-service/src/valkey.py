@@ -0,0 +1,42 @@
+"""Valkey (Redis protocol) client management for the AI Service."""
+
+from typing import Optional
+
+import structlog
+from redis.asyncio import Redis
+
+from .config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+# Global Valkey client instance
+_valkey_client: Optional[Redis] = None
+
+
+def get_valkey_client() -> Redis:
+    """Get or create the shared Valkey client.
+
+    The client holds a connection pool and connects lazily on first command,
+    so creating it does not require Valkey to be reachable.
+    """
+    global _valkey_client
+
+    if _valkey_client is None:
+        settings = get_settings()
+
+        logger.info("🔌 Creating Valkey client", url=settings.redis_url.split("@")[-1])
+
+        _valkey_client = Redis.from_url(settings.redis_url, decode_responses=False)
+
+    return _valkey_client
+
+
+async def close_valkey_client() -> None:
+    """Close the Valkey client and its connection pool."""
+    global _valkey_client
+
+    if _valkey_client is not None:
+        logger.info("🔌 Closing Valkey connection")
+        await _valkey_client.aclose()
+        _valkey_client = None
+        logger.info("✅ Valkey connection closed")
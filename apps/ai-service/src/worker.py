@@ -0,0 +1,111 @@
+"""
+Celery worker running SupplyGraph workflows outside the API process.
+
+With ``WORKFLOW_DISPATCH=celery`` the API only records executions and queues
+jobs; workers consume them and run the LangGraph workflows. Each workflow type
+is routed to a queue (``WORKFLOW_QUEUES``), so CPU-heavy quote extraction can
+be scaled separately from the rest:
+
+    celery -A src.worker worker -Q workflows --concurrency 8
+    celery -A src.worker worker -Q workflows.extraction --concurrency 2
+"""
+
+import asyncio
+from typing import Any, Awaitable, Dict, Optional
+
+import structlog
+from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+
+from .config import get_settings
+from .database import get_db_client, close_db_client
+from .metrics import mark_metrics_process_dead, reset_multiprocess_metrics, start_metrics_server
+from .services.vendor_cache import get_vendor_cache
+from .valkey import close_valkey_client
+from .workflows.executor import WorkflowQueueFull
+from .workflows.jobs import RUN_WORKFLOW_TASK, decode_job
+from .workflows.manager import get_workflow_manager
+
+logger = structlog.get_logger(__name__)
+
+settings = get_settings()
+
+celery_app = Celery(
+    "supplygraph",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+)
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    task_default_queue=settings.workflow_default_queue,
+    # Only acknowledge a job once it ran, so a crashed worker's job is redelivered
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Redis redelivers unacknowledged jobs after this long (1 hour by default),
+    # which would run a still-running workflow a second time on another worker
+    broker_transport_options={"visibility_timeout": settings.celery_visibility_timeout},
+    # Workflows are long; don't let one process hoard queued jobs
+    worker_prefetch_multiplier=1,
+    task_ignore_result=True,
+)
+
+# One event loop per worker process, shared by all jobs it runs
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine on this worker process's event loop."""
+    global _loop
+
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+
+    return _loop.run_until_complete(coro)
+
+
+@worker_init.connect
+def init_worker(**kwargs: Any) -> None:
+    """Clear metric samples of a previous run before the pool processes start."""
+    reset_multiprocess_metrics()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs: Any) -> None:
+    """Connect to the database and compile workflows once per worker process."""
+    run_async(get_db_client())
+    run_async(get_workflow_manager().warmup())
+    run_async(get_workflow_manager().start_cancellation_listener())
+    # The first pool process to bind the port serves the metrics of all of them
+    start_metrics_server()
+    logger.info("✅ Workflow worker process ready")
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs: Any) -> None:
+    """Drain running workflows and close connections."""
+    run_async(get_workflow_manager().shutdown())
+    run_async(get_vendor_cache().stop())
+    run_async(close_valkey_client())
+    run_async(close_db_client())
+    mark_metrics_process_dead()
+
+
+@celery_app.task(
+    name=RUN_WORKFLOW_TASK,
+    autoretry_for=(WorkflowQueueFull,),
+    retry_backoff=True,
+    max_retries=None,
+)
+def run_workflow(payload: Dict[str, Any]) -> None:
+    """Start or resume a workflow execution on this worker."""
+    job = decode_job(payload)
+
+    logger.info(
+        "📥 Running workflow job",
+        execution_id=job["execution_id"],
+        workflow_type=job["workflow_type"],
+    )
+
+    run_async(get_workflow_manager().execute_job(job))
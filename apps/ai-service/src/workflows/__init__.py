@@ -1,12 +1,25 @@
 """LangGraph workflow orchestration for SupplyGraph."""
 
-from .manager import WorkflowManager
+from .manager import WorkflowManager, WorkflowStartTimeout, get_workflow_manager
+from .events import emit_workflow_event, get_event_bus
+from .timers import get_timer_service
+from .progress import get_progress_hub, stream_progress
+from .executor import WorkflowQueueFull, ExecutorShuttingDown
 from .procurement import ProcurementWorkflow
 from .quote_processing import QuoteProcessingWorkflow
 from .email_processing import EmailProcessingWorkflow
 
 __all__ = [
     "WorkflowManager",
+    "get_workflow_manager",
+    "emit_workflow_event",
+    "get_event_bus",
+    "get_timer_service",
+    "get_progress_hub",
+    "stream_progress",
+    "WorkflowQueueFull",
+    "WorkflowStartTimeout",
+    "ExecutorShuttingDown",
     "ProcurementWorkflow", 
     "QuoteProcessingWorkflow",
     "EmailProcessingWorkflow",
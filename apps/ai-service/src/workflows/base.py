@@ -1,17 +1,43 @@
 """Base workflow classes and utilities for LangGraph workflows."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, TypedDict, Annotated
+from typing import Dict, Any, List, Optional, TypedDict, Annotated
 from datetime import datetime
 
 import structlog
-from langgraph.graph import StateGraph, START, END
-from langgraph.graph.message import add_messages
+from langgraph.graph import START, END
 from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.types import interrupt
+
+from .instrumentation import InstrumentedStateGraph
 
 logger = structlog.get_logger(__name__)
 
 
+# Trail entries kept in state; the full history goes to the AuditLog table
+MAX_TRAIL_ENTRIES = 50
+
+
+def merge_trail(left: List[Dict[str, Any]], right: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reducer for the audit trail: append unseen entries (by ``seq``) and keep the newest."""
+    last_seq = left[-1].get("seq", 0) if left else 0
+    merged = list(left) + [entry for entry in right if entry.get("seq", 0) > last_seq]
+    return merged[-MAX_TRAIL_ENTRIES:]
+
+
+def append_trail(trail: List[Dict[str, Any]], kind: str, content: str) -> List[Dict[str, Any]]:
+    """Return a new bounded trail with one more entry."""
+    last_seq = trail[-1].get("seq", 0) if trail else 0
+    entry = {
+        "seq": last_seq + 1,
+        "kind": kind,
+        "role": "system",
+        "content": content,
+        "timestamp": datetime.now().isoformat(),
+    }
+    return (list(trail) + [entry])[-MAX_TRAIL_ENTRIES:]
+
+
 class WorkflowState(TypedDict):
     """Base state structure for all workflows."""
     # Core workflow metadata
@@ -30,16 +56,19 @@ class WorkflowState(TypedDict):
     # Workflow-specific data (to be extended by subclasses)
     data: Dict[str, Any]
     
-    # Messages for debugging and audit trail
-    messages: Annotated[list, add_messages]
+    # Bounded audit trail of recent steps, numbered by ``seq``
+    messages: Annotated[list, merge_trail]
 
 
 class BaseWorkflow(ABC):
     """Abstract base class for all LangGraph workflows."""
     
+    # Label used for this workflow's node metrics
+    workflow_type: str = "workflow"
+    
     def __init__(self):
         self.logger = structlog.get_logger(self.__class__.__name__)
-        self.graph_builder = StateGraph(WorkflowState)
+        self.graph_builder = InstrumentedStateGraph(WorkflowState, workflow_type=self.workflow_type)
         self._setup_graph()
     
     @abstractmethod
@@ -63,11 +92,7 @@ class BaseWorkflow(ABC):
         # Update state
         state["current_step"] = step_name
         state["updated_at"] = datetime.now()
-        state["messages"].append({
-            "role": "system",
-            "content": f"[{step_name}] {message}",
-            "timestamp": datetime.now().isoformat(),
-        })
+        state["messages"] = append_trail(state["messages"], "step", f"[{step_name}] {message}")
         
         return state
     
@@ -86,20 +111,36 @@ class BaseWorkflow(ABC):
         state["retry_count"] += 1
         state["error_message"] = error_message
         state["updated_at"] = datetime.now()
-        state["messages"].append({
-            "role": "system",
-            "content": f"[ERROR] {step_name}: {error_message}",
-            "timestamp": datetime.now().isoformat(),
-        })
+        state["messages"] = append_trail(state["messages"], "error", f"[ERROR] {step_name}: {error_message}")
         
         return state
     
+    def wait_for_event(self, state: WorkflowState, *event_names: str) -> Any:
+        """
+        Suspend the workflow thread until one of ``event_names`` is emitted for its entity.
+        
+        The thread is checkpointed and the execution ends until the workflow
+        manager resumes it; the node then runs again from the top. This raises
+        ``GraphInterrupt``, so it must not be called inside ``except Exception``.
+        """
+        self.logger.info(
+            f"⏸️ Waiting for {', '.join(event_names)}",
+            workflow_id=state["workflow_id"],
+            entity_id=state["entity_id"],
+        )
+        
+        return interrupt({
+            "wait_for": list(event_names),
+            "entity_type": state["entity_type"],
+            "entity_id": state["entity_id"],
+        })
+    
     def should_retry(self, state: WorkflowState, max_retries: int = 3) -> bool:
         """Determine if a workflow should retry after an error."""
         return state["retry_count"] < max_retries
     
+    @staticmethod
     def create_initial_state(
-        self,
         workflow_id: str,
         org_id: str,
         entity_id: str,
@@ -118,11 +159,7 @@ class BaseWorkflow(ABC):
             retry_count=0,
             error_message=None,
             data=data,
-            messages=[{
-                "role": "system",
-                "content": f"Workflow started for {entity_type} {entity_id}",
-                "timestamp": datetime.now().isoformat(),
-            }],
+            messages=append_trail([], "start", f"Workflow started for {entity_type} {entity_id}"),
         )
 
 
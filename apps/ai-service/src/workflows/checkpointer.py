@@ -0,0 +1,344 @@
+"""Valkey-backed LangGraph checkpointer shared by all API replicas."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from redis.asyncio import Redis
+
+logger = structlog.get_logger(__name__)
+
+
+class ValkeyCheckpointSaver(BaseCheckpointSaver):
+    """
+    Durable checkpoint storage in Valkey.
+
+    Key layout (all keys expire after ``ttl`` seconds without activity):
+
+    - ``{prefix}:idx:{thread}:{ns}``            sorted set of checkpoint ids (lexicographic)
+    - ``{prefix}:cp:{thread}:{ns}:{id}``        hash with the checkpoint, metadata and parent id
+    - ``{prefix}:blob:{thread}:{ns}:{channel}:{version}``  serialized channel value
+    - ``{prefix}:writes:{thread}:{ns}:{id}``    hash of pending writes for a checkpoint
+
+    Channel values are stored once per version, so a checkpoint only writes the
+    channels that changed in that step. Only the newest ``max_history``
+    checkpoints of a thread are kept, along with the blobs they reference.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        ttl: int,
+        max_history: int = 10,
+        key_prefix: str = "workflow:checkpoint",
+    ):
+        super().__init__()
+        self.client = client
+        self.ttl = ttl
+        self.max_history = max_history
+        self.key_prefix = key_prefix
+
+    # Key helpers
+    def _index_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.key_prefix}:idx:{thread_id}:{checkpoint_ns}"
+
+    def _checkpoint_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"{self.key_prefix}:cp:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
+    def _blob_key(self, thread_id: str, checkpoint_ns: str, channel: str, version: Any) -> str:
+        return f"{self.key_prefix}:blob:{thread_id}:{checkpoint_ns}:{channel}:{version}"
+
+    def _writes_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"{self.key_prefix}:writes:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
+    # Serialization helpers
+    def _dump(self, value: Any) -> bytes:
+        """Serialize a value into a single ``type|payload`` byte string."""
+        type_, payload = self.serde.dumps_typed(value)
+        return type_.encode() + b"|" + payload
+
+    def _load(self, raw: bytes) -> Any:
+        """Inverse of :meth:`_dump`."""
+        type_, _, payload = raw.partition(b"|")
+        return self.serde.loads_typed((type_.decode(), payload))
+
+    # Async API
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get a checkpoint tuple, defaulting to the latest checkpoint of the thread."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+
+        if not checkpoint_id:
+            latest = await self.client.zrevrangebylex(
+                self._index_key(thread_id, checkpoint_ns), "+", "-", start=0, num=1
+            )
+            if not latest:
+                return None
+            checkpoint_id = latest[0].decode()
+
+        return await self._load_tuple(thread_id, checkpoint_ns, checkpoint_id)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints of a thread, newest first."""
+        if config is None:
+            raise ValueError("ValkeyCheckpointSaver.alist requires a thread_id in config")
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        upper = "+"
+        if before and (before_id := get_checkpoint_id(before)):
+            upper = f"({before_id}"
+
+        checkpoint_ids = await self.client.zrevrangebylex(
+            self._index_key(thread_id, checkpoint_ns), upper, "-"
+        )
+
+        yielded = 0
+        for raw_id in checkpoint_ids:
+            if limit is not None and yielded >= limit:
+                break
+
+            checkpoint_tuple = await self._load_tuple(thread_id, checkpoint_ns, raw_id.decode())
+            if checkpoint_tuple is None:
+                continue
+            if filter and not all(
+                checkpoint_tuple.metadata.get(key) == value for key, value in filter.items()
+            ):
+                continue
+
+            yielded += 1
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and the channel values that changed in this step."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+
+        checkpoint_copy = checkpoint.copy()
+        channel_values: Dict[str, Any] = checkpoint_copy.pop("channel_values", {})  # type: ignore[misc]
+
+        index_key = self._index_key(thread_id, checkpoint_ns)
+        checkpoint_key = self._checkpoint_key(thread_id, checkpoint_ns, checkpoint["id"])
+
+        pipe = self.client.pipeline(transaction=False)
+
+        for channel, version in new_versions.items():
+            if channel in channel_values:
+                pipe.set(
+                    self._blob_key(thread_id, checkpoint_ns, channel, version),
+                    self._dump(channel_values[channel]),
+                    ex=self.ttl,
+                )
+
+        # Keep blobs of unchanged channels alive as long as the checkpoint that uses them
+        for channel, version in checkpoint["channel_versions"].items():
+            if channel not in new_versions:
+                pipe.expire(self._blob_key(thread_id, checkpoint_ns, channel, version), self.ttl)
+
+        pipe.hset(
+            checkpoint_key,
+            mapping={
+                "checkpoint": self._dump(checkpoint_copy),
+                "metadata": self._dump(get_checkpoint_metadata(config, metadata)),
+                "parent": parent_checkpoint_id or "",
+            },
+        )
+        pipe.expire(checkpoint_key, self.ttl)
+        pipe.zadd(index_key, {checkpoint["id"]: 0})
+        pipe.expire(index_key, self.ttl)
+        pipe.zcard(index_key)
+
+        results = await pipe.execute()
+        await self._prune(thread_id, checkpoint_ns, history_size=results[-1])
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes linked to a checkpoint."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        writes_key = self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+
+        pipe = self.client.pipeline(transaction=False)
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            field = f"{task_id}:{write_idx}"
+            packed = self._dump([task_id, channel, self._dump(value), task_path])
+
+            # Regular writes are idempotent per task; special writes always overwrite
+            if write_idx >= 0:
+                pipe.hsetnx(writes_key, field, packed)
+            else:
+                pipe.hset(writes_key, field, packed)
+        pipe.expire(writes_key, self.ttl)
+
+        await pipe.execute()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint, blob and write stored for a thread."""
+        keys: List[bytes] = []
+        for kind in ("idx", "cp", "blob", "writes"):
+            async for key in self.client.scan_iter(match=f"{self.key_prefix}:{kind}:{thread_id}:*"):
+                keys.append(key)
+
+        if keys:
+            await self.client.delete(*keys)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """Use the same monotonic version format as the in-memory saver."""
+        return InMemorySaver.get_next_version(self, current, channel)  # type: ignore[arg-type]
+
+    # Internal helpers
+    async def _load_tuple(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> Optional[CheckpointTuple]:
+        """Load a checkpoint with its channel values and pending writes."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hgetall(self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id))
+        pipe.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+        saved, raw_writes = await pipe.execute()
+
+        if not saved:
+            return None
+
+        checkpoint: Checkpoint = self._load(saved[b"checkpoint"])
+        channel_values = await self._load_channel_values(
+            thread_id, checkpoint_ns, checkpoint["channel_versions"]
+        )
+
+        pending_writes = []
+        for field in sorted(raw_writes, key=self._write_sort_key):
+            task_id, channel, value, _task_path = self._load(raw_writes[field])
+            pending_writes.append((task_id, channel, self._load(value)))
+
+        parent_checkpoint_id = saved.get(b"parent", b"").decode()
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self._load(saved[b"metadata"]),
+            pending_writes=pending_writes,
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+        )
+
+    async def _load_channel_values(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> Dict[str, Any]:
+        """Fetch all channel blobs of a checkpoint in a single round trip."""
+        if not versions:
+            return {}
+
+        channels = list(versions.keys())
+        raw_values = await self.client.mget(
+            [self._blob_key(thread_id, checkpoint_ns, channel, versions[channel]) for channel in channels]
+        )
+
+        values: Dict[str, Any] = {}
+        for channel, raw in zip(channels, raw_values):
+            if raw is None:
+                continue
+            values[channel] = self._load(raw)
+        return values
+
+    async def _prune(self, thread_id: str, checkpoint_ns: str, history_size: int) -> None:
+        """
+        Drop the oldest checkpoints once a thread exceeds ``max_history``.
+
+        Channel blobs of the dropped checkpoints are deleted with them unless a
+        remaining checkpoint still references the same version.
+        """
+        excess = history_size - self.max_history
+        if excess <= 0:
+            return
+
+        index_key = self._index_key(thread_id, checkpoint_ns)
+        checkpoint_ids = [raw_id.decode() for raw_id in await self.client.zrangebylex(index_key, "-", "+")]
+        stale_ids = checkpoint_ids[:excess]
+        if not stale_ids:
+            return
+
+        pipe = self.client.pipeline(transaction=False)
+        for checkpoint_id in checkpoint_ids:
+            pipe.hget(self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id), "checkpoint")
+        saved = await pipe.execute()
+
+        def blobs(raw_checkpoints: List[Optional[bytes]]) -> set:
+            return {
+                (channel, version)
+                for raw in raw_checkpoints
+                if raw is not None
+                for channel, version in self._load(raw)["channel_versions"].items()
+            }
+
+        superseded = blobs(saved[:len(stale_ids)]) - blobs(saved[len(stale_ids):])
+
+        pipe = self.client.pipeline(transaction=False)
+        for checkpoint_id in stale_ids:
+            pipe.delete(
+                self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id),
+                self._writes_key(thread_id, checkpoint_ns, checkpoint_id),
+            )
+        for channel, version in superseded:
+            pipe.delete(self._blob_key(thread_id, checkpoint_ns, channel, version))
+        pipe.zrem(index_key, *stale_ids)
+        await pipe.execute()
+
+    @staticmethod
+    def _write_sort_key(field: bytes) -> Tuple[str, int]:
+        task_id, _, idx = field.decode().rpartition(":")
+        return task_id, int(idx)
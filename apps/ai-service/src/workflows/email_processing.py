@@ -1,15 +1,20 @@
 """Email Processing Workflow - LangGraph implementation for Gmail integration and email monitoring."""
 
 import asyncio
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 import structlog
 from langgraph.graph import START, END
+from prisma_client import Json
 
 from .base import BaseWorkflow, WorkflowState
 from ..database import with_tenant
+from ..metrics import EMAIL_INGEST_ROWS_TOTAL
 from ..services.gmail_service import GmailService
+from ..services.vendor_cache import get_vendor_cache
 from .quote_processing import QuoteProcessingWorkflow
 
 logger = structlog.get_logger(__name__)
@@ -22,6 +27,8 @@ class EmailProcessingWorkflow(BaseWorkflow):
     Flow: MONITOR → FETCH → CLASSIFY → PROCESS_QUOTES → STORE
     """
     
+    workflow_type = "email_processing"
+    
     def _setup_graph(self) -> None:
         """Setup the email processing workflow graph."""
         
@@ -196,9 +203,10 @@ class EmailProcessingWorkflow(BaseWorkflow):
             processed_quotes = []
             failed_quotes = []
             
-            # Initialize quote processing workflow
-            quote_workflow = QuoteProcessingWorkflow()
-            compiled_quote_workflow = quote_workflow.compile()
+            # Reuse the quote processing graph compiled once by the workflow manager
+            from .manager import get_workflow_manager
+            
+            compiled_quote_workflow = await get_workflow_manager().get_workflow("quote_processing")
             
             for email in quote_emails:
                 try:
@@ -218,7 +226,7 @@ class EmailProcessingWorkflow(BaseWorkflow):
                         continue
                     
                     # Create quote processing state
-                    quote_state = quote_workflow.create_initial_state(
+                    quote_state = QuoteProcessingWorkflow.create_initial_state(
                         workflow_id=f"quote_processing_{email['id']}",
                         org_id=state["org_id"],
                         entity_id=email["id"],
@@ -231,7 +239,10 @@ class EmailProcessingWorkflow(BaseWorkflow):
                     
                     # Process the quote
                     final_quote_state = None
-                    async for quote_state_update in compiled_quote_workflow.astream(quote_state):
+                    config = {"configurable": {"thread_id": f"{state['workflow_id']}:{email['id']}"}}
+                    async for quote_state_update in compiled_quote_workflow.astream(
+                        quote_state, config, stream_mode="values"
+                    ):
                         final_quote_state = quote_state_update
                     
                     if final_quote_state and final_quote_state["data"].get("quote_id"):
@@ -279,47 +290,27 @@ class EmailProcessingWorkflow(BaseWorkflow):
             fetched_emails = state["data"]["fetched_emails"]
             processed_quotes = state["data"].get("processed_quotes", [])
             
-            # Store email threads and messages
+            # Store email threads and messages in a handful of bulk statements
+            started = time.perf_counter()
             async with with_tenant(state["org_id"]) as db:
-                for email in fetched_emails:
-                    # Create or update email thread
-                    thread = await db.emailthread.upsert(
-                        where={"gmailThreadId": email["thread_id"]},
-                        update={
-                            "lastMessageAt": email["received_at"],
-                            "messageCount": {"increment": 1},
-                        },
-                        create={
-                            "orgId": state["org_id"],
-                            "gmailThreadId": email["thread_id"],
-                            "subject": email["subject"],
-                            "participants": email["participants"],
-                            "lastMessageAt": email["received_at"],
-                            "messageCount": 1,
-                            "requestId": self._extract_request_id_from_email(email),
-                        }
-                    )
-                    
-                    # Create email message record
-                    await db.emailmessage.upsert(
-                        where={"gmailMessageId": email["id"]},
-                        update={
-                            "isProcessed": True,
-                            "extractedData": email.get("classification", {}),
-                        },
-                        create={
-                            "threadId": thread.id,
-                            "gmailMessageId": email["id"],
-                            "from": email["from"],
-                            "to": email["to"],
-                            "subject": email["subject"],
-                            "body": email["body"],
-                            "attachments": email.get("attachments", []),
-                            "isProcessed": True,
-                            "extractedData": email.get("classification", {}),
-                            "receivedAt": email["received_at"],
-                        }
-                    )
+                rows = await self._ingest_emails(db, state["org_id"], fetched_emails)
+            elapsed = time.perf_counter() - started
+            
+            rows_per_sec = rows / elapsed if elapsed > 0 else 0.0
+            EMAIL_INGEST_ROWS_TOTAL.inc(rows)
+            state["data"]["ingest_stats"] = {
+                "emails": len(fetched_emails),
+                "rows": rows,
+                "seconds": round(elapsed, 4),
+                "rows_per_sec": round(rows_per_sec, 1),
+            }
+            logger.info(
+                "📥 Ingested emails",
+                org_id=state["org_id"],
+                emails=len(fetched_emails),
+                rows=rows,
+                rows_per_sec=round(rows_per_sec, 1),
+            )
             
             # Update last processed timestamp
             state["data"]["last_processed_at"] = datetime.now().isoformat()
@@ -327,7 +318,7 @@ class EmailProcessingWorkflow(BaseWorkflow):
             state = await self.log_step(
                 state,
                 "store_email_data",
-                f"✅ Stored {len(fetched_emails)} email records"
+                f"✅ Stored {len(fetched_emails)} email records ({rows_per_sec:.0f} rows/s)"
             )
             
             return state
@@ -335,6 +326,112 @@ class EmailProcessingWorkflow(BaseWorkflow):
         except Exception as e:
             return await self.handle_error(state, e, "store_email_data")
     
+    async def _ingest_emails(self, db: Any, org_id: str, emails: List[Dict[str, Any]]) -> int:
+        """
+        Upsert threads and messages for a batch of emails; returns rows written.
+        
+        Existing rows are resolved with one find_many per table, new rows are
+        inserted with create_many and the remaining updates go out as one batch.
+        New threads are inserted first, skipping any another run created since
+        they were looked up, and their ids are read back so messages attach to
+        whichever row won.
+        """
+        emails = list({email["id"]: email for email in emails}.values())
+        if not emails:
+            return 0
+        
+        by_thread: Dict[str, List[Dict[str, Any]]] = {}
+        for email in emails:
+            by_thread.setdefault(email["thread_id"], []).append(email)
+        
+        existing_threads = {
+            thread.gmailThreadId: thread.id
+            for thread in await db.emailthread.find_many(
+                where={"gmailThreadId": {"in": list(by_thread)}}
+            )
+        }
+        existing_messages = {
+            message.gmailMessageId
+            for message in await db.emailmessage.find_many(
+                where={"gmailMessageId": {"in": [email["id"] for email in emails]}}
+            )
+        }
+        
+        new_threads, new_messages = [], []
+        thread_updates, message_updates = [], []
+        
+        def unseen(thread_emails: List[Dict[str, Any]]) -> int:
+            return sum(1 for email in thread_emails if email["id"] not in existing_messages)
+        
+        def last_message_at(thread_emails: List[Dict[str, Any]]) -> datetime:
+            return max(email["received_at"] for email in thread_emails)
+        
+        for gmail_thread_id, thread_emails in by_thread.items():
+            if gmail_thread_id in existing_threads:
+                continue
+            first = thread_emails[0]
+            new_threads.append({
+                "id": uuid4().hex,
+                "orgId": org_id,
+                "gmailThreadId": gmail_thread_id,
+                "subject": first["subject"],
+                "participants": Json(first["participants"]),
+                "lastMessageAt": last_message_at(thread_emails),
+                "messageCount": unseen(thread_emails),
+                "requestId": self._extract_request_id_from_email(first),
+            })
+        
+        created_threads = set()
+        if new_threads:
+            await db.emailthread.create_many(data=new_threads, skip_duplicates=True)
+            ids = {thread["gmailThreadId"]: thread["id"] for thread in new_threads}
+            for thread in await db.emailthread.find_many(
+                where={"gmailThreadId": {"in": list(ids)}}
+            ):
+                existing_threads[thread.gmailThreadId] = thread.id
+                if thread.id == ids[thread.gmailThreadId]:
+                    created_threads.add(thread.gmailThreadId)
+        
+        for gmail_thread_id, thread_emails in by_thread.items():
+            thread_id = existing_threads[gmail_thread_id]
+            if gmail_thread_id not in created_threads:
+                # Existing thread, or one a concurrent run created first
+                thread_updates.append((thread_id, {
+                    "lastMessageAt": last_message_at(thread_emails),
+                    "messageCount": {"increment": unseen(thread_emails)},
+                }))
+            
+            for email in thread_emails:
+                extracted_data = Json(email.get("classification", {}))
+                if email["id"] in existing_messages:
+                    message_updates.append((email["id"], {
+                        "isProcessed": True,
+                        "extractedData": extracted_data,
+                    }))
+                    continue
+                new_messages.append({
+                    "threadId": thread_id,
+                    "gmailMessageId": email["id"],
+                    "sender": email["from"],
+                    "to": Json(email["to"]),
+                    "subject": email["subject"],
+                    "body": email["body"],
+                    "attachments": Json(email.get("attachments", [])),
+                    "isProcessed": True,
+                    "extractedData": extracted_data,
+                    "receivedAt": email["received_at"],
+                })
+        
+        async with db.batch_() as batch:
+            for thread_id, data in thread_updates:
+                batch.emailthread.update(where={"id": thread_id}, data=data)
+            if new_messages:
+                batch.emailmessage.create_many(data=new_messages, skip_duplicates=True)
+            for gmail_message_id, data in message_updates:
+                batch.emailmessage.update(where={"gmailMessageId": gmail_message_id}, data=data)
+        
+        return len(created_threads) + len(thread_updates) + len(new_messages) + len(message_updates)
+    
     async def handle_processing_error(self, state: WorkflowState) -> WorkflowState:
         """Handle email processing errors."""
         state = await self.log_step(
@@ -451,18 +548,10 @@ class EmailProcessingWorkflow(BaseWorkflow):
                     return request_id
         
         # If no direct match, try to match by vendor and timing
-        vendor_email = email.get("from", "").lower()
-        
-        async with with_tenant(org_id) as db:
-            # Find vendor by email
-            vendor = await db.vendor.find_first(
-                where={
-                    "orgId": org_id,
-                    "email": vendor_email,
-                }
-            )
-            
-            if vendor:
+        vendor = await get_vendor_cache().find_by_email(org_id, email.get("from", ""))
+        
+        if vendor:
+            async with with_tenant(org_id) as db:
                 # Find recent requests that might match
                 recent_requests = await db.procurementrequest.find_many(
                     where={
@@ -0,0 +1,91 @@
+"""Internal events that wake up workflows suspended while waiting on the outside world."""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypedDict
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class WorkflowEvent(TypedDict):
+    """Something happened to an entity that a suspended workflow may be waiting for."""
+    org_id: str
+    entity_type: str
+    entity_id: str
+    name: str
+    payload: Dict[str, Any]
+
+
+EventHandler = Callable[[WorkflowEvent], Awaitable[None]]
+
+
+class WorkflowEventBus:
+    """In-process publish/subscribe hub for workflow events."""
+
+    def __init__(self):
+        self._handlers: List[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> None:
+        """Register a coroutine called for every published event."""
+        self._handlers.append(handler)
+
+    async def publish(self, event: WorkflowEvent, raise_errors: bool = False) -> None:
+        """Deliver an event to all subscribers.
+
+        Subscriber failures are logged and by default never propagate to the
+        publisher, so emitting an event cannot break the request or node that
+        emitted it. With ``raise_errors`` the first failure is re-raised once
+        every subscriber has run, for publishers that retry delivery.
+        """
+        errors: List[Exception] = []
+        for handler in self._handlers:
+            try:
+                await handler(event)
+            except Exception as e:
+                logger.error(
+                    "❌ Workflow event handler failed",
+                    event_name=event["name"],
+                    entity_id=event["entity_id"],
+                    error=str(e),
+                )
+                errors.append(e)
+
+        if raise_errors and errors:
+            raise errors[0]
+
+
+# Process-wide event bus instance
+_event_bus: Optional[WorkflowEventBus] = None
+
+
+def get_event_bus() -> WorkflowEventBus:
+    """Get the process-wide workflow event bus."""
+    global _event_bus
+
+    if _event_bus is None:
+        _event_bus = WorkflowEventBus()
+
+    return _event_bus
+
+
+async def emit_workflow_event(
+    org_id: str,
+    entity_type: str,
+    entity_id: str,
+    name: str,
+    payload: Optional[Dict[str, Any]] = None,
+    raise_errors: bool = False,
+) -> None:
+    """Publish an event for an entity on the process-wide bus."""
+    logger.info("📣 Workflow event", event_name=name, entity_type=entity_type, entity_id=entity_id)
+
+    await get_event_bus().publish(
+        WorkflowEvent(
+            org_id=org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            name=name,
+            payload=payload or {},
+        ),
+        raise_errors=raise_errors,
+    )
@@ -0,0 +1,164 @@
+"""Bounded workflow executor with per-type concurrency limits and admission control."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+import structlog
+
+from ..metrics import (
+    WORKFLOW_QUEUE_DEPTH,
+    WORKFLOW_QUEUE_WAIT_SECONDS,
+    WORKFLOW_REJECTED_TOTAL,
+    WORKFLOW_RUNNING,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class WorkflowQueueFull(Exception):
+    """Raised when a workflow type already has the maximum number of queued executions."""
+
+
+class ExecutorShuttingDown(Exception):
+    """Raised when work is submitted while the executor is draining."""
+
+
+class WorkflowExecutor:
+    """
+    Runs workflow executions as tracked asyncio tasks.
+
+    Each workflow type gets its own concurrency limit. Executions beyond the
+    limit wait in a bounded per-type queue; once that queue is full new
+    submissions are rejected instead of piling up in the event loop.
+    """
+
+    def __init__(
+        self,
+        concurrency_limits: Dict[str, int],
+        default_concurrency: int,
+        max_queue_size: int,
+    ):
+        self.concurrency_limits = concurrency_limits
+        self.default_concurrency = default_concurrency
+        self.max_queue_size = max_queue_size
+
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._queued: Dict[str, int] = {}
+        self._running: Dict[str, int] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._accepting = True
+
+    def _semaphore(self, workflow_type: str) -> asyncio.Semaphore:
+        if workflow_type not in self._semaphores:
+            limit = self.concurrency_limits.get(workflow_type, self.default_concurrency)
+            self._semaphores[workflow_type] = asyncio.Semaphore(limit)
+        return self._semaphores[workflow_type]
+
+    def check_capacity(self, workflow_type: str, count: int = 1) -> None:
+        """Raise if ``count`` more executions of ``workflow_type`` cannot be admitted."""
+        if not self._accepting:
+            WORKFLOW_REJECTED_TOTAL.labels(workflow_type, "shutting_down").inc(count)
+            raise ExecutorShuttingDown("Workflow executor is shutting down")
+
+        limit = self.concurrency_limits.get(workflow_type, self.default_concurrency)
+        free_slots = max(limit - self._running.get(workflow_type, 0), 0)
+        queued = self._queued.get(workflow_type, 0)
+
+        if queued + count > self.max_queue_size + free_slots:
+            WORKFLOW_REJECTED_TOTAL.labels(workflow_type, "queue_full").inc(count)
+            raise WorkflowQueueFull(
+                f"Workflow queue for {workflow_type} is full ({queued} waiting)"
+            )
+
+    def submit(
+        self,
+        workflow_type: str,
+        execution_id: str,
+        run: Callable[[], Awaitable[None]],
+    ) -> asyncio.Task:
+        """Admit an execution and schedule it behind the type's concurrency limit."""
+        self.check_capacity(workflow_type)
+
+        self._queued[workflow_type] = self._queued.get(workflow_type, 0) + 1
+        WORKFLOW_QUEUE_DEPTH.labels(workflow_type).inc()
+
+        task = asyncio.create_task(
+            self._run(workflow_type, execution_id, run),
+            name=f"workflow:{execution_id}",
+        )
+        self._tasks[execution_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(execution_id, None))
+
+        return task
+
+    async def _run(
+        self,
+        workflow_type: str,
+        execution_id: str,
+        run: Callable[[], Awaitable[None]],
+    ) -> None:
+        enqueued_at = time.perf_counter()
+        dequeued = False
+
+        try:
+            async with self._semaphore(workflow_type):
+                dequeued = True
+                self._queued[workflow_type] -= 1
+                WORKFLOW_QUEUE_DEPTH.labels(workflow_type).dec()
+                WORKFLOW_QUEUE_WAIT_SECONDS.labels(workflow_type).observe(
+                    time.perf_counter() - enqueued_at
+                )
+
+                self._running[workflow_type] = self._running.get(workflow_type, 0) + 1
+                WORKFLOW_RUNNING.labels(workflow_type).inc()
+                try:
+                    await run()
+                finally:
+                    self._running[workflow_type] -= 1
+                    WORKFLOW_RUNNING.labels(workflow_type).dec()
+        except asyncio.CancelledError:
+            logger.info("🛑 Workflow execution task cancelled", execution_id=execution_id)
+            raise
+        except Exception as e:
+            # _execute_workflow records failures itself; this only guards the task
+            logger.error("❌ Workflow execution task crashed", execution_id=execution_id, error=str(e))
+        finally:
+            if not dequeued:
+                self._queued[workflow_type] -= 1
+                WORKFLOW_QUEUE_DEPTH.labels(workflow_type).dec()
+
+    def get_task(self, execution_id: str) -> Optional[asyncio.Task]:
+        """Get the task of a queued or running execution."""
+        return self._tasks.get(execution_id)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Queued and running executions per workflow type."""
+        workflow_types = set(self._queued) | set(self._running)
+        return {
+            workflow_type: {
+                "queued": self._queued.get(workflow_type, 0),
+                "running": self._running.get(workflow_type, 0),
+                "limit": self.concurrency_limits.get(workflow_type, self.default_concurrency),
+            }
+            for workflow_type in sorted(workflow_types)
+        }
+
+    async def shutdown(self, timeout: float) -> None:
+        """Stop admitting work and wait for in-flight executions to finish."""
+        self._accepting = False
+        pending = list(self._tasks.values())
+
+        if not pending:
+            return
+
+        logger.info("⏳ Draining workflow executions", count=len(pending), timeout=timeout)
+        done, still_running = await asyncio.wait(pending, timeout=timeout)
+
+        if still_running:
+            logger.warning("🛑 Cancelling workflow executions after drain timeout", count=len(still_running))
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+
+        logger.info("✅ Workflow executor drained", completed=len(done), cancelled=len(still_running))
@@ -0,0 +1,100 @@
+"""Automatic Prometheus instrumentation of LangGraph workflow nodes."""
+
+import asyncio
+import functools
+import inspect
+import json
+import time
+from typing import Any, Callable
+
+from langgraph.errors import GraphBubbleUp
+from langgraph.graph import StateGraph
+
+from ..metrics import (
+    WORKFLOW_NODE_DURATION_SECONDS,
+    WORKFLOW_NODE_ERRORS_TOTAL,
+    WORKFLOW_NODE_RETRIES_TOTAL,
+    WORKFLOW_NODE_STATE_BYTES,
+)
+from .state_writer import strip_binary
+
+
+def _retry_count(state: Any) -> int:
+    return state.get("retry_count", 0) if isinstance(state, dict) else 0
+
+
+def _record(workflow_type: str, node: str, started: float, outcome: str, retries_before: int, result: Any) -> None:
+    """Record duration, handled errors and state size of one node run."""
+    retries = _retry_count(result) - retries_before
+
+    # Nodes catch their own exceptions via handle_error, which bumps retry_count
+    if outcome == "success" and retries > 0:
+        outcome = "error"
+        WORKFLOW_NODE_ERRORS_TOTAL.labels(workflow_type, node).inc()
+        WORKFLOW_NODE_RETRIES_TOTAL.labels(workflow_type, node).inc(retries)
+    elif outcome == "error":
+        WORKFLOW_NODE_ERRORS_TOTAL.labels(workflow_type, node).inc()
+
+    WORKFLOW_NODE_DURATION_SECONDS.labels(workflow_type, node, outcome).observe(time.perf_counter() - started)
+
+    if isinstance(result, dict) and "data" in result:
+        size = len(json.dumps(strip_binary(result["data"]), default=str))
+        WORKFLOW_NODE_STATE_BYTES.labels(workflow_type, node).observe(size)
+
+
+def instrument_node(workflow_type: str, node: str, action: Callable) -> Callable:
+    """Wrap a node callable so every run is timed and counted."""
+    if inspect.iscoroutinefunction(action):
+        @functools.wraps(action)
+        async def instrumented(state: Any, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            retries_before = _retry_count(state)
+            outcome, result = "success", None
+            try:
+                result = await action(state, *args, **kwargs)
+                return result
+            except GraphBubbleUp:
+                outcome = "interrupted"
+                raise
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                raise
+            except Exception:
+                outcome = "error"
+                raise
+            finally:
+                _record(workflow_type, node, started, outcome, retries_before, result)
+
+        return instrumented
+
+    @functools.wraps(action)
+    def instrumented_sync(state: Any, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        retries_before = _retry_count(state)
+        outcome, result = "success", None
+        try:
+            result = action(state, *args, **kwargs)
+            return result
+        except GraphBubbleUp:
+            outcome = "interrupted"
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            _record(workflow_type, node, started, outcome, retries_before, result)
+
+    return instrumented_sync
+
+
+class InstrumentedStateGraph(StateGraph):
+    """StateGraph whose nodes are instrumented as they are added."""
+
+    def __init__(self, state_schema: Any, workflow_type: str, **kwargs: Any):
+        super().__init__(state_schema, **kwargs)
+        self.workflow_type = workflow_type
+
+    def add_node(self, node: Any, action: Any = None, **kwargs: Any) -> "InstrumentedStateGraph":
+        if isinstance(node, str) and callable(action):
+            action = instrument_node(self.workflow_type, node, action)
+        return super().add_node(node, action, **kwargs)
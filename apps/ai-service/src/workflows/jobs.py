@@ -0,0 +1,57 @@
+"""Workflow jobs: the unit of work handed to the executor or to remote workers."""
+
+import base64
+from typing import Any, Dict, TypedDict
+
+# Celery task that runs a job on a worker
+RUN_WORKFLOW_TASK = "workflows.run"
+
+
+class WorkflowJob(TypedDict, total=False):
+    """Start a workflow execution or continue its thread.
+
+    Exactly one of ``initial_state`` (start), ``resume`` (answer an interrupt)
+    or ``state_data`` (continue from the last checkpoint, falling back to this
+    persisted state if the thread has expired) is set. Jobs may be delivered more
+    than once: a start or resume whose thread already progressed continues from
+    its checkpoint, and a job for an execution that is no longer RUNNING is skipped.
+    """
+    execution_id: str
+    workflow_type: str
+    org_id: str
+    thread_id: str
+    entity_id: str
+    entity_type: str
+    initial_state: Dict[str, Any]
+    resume: Any
+    state_data: Dict[str, Any]
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {"__bytes__"}:
+            return base64.b64decode(value["__bytes__"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def encode_job(job: WorkflowJob) -> Dict[str, Any]:
+    """Make a job JSON-safe for the broker (attachment bytes become base64)."""
+    return _encode(dict(job))
+
+
+def decode_job(payload: Dict[str, Any]) -> WorkflowJob:
+    """Inverse of :func:`encode_job`."""
+    return WorkflowJob(**_decode(payload))
@@ -1,52 +1,130 @@
 """Workflow Manager - Central orchestrator for all LangGraph workflows."""
 
 import asyncio
-from typing import Dict, Any, Optional, Type
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Type
 from uuid import uuid4
 
 import structlog
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.types import Command
+from redis.exceptions import WatchError
+from prisma_client import Json
 
 from ..config import get_settings
 from ..database import get_db_client, with_tenant
+from ..valkey import get_valkey_client
 from .base import BaseWorkflow, WorkflowState
+from .checkpointer import ValkeyCheckpointSaver
+from .events import WorkflowEvent, get_event_bus
+from .executor import WorkflowExecutor
+from .jobs import RUN_WORKFLOW_TASK, WorkflowJob, encode_job
+from .progress import publish_progress
+from .state_writer import WorkflowStateWriter, strip_binary
 from .procurement import ProcurementWorkflow
 from .quote_processing import QuoteProcessingWorkflow
 from .email_processing import EmailProcessingWorkflow
 
 logger = structlog.get_logger(__name__)
 
+# Valkey channel announcing cancelled executions to every API and worker process
+CANCEL_CHANNEL = "workflow:cancel"
+
+# Valkey hash of events emitted while an execution was running, by event name
+PENDING_EVENTS_PREFIX = "workflow:pending_events:"
+
+# Value prefix of an idempotency slot claimed by a start that has not finished yet
+IDEMPOTENCY_PENDING = "pending:"
+
+
+class WorkflowStartTimeout(Exception):
+    """Raised when another start for the same entity holds its start lock for too long."""
+
 
 class WorkflowManager:
     """Central manager for all LangGraph workflows in SupplyGraph."""
     
     def __init__(self):
         self.settings = get_settings()
-        self.checkpointer = MemorySaver()  # TODO: Replace with Redis checkpointer
+        self.checkpointer = self._create_checkpointer()
         self.workflows: Dict[str, Type[BaseWorkflow]] = {
             "procurement": ProcurementWorkflow,
             "quote_processing": QuoteProcessingWorkflow,
             "email_processing": EmailProcessingWorkflow,
         }
+        self._workflow_instances: Dict[str, BaseWorkflow] = {}
         self._compiled_workflows: Dict[str, Any] = {}
+        self.compile_timings: Dict[str, float] = {}
+        self._cancel_listener: Optional[asyncio.Task] = None
+        self.executor = WorkflowExecutor(
+            concurrency_limits=self.settings.workflow_concurrency_limits,
+            default_concurrency=self.settings.workflow_default_concurrency,
+            max_queue_size=self.settings.workflow_max_queue_size,
+        )
         
         logger.info("🔄 Workflow Manager initialized", workflows=list(self.workflows.keys()))
     
+    def _create_checkpointer(self) -> BaseCheckpointSaver:
+        """Create the checkpoint store configured for this deployment."""
+        backend = self.settings.workflow_checkpoint_backend.lower()
+        
+        if backend == "memory":
+            return MemorySaver()
+        if backend == "valkey":
+            return ValkeyCheckpointSaver(
+                get_valkey_client(),
+                ttl=self.settings.workflow_checkpoint_ttl,
+                max_history=self.settings.workflow_checkpoint_history,
+            )
+        
+        raise ValueError(f"Unknown workflow checkpoint backend: {backend}")
+    
+    def _compile_workflow(self, workflow_type: str) -> Any:
+        """Build and compile a workflow graph, recording how long it took."""
+        if workflow_type not in self.workflows:
+            raise ValueError(f"Unknown workflow type: {workflow_type}")
+        
+        started = time.perf_counter()
+        workflow_class = self.workflows[workflow_type]
+        workflow_instance = workflow_class()
+        compiled_workflow = workflow_instance.compile(checkpointer=self.checkpointer)
+        duration_ms = (time.perf_counter() - started) * 1000
+        
+        self._workflow_instances[workflow_type] = workflow_instance
+        self._compiled_workflows[workflow_type] = compiled_workflow
+        self.compile_timings[workflow_type] = round(duration_ms, 2)
+        
+        logger.info("✅ Compiled workflow", workflow_type=workflow_type, duration_ms=round(duration_ms, 2))
+        
+        return compiled_workflow
+    
+    async def warmup(self) -> Dict[str, float]:
+        """Compile every registered workflow type up front."""
+        started = time.perf_counter()
+        
+        for workflow_type in self.workflows:
+            if workflow_type not in self._compiled_workflows:
+                self._compile_workflow(workflow_type)
+        
+        total_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            "🔥 Workflow warmup complete",
+            workflows=list(self._compiled_workflows.keys()),
+            compile_timings_ms=self.compile_timings,
+            total_ms=round(total_ms, 2),
+        )
+        
+        return dict(self.compile_timings)
+    
     async def get_workflow(self, workflow_type: str) -> Any:
         """Get a compiled workflow by type."""
         if workflow_type not in self._compiled_workflows:
-            if workflow_type not in self.workflows:
-                raise ValueError(f"Unknown workflow type: {workflow_type}")
-            
-            workflow_class = self.workflows[workflow_type]
-            workflow_instance = workflow_class()
-            compiled_workflow = workflow_instance.compile(checkpointer=self.checkpointer)
-            
-            self._compiled_workflows[workflow_type] = compiled_workflow
-            
-            logger.info("✅ Compiled workflow", workflow_type=workflow_type)
+            return self._compile_workflow(workflow_type)
         
         return self._compiled_workflows[workflow_type]
     
@@ -58,12 +136,195 @@ class WorkflowManager:
         entity_type: str,
         initial_state: Dict[str, Any],
         thread_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> str:
-        """Start a new workflow execution."""
+        """
+        Start a new workflow execution.
+        
+        Starts are deduplicated across replicas: a repeated ``idempotency_key``,
+        or a start for an entity that already has an unfinished execution of
+        this workflow type, returns the existing execution ID instead.
+        """
+        # Fails fast on unknown workflow types
+        await self.get_workflow(workflow_type)
+        
+        idempotency_slot = f"workflow:idempotency:{org_id}:{idempotency_key}" if idempotency_key else None
+        
+        async with self._idempotency_slot(idempotency_slot) as existing:
+            if existing:
+                logger.info("♻️ Idempotent workflow start", idempotency_key=idempotency_key)
+                return existing.decode()
+            
+            async with self._start_lock(org_id, [(workflow_type, entity_id)]):
+                execution_id = await self._find_active_execution(org_id, workflow_type, entity_id)
+                
+                if execution_id:
+                    logger.info(
+                        "♻️ Workflow already running for entity",
+                        workflow_type=workflow_type,
+                        entity_id=entity_id,
+                        execution_id=execution_id,
+                    )
+                else:
+                    execution_id = await self._launch_execution(
+                        workflow_type, org_id, entity_id, entity_type, initial_state, thread_id
+                    )
+            
+            if idempotency_slot:
+                await get_valkey_client().set(
+                    idempotency_slot, execution_id, ex=self.settings.workflow_idempotency_ttl
+                )
+        
+        return execution_id
+    
+    @asynccontextmanager
+    async def _idempotency_slot(self, slot: Optional[str]) -> AsyncIterator[Optional[bytes]]:
+        """
+        Claim an idempotency slot for one start, atomically across replicas.
+        
+        Yields the stored result if an earlier start with the same key finished,
+        else None once the slot is claimed with a pending marker; the caller then
+        launches the work and overwrites the marker with its result. A start that
+        finds another one's marker waits up to ``workflow_start_lock_wait`` seconds
+        for its result before raising ``WorkflowStartTimeout``. The marker is
+        removed if the claiming start fails, so the key can be retried.
+        """
+        if slot is None:
+            yield None
+            return
+        
+        valkey = get_valkey_client()
+        marker = f"{IDEMPOTENCY_PENDING}{uuid4().hex}"
+        deadline = time.monotonic() + self.settings.workflow_start_lock_wait
+        
+        while True:
+            # The TTL frees the slot if the claiming replica dies mid-start
+            if await valkey.set(slot, marker, nx=True, ex=self.settings.workflow_start_lock_ttl):
+                break
+            
+            existing = await valkey.get(slot)
+            if existing and not existing.startswith(IDEMPOTENCY_PENDING.encode()):
+                yield existing
+                return
+            
+            if time.monotonic() >= deadline:
+                raise WorkflowStartTimeout("A start with this idempotency key is still in progress")
+            await asyncio.sleep(0.05)
+        
+        try:
+            yield None
+        except BaseException:
+            await self._release_start_lock(slot, marker)
+            raise
+    
+    @asynccontextmanager
+    async def _start_lock(self, org_id: str, entities: List[Tuple[str, str]]) -> AsyncIterator[None]:
+        """
+        Single-flight guard so only one replica starts a workflow for an entity at a time.
+        
+        Takes the lock of every ``(workflow_type, entity_id)`` pair, waiting at most
+        ``workflow_start_lock_wait`` seconds for locks held elsewhere before raising
+        ``WorkflowStartTimeout``.
+        """
+        valkey = get_valkey_client()
+        token = uuid4().hex
+        pending = sorted({f"workflow:start:{org_id}:{workflow_type}:{entity_id}" for workflow_type, entity_id in entities})
+        held: List[str] = []
+        deadline = time.monotonic() + self.settings.workflow_start_lock_wait
+        
+        try:
+            while True:
+                # The TTL frees locks whose holder died before releasing them
+                async with valkey.pipeline(transaction=False) as pipe:
+                    for key in pending:
+                        pipe.set(key, token, nx=True, ex=self.settings.workflow_start_lock_ttl)
+                    acquired = await pipe.execute()
+                
+                held.extend(key for key, ok in zip(pending, acquired) if ok)
+                pending = [key for key, ok in zip(pending, acquired) if not ok]
+                if not pending:
+                    break
+                
+                if time.monotonic() >= deadline:
+                    raise WorkflowStartTimeout(
+                        f"Another start is still in progress for {len(pending)} of these entities"
+                    )
+                await asyncio.sleep(0.05)
+            
+            yield
+        finally:
+            for key in held:
+                await self._release_start_lock(key, token)
+    
+    async def _release_start_lock(self, key: str, token: str) -> None:
+        """Release only our own lock or claim, in case it expired and was taken over."""
+        try:
+            async with get_valkey_client().pipeline(transaction=True) as pipe:
+                await pipe.watch(key)
+                if await pipe.get(key) == token.encode():
+                    pipe.multi()
+                    pipe.delete(key)
+                    await pipe.execute()
+                else:
+                    await pipe.unwatch()
+        except WatchError:
+            pass
+    
+    async def _find_active_execution(self, org_id: str, workflow_type: str, entity_id: str) -> Optional[str]:
+        """ID of an unfinished execution of this workflow type for the entity, if any."""
+        async with with_tenant(org_id) as db:
+            execution = await db.workflowexecution.find_first(
+                where={
+                    "orgId": org_id,
+                    "workflowType": workflow_type,
+                    "entityId": entity_id,
+                    "status": {"in": ["PENDING", "RUNNING"]},
+                },
+                order={"startedAt": "desc"},
+            )
+        
+        return execution.id if execution else None
+    
+    async def _find_active_executions(
+        self, org_id: str, entities: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], str]:
+        """IDs of unfinished executions for each ``(workflow_type, entity_id)`` pair, in one query."""
+        async with with_tenant(org_id) as db:
+            executions = await db.workflowexecution.find_many(
+                where={
+                    "orgId": org_id,
+                    "workflowType": {"in": sorted({workflow_type for workflow_type, _ in entities})},
+                    "entityId": {"in": sorted({entity_id for _, entity_id in entities})},
+                    "status": {"in": ["PENDING", "RUNNING"]},
+                },
+                order={"startedAt": "desc"},
+            )
+        
+        wanted = set(entities)
+        active: Dict[Tuple[str, str], str] = {}
+        for execution in executions:
+            key = (execution.workflowType, execution.entityId)
+            if key in wanted:
+                # Newest first, like _find_active_execution
+                active.setdefault(key, execution.id)
+        
+        return active
+    
+    async def _launch_execution(
+        self,
+        workflow_type: str,
+        org_id: str,
+        entity_id: str,
+        entity_type: str,
+        initial_state: Dict[str, Any],
+        thread_id: Optional[str],
+    ) -> str:
+        """Record a new execution and dispatch it."""
         if thread_id is None:
             thread_id = f"{workflow_type}_{entity_id}_{uuid4().hex[:8]}"
         
-        workflow = await self.get_workflow(workflow_type)
+        # Reject before touching the database if this workflow type is saturated
+        self.executor.check_capacity(workflow_type)
         
         # Create workflow execution record
         async with with_tenant(org_id) as db:
@@ -74,18 +335,24 @@ class WorkflowManager:
                     "entityId": entity_id,
                     "entityType": entity_type,
                     "currentState": "START",
-                    "stateData": initial_state,
+                    "stateData": Json(strip_binary(initial_state)),
                     "status": "RUNNING",
+                    "checkpoints": Json({"thread_id": thread_id}),
                 }
             )
         
-        # Start workflow execution
-        config = {"configurable": {"thread_id": thread_id}}
-        
         try:
-            # Run workflow asynchronously
-            asyncio.create_task(
-                self._execute_workflow(workflow, initial_state, config, execution.id, org_id)
+            # Run workflow asynchronously, here or on a worker
+            self._dispatch(
+                WorkflowJob(
+                    execution_id=execution.id,
+                    workflow_type=workflow_type,
+                    org_id=org_id,
+                    thread_id=thread_id,
+                    entity_id=entity_id,
+                    entity_type=entity_type,
+                    initial_state=initial_state,
+                )
             )
             
             logger.info(
@@ -118,57 +385,442 @@ class WorkflowManager:
             )
             raise
     
+    async def start_many(
+        self,
+        org_id: str,
+        requests: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Start a batch of workflow executions for one tenant.
+        
+        Each request has ``workflow_type``, ``entity_id``, ``entity_type``,
+        ``initial_state`` and optionally ``thread_id``. All execution records
+        are inserted with a single ``create_many`` in one transaction, then the
+        runs are dispatched together. Returns execution IDs in request order.
+        
+        Starts are deduplicated like ``start_workflow``: a repeated
+        ``idempotency_key`` returns the IDs of the first batch, and requests for
+        an entity with an unfinished execution of the same workflow type (or
+        repeated within the batch) return that execution's ID.
+        """
+        if len(requests) > self.settings.workflow_batch_max_size:
+            raise ValueError(
+                f"Batch of {len(requests)} exceeds the limit of {self.settings.workflow_batch_max_size}"
+            )
+        
+        for workflow_type in {request["workflow_type"] for request in requests}:
+            await self.get_workflow(workflow_type)
+        
+        idempotency_slot = f"workflow:idempotency:batch:{org_id}:{idempotency_key}" if idempotency_key else None
+        
+        async with self._idempotency_slot(idempotency_slot) as existing:
+            if existing:
+                logger.info("♻️ Idempotent workflow batch start", idempotency_key=idempotency_key)
+                return json.loads(existing)
+            
+            result = await self._start_batch(org_id, requests)
+            
+            if idempotency_slot:
+                await get_valkey_client().set(
+                    idempotency_slot, json.dumps(result), ex=self.settings.workflow_idempotency_ttl
+                )
+        
+        return result
+    
+    async def _start_batch(self, org_id: str, requests: List[Dict[str, Any]]) -> List[str]:
+        """Launch the requests of ``start_many`` that have no unfinished execution yet."""
+        entities = [(request["workflow_type"], request["entity_id"]) for request in requests]
+        
+        async with self._start_lock(org_id, entities):
+            execution_ids = await self._find_active_executions(org_id, entities)
+            launched = len(execution_ids)
+            
+            # create_many does not return rows, so IDs are assigned here
+            jobs: List[WorkflowJob] = []
+            for request, entity in zip(requests, entities):
+                if entity in execution_ids:
+                    continue
+                
+                job = WorkflowJob(
+                    execution_id=uuid4().hex,
+                    workflow_type=request["workflow_type"],
+                    org_id=org_id,
+                    thread_id=request.get("thread_id")
+                    or f"{request['workflow_type']}_{request['entity_id']}_{uuid4().hex[:8]}",
+                    entity_id=request["entity_id"],
+                    entity_type=request["entity_type"],
+                    initial_state=request["initial_state"],
+                )
+                execution_ids[entity] = job["execution_id"]
+                jobs.append(job)
+            
+            counts: Dict[str, int] = {}
+            for job in jobs:
+                counts[job["workflow_type"]] = counts.get(job["workflow_type"], 0) + 1
+            
+            # Workers apply their own admission control when jobs are queued remotely
+            if self.settings.workflow_dispatch != "celery":
+                for workflow_type, count in counts.items():
+                    self.executor.check_capacity(workflow_type, count)
+            
+            if jobs:
+                await self._insert_and_dispatch(org_id, jobs)
+        
+        if launched:
+            logger.info("♻️ Workflows already running for entities", org_id=org_id, count=launched)
+        
+        logger.info(
+            "🚀 Started workflow batch",
+            org_id=org_id,
+            count=len(jobs),
+            workflow_types=counts,
+        )
+        
+        return [execution_ids[entity] for entity in entities]
+    
+    async def _insert_and_dispatch(self, org_id: str, jobs: List[WorkflowJob]) -> None:
+        """Insert the execution records of a batch atomically, then dispatch each job."""
+        # with_tenant runs in one transaction, so the batch is inserted atomically
+        async with with_tenant(org_id) as db:
+            await db.workflowexecution.create_many(
+                data=[
+                    {
+                        "id": job["execution_id"],
+                        "orgId": org_id,
+                        "workflowType": job["workflow_type"],
+                        "entityId": job["entity_id"],
+                        "entityType": job["entity_type"],
+                        "currentState": "START",
+                        "stateData": Json(strip_binary(job["initial_state"])),
+                        "status": "RUNNING",
+                        "checkpoints": Json({"thread_id": job["thread_id"]}),
+                    }
+                    for job in jobs
+                ]
+            )
+        
+        failed: Dict[str, str] = {}
+        for job in jobs:
+            try:
+                self._dispatch(job)
+            except Exception as e:
+                failed[job["execution_id"]] = str(e)
+        
+        if failed:
+            # Rare path (e.g. broker down): mark only the executions that never left
+            async with with_tenant(org_id) as db:
+                for execution_id, error in failed.items():
+                    await db.workflowexecution.update(
+                        where={"id": execution_id},
+                        data={"status": "FAILED", "errorMessage": error, "completedAt": datetime.now()},
+                    )
+            logger.error("❌ Failed to dispatch workflows", org_id=org_id, failed=len(failed))
+    
+    def _dispatch(self, job: WorkflowJob) -> None:
+        """Hand a job to the local executor or to the worker queue of its workflow type."""
+        if self.settings.workflow_dispatch == "celery":
+            # Imported lazily: the worker module imports this one
+            from ..worker import celery_app
+            
+            queue = self.settings.workflow_queues.get(
+                job["workflow_type"], self.settings.workflow_default_queue
+            )
+            celery_app.send_task(
+                RUN_WORKFLOW_TASK,
+                args=[encode_job(job)],
+                queue=queue,
+                task_id=job["execution_id"],
+            )
+            logger.info("📤 Workflow job queued", execution_id=job["execution_id"], queue=queue)
+            return
+        
+        self.executor.submit(job["workflow_type"], job["execution_id"], lambda: self._run_job(job))
+    
+    async def execute_job(self, job: WorkflowJob) -> None:
+        """Run a job in this process behind the executor and wait for it (used by workers)."""
+        await self.executor.submit(job["workflow_type"], job["execution_id"], lambda: self._run_job(job))
+    
+    async def _run_job(self, job: WorkflowJob) -> None:
+        """Build the graph input for a job and execute it."""
+        workflow_type = job["workflow_type"]
+        workflow = await self.get_workflow(workflow_type)
+        config = {"configurable": {"thread_id": job["thread_id"]}}
+        
+        # Workers redeliver a job whose process died mid-run; by then the execution
+        # may have finished, been cancelled or suspended, and must not run again
+        status = await self._execution_status(job["execution_id"], job["org_id"])
+        if status != "RUNNING":
+            logger.info("⏭️ Skipping workflow job", execution_id=job["execution_id"], status=status)
+            return
+        
+        snapshot = await workflow.aget_state(config)
+        
+        if "resume" in job and snapshot.interrupts:
+            graph_input = Command(resume=job["resume"])
+        elif "initial_state" in job and not snapshot.values:
+            graph_input = self._workflow_instances[workflow_type].create_initial_state(
+                workflow_id=job["thread_id"],
+                org_id=job["org_id"],
+                entity_id=job["entity_id"],
+                entity_type=job["entity_type"],
+                data=job["initial_state"],
+            )
+        else:
+            # Redelivered jobs continue from the checkpoint, so completed nodes
+            # (e.g. sending RFQs) are not run a second time
+            graph_input = await self._continuation_input(workflow, config, job)
+        
+        await self._execute_workflow(
+            workflow, graph_input, config, job["execution_id"], job["org_id"], workflow_type
+        )
+    
+    async def _execution_status(self, execution_id: str, org_id: str) -> Optional[str]:
+        """Current status of an execution, or None if its record is gone."""
+        async with with_tenant(org_id) as db:
+            execution = await db.workflowexecution.find_unique(where={"id": execution_id})
+        
+        return execution.status if execution else None
+    
+    async def _continuation_input(
+        self, workflow: Any, config: Dict[str, Any], job: WorkflowJob
+    ) -> Any:
+        """
+        Input that continues a thread from its last checkpoint.
+        
+        Nodes that already completed are not run again; only the node that
+        failed (or was interrupted) and the ones after it execute. If the
+        thread's checkpoints are gone, the workflow restarts from the state
+        persisted on the execution row.
+        """
+        snapshot = await workflow.aget_state(config)
+        
+        if snapshot.values:
+            if snapshot.interrupts:
+                # Let the waiting node re-check its condition now
+                return Command(resume={"manual": True})
+            return None
+        
+        logger.warning(
+            "⚠️ No checkpoint for workflow thread, restarting from persisted state",
+            execution_id=job["execution_id"],
+            thread_id=job["thread_id"],
+        )
+        
+        return self._workflow_instances[job["workflow_type"]].create_initial_state(
+            workflow_id=job["thread_id"],
+            org_id=job["org_id"],
+            entity_id=job["entity_id"],
+            entity_type=job["entity_type"],
+            data=job.get("state_data") or {},
+        )
+    
     async def _execute_workflow(
         self,
         workflow: Any,
-        initial_state: Dict[str, Any],
+        initial_state: Any,
         config: Dict[str, Any],
         execution_id: str,
         org_id: str,
+        workflow_type: str,
     ) -> None:
-        """Execute a workflow and update its status."""
+        """Execute a workflow (or resume it with a ``Command``) and update its status."""
+        writer = WorkflowStateWriter(
+            execution_id,
+            org_id,
+            workflow_type,
+            flush_interval=self.settings.workflow_state_flush_interval,
+        )
+        
+        # Identifies the execution in progress events
+        progress = {"org_id": org_id, "execution_id": execution_id, "workflow_type": workflow_type}
+        
         try:
-            # Execute the workflow
-            final_state = None
-            async for state in workflow.astream(initial_state, config):
-                final_state = state
+            # Trail entries of earlier runs on this thread are already in the audit log
+            snapshot = await workflow.aget_state(config)
+            trail = snapshot.values.get("messages") if snapshot.values else None
+            if trail:
+                writer.trail_seq = trail[-1].get("seq", 0)
+            
+            values = snapshot.values or (initial_state if isinstance(initial_state, dict) else {})
+            progress.update(entity_type=values.get("entity_type"), entity_id=values.get("entity_id"))
+            
+            # Execute the workflow, persisting coalesced state deltas as it goes
+            async for chunk in workflow.astream(initial_state, config, stream_mode="updates"):
+                if "__interrupt__" in chunk:
+                    continue
                 
-                # Update current state in database
-                async with with_tenant(org_id) as db:
-                    await db.workflowexecution.update(
-                        where={"id": execution_id},
-                        data={
-                            "stateData": final_state,
-                            "currentState": final_state.get("current_step", "UNKNOWN"),
-                        }
-                    )
+                writer.record(chunk)
+                await publish_progress(**progress, status="RUNNING", current_step=writer.current_step)
+                await writer.maybe_flush()
             
-            # Mark as completed
-            async with with_tenant(org_id) as db:
-                await db.workflowexecution.update(
-                    where={"id": execution_id},
-                    data={
-                        "status": "COMPLETED",
-                        "completedAt": "now()",
-                        "stateData": final_state,
-                    }
-                )
+            # A node suspended the thread until an external event arrives
+            snapshot = await workflow.aget_state(config)
+            if snapshot.interrupts:
+                await self._suspend_execution(snapshot, config, execution_id, writer, progress)
+                return
+            
+            # Mark as completed together with the last pending changes
+            await writer.flush(status="COMPLETED")
+            await publish_progress(**progress, status="COMPLETED", current_step=writer.current_step)
             
-            logger.info("✅ Workflow completed", execution_id=execution_id)
+            logger.info("✅ Workflow completed", execution_id=execution_id, state_bytes_written=writer.bytes_written)
             
         except Exception as e:
             # Mark as failed
-            async with with_tenant(org_id) as db:
+            await writer.flush(status="FAILED", error_message=str(e))
+            await publish_progress(
+                **progress, status="FAILED", current_step=writer.current_step, error_message=str(e)
+            )
+            
+            logger.error("❌ Workflow failed", execution_id=execution_id, error=str(e))
+        finally:
+            writer.observe()
+    
+    async def _suspend_execution(
+        self,
+        snapshot: Any,
+        config: Dict[str, Any],
+        execution_id: str,
+        writer: WorkflowStateWriter,
+        progress: Dict[str, Any],
+    ) -> None:
+        """Park an interrupted execution until the event it waits for is emitted."""
+        request = snapshot.interrupts[0].value
+        waiting_for = request.get("wait_for", []) if isinstance(request, dict) else []
+        
+        await writer.flush(
+            status="PENDING",
+            current_state=snapshot.next[0] if snapshot.next else "UNKNOWN",
+            checkpoints={
+                "thread_id": config["configurable"]["thread_id"],
+                "waiting_for": waiting_for,
+            },
+        )
+        
+        await publish_progress(
+            **progress, status="PENDING", current_step=writer.current_step, waiting_for=waiting_for
+        )
+        
+        logger.info("⏸️ Workflow waiting for event", execution_id=execution_id, waiting_for=waiting_for)
+        
+        # The event may have been emitted while this execution was still running
+        await self._deliver_parked_event(
+            execution_id, progress["workflow_type"], config["configurable"]["thread_id"], waiting_for
+        )
+    
+    async def handle_event(self, event: WorkflowEvent) -> None:
+        """Resume executions of the event's entity that are waiting for it."""
+        async with with_tenant(event["org_id"]) as db:
+            executions = await db.workflowexecution.find_many(
+                where={
+                    "entityId": event["entity_id"],
+                    "entityType": event["entity_type"],
+                    "status": {"in": ["PENDING", "RUNNING"]},
+                }
+            )
+        
+        for execution in executions:
+            if execution.status == "RUNNING":
+                # Possibly on another replica or worker; it picks the event up when it suspends
+                await self._park_event(execution.id, event)
+                continue
+            
+            checkpoints = execution.checkpoints or {}
+            if event["name"] not in checkpoints.get("waiting_for", []):
+                continue
+            
+            await self._resume_waiting_execution(
+                execution.id, execution.workflowType, checkpoints.get("thread_id", execution.id), event
+            )
+    
+    async def _park_event(self, execution_id: str, event: WorkflowEvent) -> None:
+        """Keep an event for a running execution in Valkey, where every process can see it."""
+        valkey = get_valkey_client()
+        key = f"{PENDING_EVENTS_PREFIX}{execution_id}"
+        
+        async with valkey.pipeline(transaction=True) as pipe:
+            pipe.hset(key, event["name"], json.dumps(event))
+            pipe.expire(key, self.settings.workflow_pending_event_ttl)
+            await pipe.execute()
+        
+        # The execution may have suspended after we read it as running, before the event was parked
+        async with with_tenant(event["org_id"]) as db:
+            execution = await db.workflowexecution.find_unique(where={"id": execution_id})
+        
+        if execution and execution.status == "PENDING":
+            checkpoints = execution.checkpoints or {}
+            await self._deliver_parked_event(
+                execution_id,
+                execution.workflowType,
+                checkpoints.get("thread_id", execution_id),
+                checkpoints.get("waiting_for", []),
+            )
+    
+    async def _deliver_parked_event(
+        self,
+        execution_id: str,
+        workflow_type: str,
+        thread_id: str,
+        waiting_for: List[str],
+    ) -> None:
+        """Resume a suspended execution with a parked event it waits for, if there is one."""
+        valkey = get_valkey_client()
+        key = f"{PENDING_EVENTS_PREFIX}{execution_id}"
+        
+        for name in waiting_for:
+            # Read and remove atomically so only one process delivers the event
+            async with valkey.pipeline(transaction=True) as pipe:
+                pipe.hget(key, name)
+                pipe.hdel(key, name)
+                raw, removed = await pipe.execute()
+            
+            if removed:
+                await self._resume_waiting_execution(execution_id, workflow_type, thread_id, json.loads(raw))
+                return
+    
+    async def _resume_waiting_execution(
+        self,
+        execution_id: str,
+        workflow_type: str,
+        thread_id: str,
+        event: WorkflowEvent,
+    ) -> None:
+        """Claim a PENDING execution and continue its thread with the event payload."""
+        async with with_tenant(event["org_id"]) as db:
+            # Only one replica may claim the wakeup
+            claimed = await db.workflowexecution.update_many(
+                where={"id": execution_id, "status": "PENDING"},
+                data={"status": "RUNNING"},
+            )
+        
+        if not claimed:
+            return
+        
+        try:
+            self._dispatch(
+                WorkflowJob(
+                    execution_id=execution_id,
+                    workflow_type=workflow_type,
+                    org_id=event["org_id"],
+                    thread_id=thread_id,
+                    resume=event["payload"],
+                )
+            )
+        except Exception:
+            # Leave it waiting so the next event (or a manual resume) can pick it up
+            async with with_tenant(event["org_id"]) as db:
                 await db.workflowexecution.update(
                     where={"id": execution_id},
-                    data={
-                        "status": "FAILED",
-                        "errorMessage": str(e),
-                        "completedAt": "now()",
-                    }
+                    data={"status": "PENDING"},
                 )
-            
-            logger.error("❌ Workflow failed", execution_id=execution_id, error=str(e))
+            raise
+        
+        logger.info(
+            "▶️ Resumed workflow on event",
+            execution_id=execution_id,
+            event_name=event["name"],
+        )
     
     async def get_workflow_status(self, execution_id: str, org_id: str) -> Dict[str, Any]:
         """Get the current status of a workflow execution."""
@@ -191,36 +843,144 @@ class WorkflowManager:
                 "completed_at": execution.completedAt,
                 "error_message": execution.errorMessage,
                 "state_data": execution.stateData,
+                "thread_id": (execution.checkpoints or {}).get("thread_id", execution.id),
             }
     
     async def resume_workflow(self, execution_id: str, org_id: str) -> None:
-        """Resume a paused or failed workflow."""
+        """Resume a paused or failed workflow from its last checkpoint."""
         execution = await self.get_workflow_status(execution_id, org_id)
         
         if execution["status"] not in ["FAILED", "PENDING"]:
             raise ValueError(f"Cannot resume workflow in status: {execution['status']}")
         
-        workflow = await self.get_workflow(execution["workflow_type"])
-        config = {"configurable": {"thread_id": execution_id}}
+        self.executor.check_capacity(execution["workflow_type"])
         
-        # Resume from last checkpoint
-        await self._execute_workflow(
-            workflow,
-            execution["state_data"],
-            config,
-            execution_id,
-            org_id,
-        )
+        async with with_tenant(org_id) as db:
+            # Guards against resuming the same execution twice
+            claimed = await db.workflowexecution.update_many(
+                where={"id": execution_id, "status": execution["status"]},
+                data={"status": "RUNNING", "errorMessage": None},
+            )
+        
+        if not claimed:
+            raise ValueError(f"Workflow execution is already being resumed: {execution_id}")
+        
+        try:
+            self._dispatch(
+                WorkflowJob(
+                    execution_id=execution_id,
+                    workflow_type=execution["workflow_type"],
+                    org_id=org_id,
+                    thread_id=execution["thread_id"],
+                    entity_id=execution["entity_id"],
+                    entity_type=execution["entity_type"],
+                    state_data=execution["state_data"],
+                )
+            )
+        except Exception:
+            async with with_tenant(org_id) as db:
+                await db.workflowexecution.update(
+                    where={"id": execution_id},
+                    data={"status": execution["status"]},
+                )
+            raise
+        
+        logger.info("▶️ Resumed workflow", execution_id=execution_id, thread_id=execution["thread_id"])
+    
+    async def shutdown(self) -> None:
+        """Stop accepting workflows and drain in-flight executions."""
+        await self.stop_cancellation_listener()
+        await self.executor.shutdown(self.settings.workflow_shutdown_timeout)
     
     async def cancel_workflow(self, execution_id: str, org_id: str) -> None:
-        """Cancel a running workflow."""
+        """Cancel a workflow and stop its execution wherever it runs."""
         async with with_tenant(org_id) as db:
-            await db.workflowexecution.update(
-                where={"id": execution_id},
+            # Only unfinished executions; the execution never overwrites CANCELLED
+            cancelled = await db.workflowexecution.update_many(
+                where={"id": execution_id, "status": {"in": ["PENDING", "RUNNING"]}},
                 data={
                     "status": "CANCELLED",
-                    "completedAt": "now()",
+                    "completedAt": datetime.now(),
                 }
             )
+            execution = await db.workflowexecution.find_unique(where={"id": execution_id}) if cancelled else None
         
-        logger.info("🛑 Workflow cancelled", execution_id=execution_id)
\ No newline at end of file
+        if not cancelled:
+            raise ValueError(f"No running workflow execution found: {execution_id}")
+        
+        await publish_progress(
+            org_id,
+            execution_id,
+            execution.workflowType,
+            execution.entityType,
+            execution.entityId,
+            status="CANCELLED",
+            current_step=execution.currentState,
+        )
+        
+        if not self._cancel_local_execution(execution_id):
+            if self.settings.workflow_dispatch == "celery":
+                from ..worker import celery_app
+                
+                # Drops the job if it is still queued on the broker
+                celery_app.control.revoke(execution_id)
+            
+            # Running in another process: let its listener cancel it
+            await get_valkey_client().publish(CANCEL_CHANNEL, execution_id)
+        
+        logger.info("🛑 Workflow cancelled", execution_id=execution_id)
+    
+    def _cancel_local_execution(self, execution_id: str) -> bool:
+        """Cancel the execution's task if it is queued or running in this process."""
+        task = self.executor.get_task(execution_id)
+        if task is None or task.done():
+            return False
+        
+        # Propagates CancelledError into the in-flight LLM, HTTP or Docling await
+        task.cancel()
+        return True
+    
+    async def start_cancellation_listener(self) -> None:
+        """Cancel local executions when another process cancels them."""
+        if self._cancel_listener is None:
+            self._cancel_listener = asyncio.create_task(
+                self._listen_for_cancellations(), name="workflow-cancellations"
+            )
+    
+    async def stop_cancellation_listener(self) -> None:
+        """Stop listening for cancellations from other processes."""
+        if self._cancel_listener is not None:
+            self._cancel_listener.cancel()
+            await asyncio.gather(self._cancel_listener, return_exceptions=True)
+            self._cancel_listener = None
+    
+    async def _listen_for_cancellations(self) -> None:
+        while True:
+            try:
+                async with get_valkey_client().pubsub() as pubsub:
+                    await pubsub.subscribe(CANCEL_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        execution_id = message["data"].decode()
+                        if self._cancel_local_execution(execution_id):
+                            logger.info("🛑 Cancelled workflow on request", execution_id=execution_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("❌ Workflow cancellation listener failed", error=str(e))
+                await asyncio.sleep(1)
+
+# Process-wide workflow manager instance
+_workflow_manager: Optional[WorkflowManager] = None
+
+
+def get_workflow_manager() -> WorkflowManager:
+    """Get the process-wide workflow manager, creating it on first use."""
+    global _workflow_manager
+    
+    if _workflow_manager is None:
+        _workflow_manager = WorkflowManager()
+        get_event_bus().subscribe(_workflow_manager.handle_event)
+    
+    return _workflow_manager
@@ -8,6 +8,8 @@ import structlog
 from langgraph.graph import START, END
 
 from .base import BaseWorkflow, WorkflowState, ConditionalRouter
+from .timers import get_timer_service
+from ..config import get_settings
 from ..database import with_tenant
 from ..services.email_service import EmailService
 from ..services.vendor_service import VendorService
@@ -22,6 +24,8 @@ class ProcurementWorkflow(BaseWorkflow):
     States: CREATED → QUOTES_REQUESTED → QUOTES_RECEIVED → UNDER_REVIEW → APPROVED → PAID → COMPLETED
     """
     
+    workflow_type = "procurement"
+    
     def _setup_graph(self) -> None:
         """Setup the procurement workflow graph."""
         
@@ -143,14 +147,8 @@ class ProcurementWorkflow(BaseWorkflow):
             
             vendor_service = VendorService()
             
-            # Get vendors for the organization
-            async with with_tenant(state["org_id"]) as db:
-                vendors = await db.vendor.find_many(
-                    where={
-                        "orgId": state["org_id"],
-                        "isActive": True,
-                    }
-                )
+            # Get vendors for the organization (served from the vendor cache)
+            vendors = await vendor_service.get_vendors_for_org(state["org_id"])
             
             if not vendors:
                 raise ValueError("No active vendors found for organization")
@@ -159,9 +157,9 @@ class ProcurementWorkflow(BaseWorkflow):
             # TODO: Implement intelligent vendor selection based on items, history, etc.
             selected_vendors = [
                 {
-                    "id": vendor.id,
-                    "name": vendor.name,
-                    "email": vendor.email,
+                    "id": vendor["id"],
+                    "name": vendor["name"],
+                    "email": vendor["email"],
                 }
                 for vendor in vendors
             ]
@@ -187,33 +185,41 @@ class ProcurementWorkflow(BaseWorkflow):
             selected_vendors = state["data"]["selected_vendors"]
             request_data = state["data"]
             
-            sent_count = 0
-            failed_vendors = []
-            
-            for vendor in selected_vendors:
-                try:
-                    # Generate RFQ email content
-                    email_content = await self._generate_rfq_email(request_data, vendor)
-                    
-                    # Send email
-                    await email_service.send_rfq_email(
-                        vendor_email=vendor["email"],
-                        vendor_name=vendor["name"],
-                        subject=f"RFQ: {request_data['title']}",
-                        content=email_content,
-                        request_id=state["entity_id"],
-                    )
-                    
-                    sent_count += 1
-                    
-                except Exception as e:
-                    logger.error(
-                        "Failed to send RFQ to vendor",
-                        vendor_id=vendor["id"],
-                        vendor_email=vendor["email"],
-                        error=str(e),
-                    )
-                    failed_vendors.append(vendor)
+            # Vendors are contacted concurrently, up to the configured cap
+            semaphore = asyncio.Semaphore(get_settings().rfq_send_concurrency)
+            
+            async def send_to_vendor(vendor: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        # Generate RFQ email content
+                        email_content = await self._generate_rfq_email(request_data, vendor)
+                        
+                        # Send email
+                        message_id = await email_service.send_rfq_email(
+                            vendor_email=vendor["email"],
+                            vendor_name=vendor["name"],
+                            subject=f"RFQ: {request_data['title']}",
+                            content=email_content,
+                            request_id=state["entity_id"],
+                        )
+                        
+                        return {"status": "sent", "message_id": message_id}
+                        
+                    except Exception as e:
+                        logger.error(
+                            "Failed to send RFQ to vendor",
+                            vendor_id=vendor["id"],
+                            vendor_email=vendor["email"],
+                            error=str(e),
+                        )
+                        return {"status": "failed", "error": str(e)}
+            
+            results = await asyncio.gather(*(send_to_vendor(vendor) for vendor in selected_vendors))
+            
+            sent_count = sum(1 for result in results if result["status"] == "sent")
+            failed_vendors = [
+                vendor for vendor, result in zip(selected_vendors, results) if result["status"] == "failed"
+            ]
             
             if sent_count == 0:
                 raise ValueError("Failed to send RFQ to any vendors")
@@ -227,6 +233,9 @@ class ProcurementWorkflow(BaseWorkflow):
             
             state["data"]["rfq_sent_count"] = sent_count
             state["data"]["rfq_failed_vendors"] = failed_vendors
+            state["data"]["rfq_results"] = {
+                vendor["id"]: result for vendor, result in zip(selected_vendors, results)
+            }
             state["data"]["rfq_sent_at"] = datetime.now().isoformat()
             
             state = await self.log_step(
@@ -256,14 +265,17 @@ class ProcurementWorkflow(BaseWorkflow):
             
             # Check if we have received quotes or if timeout has passed
             rfq_sent_at = datetime.fromisoformat(state["data"]["rfq_sent_at"])
-            timeout_hours = 48  # 48 hour timeout for quotes
-            is_timeout = datetime.now() > rfq_sent_at + timedelta(hours=timeout_hours)
+            quote_deadline = rfq_sent_at + timedelta(hours=get_settings().rfq_quote_timeout_hours)
+            is_timeout = datetime.now() >= quote_deadline
             
             state["data"]["quotes_received_count"] = quote_count
             state["data"]["quotes_expected_count"] = expected_count
             state["data"]["is_timeout"] = is_timeout
             
             if quote_count > 0:
+                await get_timer_service().cancel(
+                    state["org_id"], state["entity_type"], state["entity_id"], "quote_deadline_reached"
+                )
                 state["data"]["monitoring_status"] = "quotes_received"
                 state = await self.log_step(
                     state,
@@ -278,6 +290,14 @@ class ProcurementWorkflow(BaseWorkflow):
                     f"⏰ Timeout reached, processing {quote_count} quotes"
                 )
             else:
+                # Wake up when the deadline passes even if no vendor ever answers
+                await get_timer_service().schedule(
+                    state["org_id"],
+                    state["entity_type"],
+                    state["entity_id"],
+                    "quote_deadline_reached",
+                    quote_deadline,
+                )
                 state["data"]["monitoring_status"] = "waiting"
                 state = await self.log_step(
                     state,
@@ -285,10 +305,14 @@ class ProcurementWorkflow(BaseWorkflow):
                     f"⏳ Waiting for quotes ({quote_count}/{expected_count})"
                 )
             
-            return state
-            
         except Exception as e:
             return await self.handle_error(state, e, "monitor_responses")
+        
+        # Suspend until a quote is stored or the deadline passes; the node re-runs on resume
+        if state["data"]["monitoring_status"] == "waiting":
+            self.wait_for_event(state, "quote_received", "quote_deadline_reached")
+        
+        return state
     
     async def process_quotes(self, state: WorkflowState) -> WorkflowState:
         """Process and normalize received quotes."""
@@ -349,18 +373,17 @@ class ProcurementWorkflow(BaseWorkflow):
         try:
             state = await self.log_step(state, "await_approval", "Awaiting approval decision")
             
-            # Update request status to under review
-            async with with_tenant(state["org_id"]) as db:
-                await db.procurementrequest.update(
-                    where={"id": state["entity_id"]},
-                    data={"status": "UNDER_REVIEW"}
-                )
-            
-            # Check if approval has been made
+            # Check if approval has been made, otherwise put the request under review
             async with with_tenant(state["org_id"]) as db:
                 request = await db.procurementrequest.find_unique(
                     where={"id": state["entity_id"]}
                 )
+                
+                if not request.approvedQuoteId and request.status != "UNDER_REVIEW":
+                    await db.procurementrequest.update(
+                        where={"id": state["entity_id"]},
+                        data={"status": "UNDER_REVIEW"}
+                    )
             
             if request.approvedQuoteId:
                 state["data"]["approval_status"] = "approved"
@@ -378,10 +401,14 @@ class ProcurementWorkflow(BaseWorkflow):
                     "⏳ Waiting for approval decision"
                 )
             
-            return state
-            
         except Exception as e:
             return await self.handle_error(state, e, "await_approval")
+        
+        # Suspend until the request is approved; the node re-runs on resume
+        if state["data"]["approval_status"] == "waiting":
+            self.wait_for_event(state, "quote_approved")
+        
+        return state
     
     async def process_payment(self, state: WorkflowState) -> WorkflowState:
         """Process payment for approved quote."""
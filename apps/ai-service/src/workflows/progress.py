@@ -0,0 +1,167 @@
+"""Live workflow progress fanned out to subscribers through Valkey pub/sub."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+import structlog
+from redis.asyncio import Redis
+
+from ..valkey import get_valkey_client
+
+logger = structlog.get_logger(__name__)
+
+# One channel per tenant: workflow:progress:<org_id>
+PROGRESS_CHANNEL_PREFIX = "workflow:progress:"
+
+TERMINAL_STATUSES = ("COMPLETED", "FAILED", "CANCELLED")
+
+
+async def publish_progress(
+    org_id: str,
+    execution_id: str,
+    workflow_type: str,
+    entity_type: Optional[str],
+    entity_id: Optional[str],
+    status: str,
+    current_step: Optional[str] = None,
+    **details: Any,
+) -> None:
+    """Announce a step or status change of an execution to every replica."""
+    event = {
+        "execution_id": execution_id,
+        "workflow_type": workflow_type,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "status": status,
+        "current_step": current_step,
+        "timestamp": datetime.now().isoformat(),
+        **details,
+    }
+
+    try:
+        await get_valkey_client().publish(PROGRESS_CHANNEL_PREFIX + org_id, json.dumps(event, default=str))
+    except Exception as e:
+        # Progress is best effort; the execution row stays authoritative
+        logger.warning("⚠️ Failed to publish workflow progress", execution_id=execution_id, error=str(e))
+
+
+class WorkflowProgressHub:
+    """
+    Delivers progress events to local subscribers (e.g. SSE connections).
+
+    Each process keeps a single pattern subscription on Valkey, however many
+    clients are connected, and copies events into per-subscriber queues.
+    Slow subscribers lose their oldest events rather than blocking the others.
+    """
+
+    def __init__(self, client: Redis, queue_size: int = 100):
+        self.client = client
+        self.queue_size = queue_size
+
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def subscribe(self, org_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Receive the progress events of one tenant while the context is open."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(org_id, set()).add(queue)
+
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(), name="workflow-progress")
+
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(org_id, set())
+            queues.discard(queue)
+            if not queues:
+                self._subscribers.pop(org_id, None)
+
+    def _deliver(self, org_id: str, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(org_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.psubscribe(PROGRESS_CHANNEL_PREFIX + "*")
+                    async for message in pubsub.listen():
+                        if message["type"] != "pmessage":
+                            continue
+                        org_id = message["channel"].decode()[len(PROGRESS_CHANNEL_PREFIX):]
+                        if org_id in self._subscribers:
+                            self._deliver(org_id, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("❌ Workflow progress listener failed", error=str(e))
+                await asyncio.sleep(1)
+
+    async def stop(self) -> None:
+        """Stop the Valkey subscription."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+
+def _sse(event: Dict[str, Any]) -> str:
+    return f"event: progress\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+async def stream_progress(
+    org_id: str,
+    matches: Callable[[Dict[str, Any]], bool],
+    snapshot: Optional[Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = None,
+    until_terminal: bool = False,
+    keepalive: float = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Server-sent events for the tenant's progress events accepted by ``matches``.
+
+    ``snapshot`` is loaded once subscribed and sent first, so a (re)connecting
+    client needs no poll and misses nothing in between. With ``until_terminal``
+    the stream ends after a terminal status.
+    """
+    async with get_progress_hub().subscribe(org_id) as queue:
+        initial = await snapshot() if snapshot is not None else None
+        if initial is not None:
+            yield _sse(initial)
+            if until_terminal and initial["status"] in TERMINAL_STATUSES:
+                return
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+
+            if not matches(event):
+                continue
+
+            yield _sse(event)
+            if until_terminal and event["status"] in TERMINAL_STATUSES:
+                return
+
+
+# Process-wide progress hub
+_progress_hub: Optional[WorkflowProgressHub] = None
+
+
+def get_progress_hub() -> WorkflowProgressHub:
+    """Get the process-wide workflow progress hub."""
+    global _progress_hub
+
+    if _progress_hub is None:
+        _progress_hub = WorkflowProgressHub(get_valkey_client())
+
+    return _progress_hub
@@ -8,9 +8,11 @@ import structlog
 from langgraph.graph import START, END
 
 from .base import BaseWorkflow, WorkflowState
+from .events import emit_workflow_event
 from ..database import with_tenant
 from ..services.docling_service import DoclingService
 from ..services.llm_service import LLMService
+from ..services.vendor_cache import get_vendor_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -22,6 +24,8 @@ class QuoteProcessingWorkflow(BaseWorkflow):
     Flow: RECEIVED → EXTRACTED → NORMALIZED → VALIDATED → STORED
     """
     
+    workflow_type = "quote_processing"
+    
     def _setup_graph(self) -> None:
         """Setup the quote processing workflow graph."""
         
@@ -246,15 +250,13 @@ class QuoteProcessingWorkflow(BaseWorkflow):
             
             # Find or create vendor
             vendor_info = normalized_quote["vendor_info"]
+            vendor_cache = get_vendor_cache()
+            cached_vendor = await vendor_cache.find_by_email(state["org_id"], vendor_info.get("email", ""))
+            vendor_id = cached_vendor["id"] if cached_vendor else None
+            vendor_created = False
+            
             async with with_tenant(state["org_id"]) as db:
-                vendor = await db.vendor.find_first(
-                    where={
-                        "orgId": state["org_id"],
-                        "email": vendor_info.get("email", ""),
-                    }
-                )
-                
-                if not vendor and vendor_info.get("email"):
+                if not vendor_id and vendor_info.get("email"):
                     # Create new vendor
                     vendor = await db.vendor.create(
                         data={
@@ -269,8 +271,10 @@ class QuoteProcessingWorkflow(BaseWorkflow):
                             }
                         }
                     )
+                    vendor_id = vendor.id
+                    vendor_created = True
                 
-                if not vendor:
+                if not vendor_id:
                     raise ValueError("Could not identify or create vendor")
                 
                 # Create quote record
@@ -278,7 +282,7 @@ class QuoteProcessingWorkflow(BaseWorkflow):
                     data={
                         "orgId": state["org_id"],
                         "requestId": request_id,
-                        "vendorId": vendor.id,
+                        "vendorId": vendor_id,
                         "items": normalized_quote["items"],
                         "totalAmount": normalized_quote["total_amount"],
                         "currency": normalized_quote["pricing"].get("currency", "USD"),
@@ -295,8 +299,20 @@ class QuoteProcessingWorkflow(BaseWorkflow):
                     }
                 )
             
+            if vendor_created:
+                await vendor_cache.invalidate(state["org_id"])
+            
             state["data"]["quote_id"] = quote.id
-            state["data"]["vendor_id"] = vendor.id
+            state["data"]["vendor_id"] = vendor_id
+            
+            # Wake up the procurement workflow waiting for quotes on this request
+            await emit_workflow_event(
+                state["org_id"],
+                "ProcurementRequest",
+                request_id,
+                "quote_received",
+                {"quote_id": quote.id},
+            )
             state = await self.log_step(
                 state,
                 "store_quote",
@@ -0,0 +1,181 @@
+"""Write-behind persistence of workflow state to the workflow_executions row."""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import structlog
+from prisma_client import Json
+
+from ..database import with_tenant
+from ..metrics import WORKFLOW_STATE_BYTES_WRITTEN
+
+logger = structlog.get_logger(__name__)
+
+
+def strip_binary(value: Any) -> Any:
+    """Replace raw bytes (e.g. attachment content) with their size."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"omitted_bytes": len(value)}
+    if isinstance(value, dict):
+        return {key: strip_binary(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [strip_binary(item) for item in value]
+    return value
+
+
+class WorkflowStateWriter:
+    """
+    Coalesces ``stream_mode="updates"`` chunks into batched row updates.
+
+    Only the workflow ``data`` keys that changed since the last flush are sent,
+    merged into ``stateData`` with a JSONB ``||`` so the row is never rewritten
+    as a whole. New audit trail entries are appended to ``AuditLog`` with one
+    ``create_many`` per flush; state itself only keeps the newest entries.
+    Changes are flushed at most every ``flush_interval`` seconds and always
+    together with a terminal status.
+    """
+
+    def __init__(
+        self,
+        execution_id: str,
+        org_id: str,
+        workflow_type: str,
+        flush_interval: float,
+    ):
+        self.execution_id = execution_id
+        self.org_id = org_id
+        self.workflow_type = workflow_type
+        self.flush_interval = flush_interval
+
+        self.current_step: Optional[str] = None
+        self.bytes_written = 0
+        # Highest trail ``seq`` already handed to the audit log
+        self.trail_seq = 0
+
+        self._data: Dict[str, Any] = {}
+        self._flushed: Dict[str, str] = {}
+        self._flushed_step: Optional[str] = None
+        self._last_flush = time.monotonic()
+        self._trail: List[Dict[str, Any]] = []
+        self._entity: Dict[str, str] = {}
+
+    def record(self, chunk: Dict[str, Any]) -> None:
+        """Merge one ``{node: update}`` chunk from the graph stream."""
+        for update in chunk.values():
+            if not isinstance(update, dict):
+                continue
+            if update.get("current_step"):
+                self.current_step = update["current_step"]
+            self._data.update(update.get("data") or {})
+
+            if not self._entity and update.get("entity_id"):
+                self._entity = {"entity_type": update["entity_type"], "entity_id": update["entity_id"]}
+            for entry in update.get("messages") or []:
+                if isinstance(entry, dict) and entry.get("seq", 0) > self.trail_seq:
+                    self._trail.append(entry)
+                    self.trail_seq = entry["seq"]
+
+    def _dirty(self) -> Dict[str, str]:
+        """Serialized data keys that differ from what was last written."""
+        dirty = {}
+        for key, value in self._data.items():
+            encoded = json.dumps(strip_binary(value), default=str, sort_keys=True)
+            if self._flushed.get(key) != encoded:
+                dirty[key] = encoded
+        return dirty
+
+    async def maybe_flush(self) -> None:
+        """Flush if the flush interval has elapsed since the last write."""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    async def flush(
+        self,
+        status: Optional[str] = None,
+        error_message: Optional[str] = None,
+        current_state: Optional[str] = None,
+        checkpoints: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write pending changes, optionally together with a status transition."""
+        dirty = self._dirty()
+        step = current_state or self.current_step
+
+        assignments = []
+        args: list = []
+
+        def param(value: Any) -> str:
+            args.append(value)
+            return f"${len(args)}"
+
+        if dirty:
+            delta = "{" + ", ".join(f"{json.dumps(key)}: {encoded}" for key, encoded in dirty.items()) + "}"
+            assignments.append(f'"stateData" = COALESCE("stateData", \'{{}}\'::jsonb) || {param(delta)}::jsonb')
+        if step and step != self._flushed_step:
+            assignments.append(f'"currentState" = {param(step)}')
+        if status:
+            assignments.append(f'"status" = {param(status)}::"WorkflowStatus"')
+            if status in ("COMPLETED", "FAILED", "CANCELLED"):
+                assignments.append('"completedAt" = NOW()')
+        if error_message is not None:
+            assignments.append(f'"errorMessage" = {param(error_message)}')
+        if checkpoints is not None:
+            assignments.append(f'"checkpoints" = {param(json.dumps(checkpoints))}::jsonb')
+
+        self._last_flush = time.monotonic()
+        trail, self._trail = self._trail, []
+        if not assignments and not trail:
+            return
+
+        # A cancelled execution keeps its status even if the run is still winding down
+        query = (
+            f'UPDATE "workflow_executions" SET {", ".join(assignments)} '
+            f'WHERE "id" = {param(self.execution_id)} AND "status" <> \'CANCELLED\''
+        )
+
+        audit_rows = self._audit_rows(trail)
+
+        async with with_tenant(self.org_id) as db:
+            if assignments:
+                await db.execute_raw(query, *args)
+            if audit_rows:
+                await db.auditlog.create_many(data=audit_rows)
+
+        written = sum(len(str(arg)) for arg in args) if assignments else 0
+        written += sum(len(json.dumps(entry, default=str)) for entry in trail)
+        self.bytes_written += written
+        self._flushed.update(dirty)
+        self._flushed_step = step
+
+        logger.debug(
+            "💾 Workflow state flushed",
+            execution_id=self.execution_id,
+            changed_keys=list(dirty),
+            bytes=written,
+        )
+
+    def _audit_rows(self, trail: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """AuditLog rows for trail entries, linked to the procurement request if any."""
+        entity_type = self._entity.get("entity_type", "WorkflowExecution")
+        entity_id = self._entity.get("entity_id", self.execution_id)
+        request_id = entity_id if entity_type == "ProcurementRequest" else None
+
+        return [
+            {
+                "orgId": self.org_id,
+                "action": f"WORKFLOW_{entry.get('kind', 'step').upper()}",
+                "entityType": entity_type,
+                "entityId": entity_id,
+                "requestId": request_id,
+                "metadata": Json({
+                    **entry,
+                    "execution_id": self.execution_id,
+                    "workflow_type": self.workflow_type,
+                }),
+            }
+            for entry in trail
+        ]
+
+    def observe(self) -> None:
+        """Record the bytes this execution wrote once it stops running."""
+        WORKFLOW_STATE_BYTES_WRITTEN.labels(self.workflow_type).observe(self.bytes_written)
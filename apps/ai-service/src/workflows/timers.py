@@ -0,0 +1,225 @@
+"""Durable workflow deadlines stored in a Valkey sorted set."""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from ..config import get_settings
+from ..valkey import get_valkey_client
+from .events import emit_workflow_event
+
+logger = structlog.get_logger(__name__)
+
+
+class WorkflowTimerService:
+    """
+    Fires workflow events when registered deadlines pass.
+
+    Deadlines live in a single sorted set scored by their due time, so they
+    survive restarts and are shared by all replicas. A single background loop
+    per process sleeps until the earliest deadline instead of polling each
+    waiting workflow.
+
+    Firing moves the entry into a processing set scored by a lease expiry, so
+    a deadline is delivered by one replica at a time. It is removed only once
+    its event was handled; a failed delivery is retried after ``retry_delay``
+    and the deadline of a replica that died mid-delivery is retried once its
+    lease runs out.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        key: str = "workflow:timers",
+        max_sleep: float = 60.0,
+        lease: float = 300.0,
+        retry_delay: float = 30.0,
+    ):
+        self.client = client
+        self.key = key
+        self.processing_key = f"{key}:processing"
+        # Upper bound on sleeping, to notice deadlines registered by other replicas
+        self.max_sleep = max_sleep
+        self.lease = lease
+        self.retry_delay = retry_delay
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _member(org_id: str, entity_type: str, entity_id: str, name: str, payload: Dict[str, Any]) -> str:
+        # Deterministic, so registering the same deadline twice is a no-op
+        return json.dumps(
+            {
+                "org_id": org_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "name": name,
+                "payload": payload,
+            },
+            sort_keys=True,
+        )
+
+    async def schedule(
+        self,
+        org_id: str,
+        entity_type: str,
+        entity_id: str,
+        name: str,
+        deadline: datetime,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Emit event ``name`` for an entity once ``deadline`` has passed."""
+        member = self._member(org_id, entity_type, entity_id, name, payload or {})
+        await self.client.zadd(self.key, {member: deadline.timestamp()})
+
+        logger.info(
+            "⏰ Workflow deadline scheduled",
+            event_name=name,
+            entity_id=entity_id,
+            deadline=deadline.isoformat(),
+        )
+
+        # The loop may be sleeping towards a later deadline
+        self._wakeup.set()
+
+    async def cancel(
+        self,
+        org_id: str,
+        entity_type: str,
+        entity_id: str,
+        name: str,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Drop a deadline that is no longer needed."""
+        member = self._member(org_id, entity_type, entity_id, name, payload or {})
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.key, member)
+            pipe.zrem(self.processing_key, member)
+            await pipe.execute()
+
+    async def fire_due(self) -> Optional[float]:
+        """Fire every deadline that has passed; return the next due time, if any."""
+        await self._requeue_expired_leases()
+
+        while True:
+            earliest = await self.client.zrange(self.key, 0, 0, withscores=True)
+            if not earliest:
+                return None
+
+            member, due = earliest[0]
+            if due > time.time():
+                return due
+
+            # Another replica may have claimed it first
+            if not await self._move(member, self.key, self.processing_key, time.time() + self.lease):
+                continue
+
+            event = json.loads(member)
+            logger.info("⏰ Workflow deadline reached", event_name=event["name"], entity_id=event["entity_id"])
+
+            try:
+                await emit_workflow_event(
+                    event["org_id"],
+                    event["entity_type"],
+                    event["entity_id"],
+                    event["name"],
+                    event["payload"],
+                    raise_errors=True,
+                )
+            except Exception as e:
+                logger.error(
+                    "❌ Workflow deadline delivery failed, will retry",
+                    event_name=event["name"],
+                    entity_id=event["entity_id"],
+                    error=str(e),
+                )
+                await self._move(member, self.processing_key, self.key, time.time() + self.retry_delay)
+                continue
+
+            await self.client.zrem(self.processing_key, member)
+
+    async def _requeue_expired_leases(self) -> None:
+        """Put back deadlines whose delivering replica died before finishing."""
+        expired = await self.client.zrangebyscore(self.processing_key, "-inf", time.time())
+        for member in expired:
+            if await self._move(member, self.processing_key, self.key, time.time()):
+                logger.warning("⏰ Retrying workflow deadline after expired lease", member=member)
+
+    async def _move(self, member: Any, source: str, destination: str, score: float) -> bool:
+        """Atomically move ``member`` between sorted sets; False if it is no longer in ``source``."""
+        async with self.client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(source)
+                if await pipe.zscore(source, member) is None:
+                    await pipe.unwatch()
+                    return False
+
+                pipe.multi()
+                pipe.zrem(source, member)
+                pipe.zadd(destination, {member: score})
+                await pipe.execute()
+                return True
+            except WatchError:
+                # Changed concurrently; the caller looks again
+                return False
+
+    async def _run(self) -> None:
+        while True:
+            # Cleared before looking, so a deadline scheduled meanwhile still wakes us
+            self._wakeup.clear()
+            try:
+                next_due = await self.fire_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("❌ Workflow timer loop failed", error=str(e))
+                next_due = None
+
+            sleep_for = self.max_sleep
+            if next_due is not None:
+                sleep_for = min(max(next_due - time.time(), 0), self.max_sleep)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start the background timer loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="workflow-timers")
+            logger.info("⏰ Workflow timer service started")
+
+    async def stop(self) -> None:
+        """Stop the background timer loop; pending deadlines stay in Valkey."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            logger.info("⏰ Workflow timer service stopped")
+
+
+# Process-wide timer service instance
+_timer_service: Optional[WorkflowTimerService] = None
+
+
+def get_timer_service() -> WorkflowTimerService:
+    """Get the process-wide workflow timer service."""
+    global _timer_service
+
+    if _timer_service is None:
+        settings = get_settings()
+        _timer_service = WorkflowTimerService(
+            get_valkey_client(),
+            max_sleep=settings.workflow_timer_max_sleep,
+            lease=settings.workflow_timer_lease,
+        )
+
+    return _timer_service
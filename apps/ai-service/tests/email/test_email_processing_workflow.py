@@ -1,7 +1,9 @@
 """Tests for email processing workflow."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 from src.workflows.email_processing import EmailProcessingWorkflow
 
 
@@ -209,4 +211,113 @@ async def test_routing_in_email_workflow(email_workflow):
     
     state["data"]["validation_status"] = "invalid"
     next_node = email_workflow.route_after_validation(state)
-    assert next_node == "handle_error"
\ No newline at end of file
+    assert next_node == "handle_error"
+
+@pytest.mark.asyncio
+async def test_store_email_data_batches_writes(email_workflow):
+    """Test that a poll's emails are stored with bulk reads and writes."""
+    def email(message_id, thread_id):
+        return {
+            "id": message_id,
+            "thread_id": thread_id,
+            "subject": "RFQ",
+            "from": "vendor@example.com",
+            "to": ["buyer@example.com"],
+            "participants": ["vendor@example.com", "buyer@example.com"],
+            "body": "Quote attached",
+            "received_at": datetime(2026, 1, 1),
+        }
+
+    db = MagicMock()
+    db.emailthread.find_many = AsyncMock(return_value=[MagicMock(gmailThreadId="t1", id="thread-1")])
+    db.emailmessage.find_many = AsyncMock(return_value=[MagicMock(gmailMessageId="m1")])
+    batch = MagicMock()
+
+    async def create_threads(data, skip_duplicates):
+        db.emailthread.find_many.return_value = [MagicMock(gmailThreadId=t["gmailThreadId"], id=t["id"]) for t in data]
+        return len(data)
+
+    db.emailthread.create_many = AsyncMock(side_effect=create_threads)
+
+    @asynccontextmanager
+    async def batch_():
+        yield batch
+
+    @asynccontextmanager
+    async def with_tenant(org_id):
+        yield db
+
+    db.batch_ = batch_
+    state = email_workflow.create_initial_state(
+        workflow_id="email-workflow-123",
+        org_id="org-1",
+        entity_id="poll-1",
+        entity_type="email_poll",
+        data={"fetched_emails": [email("m1", "t1"), email("m2", "t1"), email("m3", "t2"), email("m4", "t2")]},
+    )
+
+    with patch("src.workflows.email_processing.with_tenant", with_tenant):
+        result = await email_workflow.store_email_data(state)
+
+    assert result["data"]["ingest_stats"]["rows"] == 6
+    assert db.emailthread.find_many.await_count == 2
+    db.emailmessage.find_many.assert_awaited_once()
+    (new_thread,) = db.emailthread.create_many.call_args.kwargs["data"]
+    assert new_thread["gmailThreadId"] == "t2" and new_thread["messageCount"] == 2
+    assert db.emailthread.create_many.call_args.kwargs["skip_duplicates"] is True
+    batch.emailthread.update.assert_called_once_with(
+        where={"id": "thread-1"},
+        data={"lastMessageAt": datetime(2026, 1, 1), "messageCount": {"increment": 1}},
+    )
+    created = batch.emailmessage.create_many.call_args.kwargs["data"]
+    assert [m["gmailMessageId"] for m in created] == ["m2", "m3", "m4"]
+    assert created[1]["threadId"] == new_thread["id"]
+    batch.emailmessage.update.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_store_email_data_joins_thread_created_concurrently(email_workflow):
+    """Test that a thread another run inserted first is updated instead of failing the batch."""
+    db = MagicMock()
+    db.emailthread.find_many = AsyncMock(side_effect=[[], [MagicMock(gmailThreadId="t1", id="thread-other")]])
+    db.emailthread.create_many = AsyncMock(return_value=0)
+    db.emailmessage.find_many = AsyncMock(return_value=[])
+    batch = MagicMock()
+
+    @asynccontextmanager
+    async def batch_():
+        yield batch
+
+    @asynccontextmanager
+    async def with_tenant(org_id):
+        yield db
+
+    db.batch_ = batch_
+    state = email_workflow.create_initial_state(
+        workflow_id="email-workflow-123",
+        org_id="org-1",
+        entity_id="poll-1",
+        entity_type="email_poll",
+        data={"fetched_emails": [{
+            "id": "m1",
+            "thread_id": "t1",
+            "subject": "RFQ",
+            "from": "vendor@example.com",
+            "to": ["buyer@example.com"],
+            "participants": ["vendor@example.com", "buyer@example.com"],
+            "body": "Quote attached",
+            "received_at": datetime(2026, 1, 1),
+        }]},
+    )
+
+    with patch("src.workflows.email_processing.with_tenant", with_tenant):
+        result = await email_workflow.store_email_data(state)
+
+    assert result["data"]["ingest_stats"]["rows"] == 2
+    batch.emailthread.update.assert_called_once_with(
+        where={"id": "thread-other"},
+        data={"lastMessageAt": datetime(2026, 1, 1), "messageCount": {"increment": 1}},
+    )
+    (created,) = batch.emailmessage.create_many.call_args.kwargs["data"]
+    assert created["threadId"] == "thread-other"
+    assert batch.emailmessage.create_many.call_args.kwargs["skip_duplicates"] is True
@@ -0,0 +1,81 @@
+"""Tests for converting documents with Docling."""
+
+import asyncio
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.docling_service import DoclingService
+
+
+@pytest.mark.asyncio
+async def test_cancelled_conversion_keeps_its_slot():
+    """Test that a conversion abandoned by its workflow still counts against the pool until it returns."""
+    release = threading.Event()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    paths = []
+
+    def convert(path):
+        nonlocal in_flight, peak
+        paths.append(path)
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        release.wait(5)
+        with lock:
+            in_flight -= 1
+        return MagicMock(document=MagicMock(tables=[], pages=[1]))
+
+    service = DoclingService.__new__(DoclingService)
+    service.converter = MagicMock(convert=convert)
+    pool = ThreadPoolExecutor(max_workers=1)
+
+    with patch("src.services.docling_service.get_conversion_pool", return_value=pool):
+        stuck = asyncio.create_task(service.process_document(b"%PDF", "stuck.pdf"))
+        while not paths:
+            await asyncio.sleep(0.01)
+        stuck.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stuck
+
+        # The first document is still being converted, so this one must queue
+        queued = asyncio.create_task(service.process_document(b"%PDF", "next.pdf"))
+        await asyncio.sleep(0.05)
+        assert len(paths) == 1 and os.path.exists(paths[0])
+
+        release.set()
+        result = await queued
+
+    pool.shutdown(wait=True)
+    assert result["metadata"]["processing_status"] == "success"
+    assert peak == 1
+    assert not any(os.path.exists(path) for path in paths)
+
+
+@pytest.mark.asyncio
+async def test_rejected_conversion_removes_its_file():
+    """Test that the temp file is deleted when the pool refuses the conversion."""
+    service = DoclingService.__new__(DoclingService)
+    service.converter = MagicMock()
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.shutdown()
+    created = []
+    original = tempfile.NamedTemporaryFile
+
+    def named_temporary_file(**kwargs):
+        handle = original(**kwargs)
+        created.append(handle.name)
+        return handle
+
+    with patch("src.services.docling_service.get_conversion_pool", return_value=pool), \
+         patch("src.services.docling_service.tempfile.NamedTemporaryFile", named_temporary_file):
+        result = await service.process_document(b"%PDF", "late.pdf")
+
+    assert result["metadata"]["processing_status"] == "failed"
+    assert created and not os.path.exists(created[0])
@@ -0,0 +1,82 @@
+"""Tests for iterating over find_many results in cursor-paged batches."""
+
+from unittest.mock import patch
+
+import pytest
+
+from prisma_client import Prisma, models
+
+
+def vendor(vendor_id):
+    return {
+        "id": vendor_id,
+        "name": f"Vendor {vendor_id}",
+        "email": f"{vendor_id}@vendor.example.com",
+        "orgId": "org-1",
+        "isActive": True,
+        "createdAt": "2026-01-01T09:30:00.000Z",
+        "updatedAt": "2026-01-01T09:30:00.000Z",
+    }
+
+
+def matches(row, where):
+    if "AND" in where:
+        return all(matches(row, clause) for clause in where["AND"])
+    if "id" in where:
+        return row["id"] > where["id"]["gt"]
+    return all(row.get(key) == value for key, value in where.items())
+
+
+def paged_execute(rows, calls):
+    """Serve `rows` the way the query engine filters and pages them in id order."""
+    async def execute(self, *, method, arguments, model=None, root_selection=None):
+        calls.append(arguments)
+        selected = [row for row in rows if matches(row, arguments["where"] or {})]
+        return {"data": {"result": selected[:arguments["take"]]}}
+
+    return execute
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count, pages", [(5, 3), (4, 3), (0, 1)])
+async def test_iterates_over_every_row_in_batches(count, pages):
+    """Test that each batch selects the rows after the last id of the previous one."""
+    rows = [vendor(f"v{index}") for index in range(count)]
+    calls = []
+
+    with patch.object(Prisma, "_execute", paged_execute(rows, calls)):
+        vendors = [v async for v in Prisma(use_dotenv=False).vendor.find_many_iter(where={"orgId": "org-1"}, batch_size=2)]
+
+    assert [v.id for v in vendors] == [row["id"] for row in rows]
+    assert all(isinstance(v, models.Vendor) for v in vendors)
+    assert len(calls) == pages
+    assert calls[0]["where"] == {"orgId": "org-1"}
+    assert all(call["take"] == 2 and call["order_by"] == {"id": "asc"} for call in calls)
+    assert all("cursor" not in call and "skip" not in call for call in calls)
+    if count:
+        assert calls[1]["where"] == {"AND": [{"orgId": "org-1"}, {"id": {"gt": "v1"}}]}
+
+
+@pytest.mark.asyncio
+async def test_deleted_rows_do_not_end_iteration():
+    """Test that deleting the last row of a batch before the next one is fetched skips nothing else."""
+    rows = [vendor(f"v{index}") for index in range(5)]
+    calls = []
+    seen = []
+
+    with patch.object(Prisma, "_execute", paged_execute(rows, calls)):
+        async for v in Prisma(use_dotenv=False).vendor.find_many_iter(batch_size=2):
+            seen.append(v.id)
+            if v.id == "v1":
+                rows.remove(rows[1])
+
+    assert seen == ["v0", "v1", "v2", "v3", "v4"]
+    assert calls[1]["where"] == {"id": {"gt": "v1"}}
+
+
+@pytest.mark.asyncio
+async def test_rejects_empty_batches():
+    """Test that a batch size below one is rejected before querying."""
+    with pytest.raises(ValueError):
+        async for _ in Prisma(use_dotenv=False).vendor.find_many_iter(batch_size=0):
+            pass
@@ -0,0 +1,76 @@
+"""Tests for batching concurrent find_unique lookups in the Prisma client."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from prisma_client import Prisma
+
+
+def organization(org_id):
+    return {
+        "id": org_id,
+        "name": f"Org {org_id}",
+        "slug": org_id,
+        "createdAt": "2026-01-01T00:00:00+00:00",
+        "updatedAt": "2026-01-01T00:00:00+00:00",
+    }
+
+
+@pytest.fixture
+def queries():
+    """Record engine queries and answer them from a fixed set of organizations."""
+    calls = []
+    rows = {org_id: organization(org_id) for org_id in ("org-1", "org-2")}
+
+    async def execute(self, *, method, arguments, model=None, root_selection=None):
+        calls.append((method, arguments))
+        await asyncio.sleep(0)
+        if method == "find_many":
+            return {"data": {"result": [rows[v] for v in arguments["where"]["id"]["in"] if v in rows]}}
+        return {"data": {"result": rows.get(arguments["where"]["id"])}}
+
+    with patch.object(Prisma, "_execute_unbatched", execute):
+        yield calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_query(queries):
+    """Test that lookups issued together become a single find_many."""
+    client = Prisma(use_dotenv=False, batch_find_unique=True)
+
+    first, second, missing, again = await asyncio.gather(
+        client.organization.find_unique(where={"id": "org-1"}),
+        client.organization.find_unique(where={"id": "org-2"}),
+        client.organization.find_unique(where={"id": "org-3"}),
+        client.organization.find_unique(where={"id": "org-1"}),
+    )
+
+    assert (first.id, second.id, missing, again.id) == ("org-1", "org-2", None, "org-1")
+    assert queries == [("find_many", {"where": {"id": {"in": ["org-1", "org-2", "org-3"]}}, "include": None})]
+
+
+@pytest.mark.asyncio
+async def test_lone_and_unbatchable_lookups_are_unchanged(queries):
+    """Test that single lookups and compound filters still run as find_unique."""
+    client = Prisma(use_dotenv=False, batch_find_unique=True)
+
+    assert (await client.organization.find_unique(where={"id": "org-1"})).id == "org-1"
+    await client.organization.find_unique(where={"id": "org-2", "slug": "org-2"})
+
+    assert [method for method, _ in queries] == ["find_unique", "find_unique"]
+    assert queries[1][1]["where"] == {"id": "org-2", "slug": "org-2"}
+
+
+@pytest.mark.asyncio
+async def test_transaction_clients_do_not_batch(queries):
+    """Test that the copy used for an interactive transaction runs lookups directly."""
+    tx_client = Prisma(use_dotenv=False, batch_find_unique=True)._copy()
+
+    await asyncio.gather(
+        tx_client.organization.find_unique(where={"id": "org-1"}),
+        tx_client.organization.find_unique(where={"id": "org-2"}),
+    )
+
+    assert [method for method, _ in queries] == ["find_unique", "find_unique"]
@@ -0,0 +1,58 @@
+"""Tests for the Prisma client's JSON codecs."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from prisma_client import Json
+from prisma_client._builder import dumps, serializer
+from prisma_client._codec import OrjsonCodec, StdlibCodec, get_codec, set_codec
+
+
+@pytest.fixture(params=[StdlibCodec, OrjsonCodec])
+def codec(request):
+    previous = set_codec(request.param())
+    yield get_codec()
+    set_codec(previous)
+
+
+def test_values_are_serialized_like_the_stdlib(codec):
+    """Test that every codec applies the builder's datetime, Decimal and Json rules."""
+    value = {
+        "naive": datetime(2026, 1, 1, 12, 0, 0, 123999),
+        "aware": datetime(2026, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2))),
+        "amount": Decimal("24318.60"),
+        "items": Json([{"name": "Chair", "quantity": 10}]),
+        "huge": 2**70,
+        "text": "Ünïcode\nline",
+        3: None,
+    }
+
+    encoded = json.loads(dumps(value))
+    assert json.loads(encoded.pop("items")) == [{"name": "Chair", "quantity": 10}]
+    assert encoded == {
+        "naive": "2026-01-01T12:00:00.123000+00:00",
+        "aware": "2026-01-01T12:00:00+00:00",
+        "amount": "24318.60",
+        "huge": 2**70,
+        "text": "Ünïcode\nline",
+        "3": None,
+    }
+    assert "Ü" in dumps(value)
+
+
+def test_unserializable_values_raise_type_error(codec):
+    """Test that unknown types still fail the way the stdlib codec fails."""
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()}, default=serializer)
+
+
+def test_loads_matches_stdlib(codec):
+    """Test that engine responses decode to the same values."""
+    body = json.dumps({"data": {"result": [{"id": "q1", "totalAmount": "1.50", "big": 2**70, "rate": 0.1}]}})
+
+    assert codec.loads(body.encode()) == json.loads(body)
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
@@ -0,0 +1,64 @@
+"""Tests for parsing find_many results in a single validation call."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from prisma_client import Prisma, models
+from prisma_client._compat import model_parse, model_parse_many
+
+VENDOR = {
+    "id": "vendor-1",
+    "name": "Acme Supplies",
+    "email": "sales@acme.example.com",
+    "orgId": "org-1",
+    "isActive": True,
+    "metadata": json.dumps({"rating": 4.5}),
+    "createdAt": "2026-01-01T09:30:00.000Z",
+    "updatedAt": "2026-01-02T09:30:00.000Z",
+}
+
+
+def quote(quote_id):
+    return {
+        "id": quote_id,
+        "orgId": "org-1",
+        "requestId": "request-1",
+        "vendorId": "vendor-1",
+        "vendor": VENDOR,
+        "items": json.dumps([{"name": "Chair", "quantity": 10}]),
+        "totalAmount": "1499.90",
+        "currency": "USD",
+        "validUntil": None,
+        "source": "EMAIL",
+        "confidence": 1,
+        "status": "PENDING",
+        "createdAt": "2026-01-01T09:30:00.123Z",
+        "updatedAt": "2026-01-01T09:30:00.123Z",
+    }
+
+
+def test_parse_many_matches_parsing_each_row():
+    """Test that list validation builds the same models, including relations."""
+    rows = [quote("quote-1"), quote("quote-2")]
+
+    parsed = model_parse_many(models.Quote, rows)
+
+    assert [q.model_dump() for q in parsed] == [model_parse(models.Quote, row).model_dump() for row in rows]
+    assert isinstance(parsed[0].vendor, models.Vendor)
+
+
+@pytest.mark.asyncio
+async def test_find_many_uses_list_validation():
+    """Test that find_many parses its rows through the cached list adapter."""
+    async def execute(self, *, method, arguments, model=None, root_selection=None):
+        return {"data": {"result": [quote("quote-1"), quote("quote-2")]}}
+
+    with patch.object(Prisma, "_execute", execute), \
+         patch("prisma_client.actions.model_parse_many", wraps=model_parse_many) as parse_many:
+        quotes = await Prisma(use_dotenv=False).quote.find_many(include={"vendor": True})
+
+    parse_many.assert_called_once()
+    assert [q.id for q in quotes] == ["quote-1", "quote-2"]
+    assert quotes[0].items == [{"name": "Chair", "quantity": 10}]
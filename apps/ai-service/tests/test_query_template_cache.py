@@ -0,0 +1,74 @@
+"""Tests for the Prisma query builder's template cache."""
+
+from datetime import datetime
+
+import pytest
+
+from prisma_client import Json, models
+from prisma_client._builder import QueryBuilder, query_template_cache
+from prisma_client.client import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+
+def build(method, model, arguments, enabled):
+    query_template_cache.enabled = enabled
+    try:
+        return QueryBuilder(
+            method=method,
+            model=model,
+            arguments=arguments,
+            prisma_models=PRISMA_MODELS,
+            relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+        ).build_query()
+    finally:
+        query_template_cache.enabled = True
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    query_template_cache.clear()
+    yield
+    query_template_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "method, model, first, second",
+    [
+        (
+            "find_unique",
+            models.ProcurementRequest,
+            {"where": {"id": "req-1"}, "include": {"quotes": {"where": {"vendorId": "v1"}}}},
+            {"where": {"id": 'req "2"\nnext'}, "include": {"quotes": {"where": {"vendorId": "v1"}}}},
+        ),
+        (
+            "find_many",
+            models.WorkflowExecution,
+            {"take": 10, "where": {"status": {"in": ["PENDING", "RUNNING"]}}, "order_by": [{"startedAt": "desc"}]},
+            {"take": 5, "where": {"status": {"in": ["FAILED", "CANCELLED"]}}, "order_by": [{"startedAt": "asc"}]},
+        ),
+        (
+            "create",
+            models.AuditLog,
+            {"data": {"orgId": "org-1", "metadata": Json({"step": [1, None]}), "createdAt": datetime(2026, 1, 1)}},
+            {"data": {"orgId": "org-2", "metadata": Json("done"), "createdAt": datetime(2026, 1, 2, 3, 4, 5, 678901)}},
+        ),
+    ],
+)
+def test_cached_query_matches_uncached(method, model, first, second):
+    """Test that a cached shape renders new values exactly as the uncached builder does."""
+    for arguments in (first, second):
+        assert build(method, model, arguments, enabled=True) == build(method, model, arguments, enabled=False)
+
+    assert len(query_template_cache) == 1
+
+
+def test_none_and_list_lengths_are_part_of_the_shape():
+    """Test that skipped None arguments and different list lengths do not share a template."""
+    for arguments in (
+        {"take": 1, "where": {"id": {"in": ["a"]}}},
+        {"take": None, "where": {"id": {"in": ["a"]}}},
+        {"take": 1, "where": {"id": {"in": ["a", "b"]}}},
+    ):
+        cached = build("find_many", models.Vendor, arguments, enabled=True)
+        assert cached == build("find_many", models.Vendor, arguments, enabled=False)
+
+    assert len(query_template_cache) == 3
@@ -0,0 +1,75 @@
+"""Tests for deserializing raw query results into columns."""
+
+from unittest.mock import patch
+
+import pytest
+
+from prisma_client import Prisma
+from prisma_client._raw_query import deserialize_raw_columns
+
+np = pytest.importorskip("numpy")
+
+TERMS = {"payment": "Net 30"}
+
+SPEND = {
+    "columns": ["vendor_id", "quotes", "orders", "total_spend", "avg_price", "terms", "prices"],
+    "types": ["string", "int", "bigint", "decimal", "double", "json", "decimal-array"],
+    "rows": [
+        ["vendor-1", 3, "12", "1499.90", 12.5, TERMS, ["1.50", "2.25"]],
+        ["vendor-2", 1, None, None, None, None, None],
+    ],
+}
+
+
+def test_numeric_columns_are_arrays():
+    """Test that numeric columns are decoded into arrays with NULLs as nan."""
+    columns = deserialize_raw_columns(SPEND)
+
+    assert columns["quotes"].dtype == np.int64 and columns["quotes"].tolist() == [3, 1]
+    assert columns["orders"].dtype == np.float64
+    np.testing.assert_array_equal(columns["orders"], [12, np.nan])
+    np.testing.assert_array_equal(columns["total_spend"], [1499.90, np.nan])
+    np.testing.assert_array_equal(columns["avg_price"], [12.5, np.nan])
+
+
+def test_other_columns_are_lists():
+    """Test that JSON values are not re-encoded and arrays are deserialized per item."""
+    columns = deserialize_raw_columns(SPEND)
+
+    assert columns["vendor_id"] == ["vendor-1", "vendor-2"]
+    assert columns["terms"][0] is TERMS and columns["terms"][1] is None
+    assert columns["prices"] == [[1.5, 2.25], None]
+
+
+def test_large_and_empty_integer_columns():
+    """Test that integers beyond 64 bits are kept exact and empty results keep their dtype."""
+    result = {"columns": ["total"], "types": ["bigint"], "rows": [[str(2**70)], [None]]}
+    assert deserialize_raw_columns(result)["total"].tolist() == [2**70, None]
+
+    empty = deserialize_raw_columns({"columns": ["total"], "types": ["bigint"], "rows": []})
+    assert empty["total"].dtype == np.int64 and len(empty["total"]) == 0
+
+
+@pytest.mark.parametrize("rows", [[["9007199254740993"], [None]], [[None], ["9007199254740993"]]])
+def test_nullable_integers_beyond_float_precision(rows):
+    """Test that NULLs next to integers above 2**53 keep them exact regardless of row order."""
+    column = deserialize_raw_columns({"columns": ["total"], "types": ["bigint"], "rows": rows})["total"]
+
+    assert column.dtype == object
+    assert sorted(column.tolist(), key=lambda value: value is None) == [2**53 + 1, None]
+
+
+@pytest.mark.asyncio
+async def test_query_raw_columnar():
+    """Test that the client runs a raw query and returns its columns."""
+    async def execute(self, *, method, arguments, model=None, root_selection=None):
+        assert method == "query_raw" and arguments["parameters"] == ("org-1",)
+        return {"data": {"result": SPEND}}
+
+    with patch.object(Prisma, "_execute", execute):
+        columns = await Prisma(use_dotenv=False).query_raw_columnar(
+            'SELECT * FROM vendor_spend WHERE "orgId" = $1', "org-1"
+        )
+
+    assert list(columns) == SPEND["columns"]
+    assert columns["quotes"].tolist() == [3, 1]
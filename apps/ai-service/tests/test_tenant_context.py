@@ -0,0 +1,90 @@
+"""Tests for transaction-scoped tenant context."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import Settings
+from src.database import _pooled_url, pool_size, with_tenant
+
+
+class FakeTransaction:
+    """Stands in for Prisma's transaction manager."""
+
+    def __init__(self, log):
+        self.log = log
+        self.client = MagicMock()
+        self.client.execute_raw = AsyncMock(return_value=1)
+
+    async def __aenter__(self):
+        self.log.append("begin")
+        return self.client
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.log.append("rollback" if exc else "commit")
+
+
+@pytest.fixture
+def db():
+    client = MagicMock()
+    client.log = []
+    client.transactions = []
+
+    def tx(**kwargs):
+        client.transactions.append(FakeTransaction(client.log))
+        return client.transactions[-1]
+
+    client.tx = tx
+
+    with patch("src.database.get_db_client", AsyncMock(return_value=client)):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_tenant_is_set_locally_and_nested_blocks_reuse_it(db):
+    """Test that the tenant is a parameterized, transaction-local setting shared by nested blocks."""
+    async with with_tenant("org-1") as outer:
+        async with with_tenant("org-1") as inner:
+            assert inner is outer
+
+    assert db.log == ["begin", "commit"]
+    outer.execute_raw.assert_awaited_once_with(
+        "SELECT set_config('app.current_tenant', $1, true)", "org-1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tenants_get_separate_transactions(db):
+    """Test that concurrent blocks of different tenants never share a transaction."""
+    async def use(org_id):
+        async with with_tenant(org_id) as tx:
+            await asyncio.sleep(0.01)
+            return tx
+
+    first, second = await asyncio.gather(use("org-1"), use("org-2"))
+
+    assert first is not second
+    assert second.execute_raw.await_args.args[1] == "org-2"
+
+
+@pytest.mark.asyncio
+async def test_block_error_rolls_back(db):
+    """Test that an exception inside the block rolls the transaction back."""
+    with pytest.raises(ValueError):
+        async with with_tenant("org-1"):
+            raise ValueError("boom")
+
+    assert db.log == ["begin", "rollback"]
+
+
+def test_pool_covers_every_concurrent_tenant_block():
+    """Test that the default pool fits all workflow slots plus API requests, and an explicit limit wins."""
+    settings = Settings(workflow_concurrency_limits={"procurement": 20, "quote_processing": 4}, database_api_connections=10)
+    assert pool_size(settings) == 34
+    assert pool_size(settings.model_copy(update={"database_connection_limit": 5})) == 5
+
+    assert _pooled_url("postgresql://u:p@db:5432/app?schema=public", 34) == (
+        "postgresql://u:p@db:5432/app?schema=public&connection_limit=34"
+    )
+    assert _pooled_url("postgresql://db/app?connection_limit=3", 34).endswith("connection_limit=3")
@@ -0,0 +1,121 @@
+"""Tests for the tenant-scoped vendor directory cache."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from src.services.vendor_cache import INVALIDATE_CHANNEL, VendorCache
+
+
+def make_vendor(vendor_id, email, active=True):
+    vendor = MagicMock(
+        id=vendor_id,
+        email=email,
+        phone=None,
+        website=None,
+        address=None,
+        metadata={},
+        isActive=active,
+        createdAt=datetime(2026, 1, 1),
+        updatedAt=datetime(2026, 1, 1),
+    )
+    vendor.name = f"Vendor {vendor_id}"
+    return vendor
+
+
+@pytest.fixture
+def db():
+    client = MagicMock()
+    client.vendor.find_many = AsyncMock(return_value=[
+        make_vendor("v1", "Sales@Acme.com"),
+        make_vendor("v2", "old@example.com", active=False),
+    ])
+
+    @asynccontextmanager
+    async def _with_tenant(org_id):
+        yield client
+
+    with patch("src.services.vendor_cache.with_tenant", _with_tenant):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_served_from_memory_then_valkey(db):
+    """Test that the database is read once and other replicas load from Valkey."""
+    server = FakeServer()
+    replica_a = VendorCache(FakeRedis(server=server))
+    replica_b = VendorCache(FakeRedis(server=server))
+
+    vendor = await replica_a.find_by_email("org-1", "Acme Sales <SALES@acme.com>")
+    assert vendor["id"] == "v1"
+    assert [v["id"] for v in await replica_a.get_vendors("org-1")] == ["v1"]
+    assert len(await replica_b.get_vendors("org-1", active_only=False)) == 2
+
+    db.vendor.find_many.assert_awaited_once()
+    await replica_a.stop()
+    await replica_b.stop()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_replicas(db):
+    """Test that a vendor write evicts the directory on every replica."""
+    server = FakeServer()
+    replica_a = VendorCache(FakeRedis(server=server))
+    replica_b = VendorCache(FakeRedis(server=server))
+    await replica_a.directory("org-1")
+    await replica_b.directory("org-1")
+
+    db.vendor.find_many.return_value = [make_vendor("v3", "new@example.com")]
+    for _ in range(50):
+        if (await replica_b.client.execute_command("PUBSUB", "NUMSUB", INVALIDATE_CHANNEL))[1]:
+            break
+        await asyncio.sleep(0.01)
+    await replica_a.invalidate("org-1")
+    for _ in range(50):
+        if "org-1" not in replica_b._directories:
+            break
+        await asyncio.sleep(0.01)
+
+    assert (await replica_b.find_by_email("org-1", "new@example.com"))["id"] == "v3"
+    await replica_a.stop()
+    await replica_b.stop()
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_shared(db):
+    """Test that a directory read before a vendor write is not written back to Valkey."""
+    cache = VendorCache(FakeRedis())
+    stale = [make_vendor("v1", "sales@acme.com")]
+
+    async def find_many(where):
+        # A write lands while the directory is being read
+        await cache.invalidate("org-1")
+        return stale
+
+    db.vendor.find_many.side_effect = find_many
+    await cache.directory("org-1")
+
+    assert await cache.client.get("vendors:org-1") is None
+    assert "org-1" not in cache._directories
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_timestamps_survive_the_shared_copy(db):
+    """Test that vendors loaded from Valkey carry datetimes like those read from the database."""
+    server = FakeServer()
+    replica_a = VendorCache(FakeRedis(server=server))
+    replica_b = VendorCache(FakeRedis(server=server))
+
+    from_database = await replica_a.get_vendors("org-1")
+    from_valkey = await replica_b.get_vendors("org-1")
+
+    assert from_valkey == from_database
+    assert from_valkey[0]["created_at"] == datetime(2026, 1, 1)
+    await replica_a.stop()
+    await replica_b.stop()
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock
 from datetime import datetime
-from src.workflows.base import BaseWorkflow, WorkflowState, ConditionalRouter
+from src.workflows.base import MAX_TRAIL_ENTRIES, BaseWorkflow, WorkflowState, append_trail, merge_trail, ConditionalRouter
 
 
 class TestBaseWorkflow(BaseWorkflow):
@@ -132,4 +132,17 @@ def test_conditional_router():
     assert ConditionalRouter.route_with_retry(state) == "failed"
     
     state["error_message"] = None
-    assert ConditionalRouter.route_with_retry(state) == "success"
\ No newline at end of file
+    assert ConditionalRouter.route_with_retry(state) == "success"
+
+def test_trail_is_bounded():
+    """Test that the trail reducer drops seen entries and keeps only the newest ones."""
+    trail = []
+    for i in range(MAX_TRAIL_ENTRIES + 10):
+        trail = append_trail(trail, "step", f"step {i}")
+
+    assert len(trail) == MAX_TRAIL_ENTRIES
+    assert trail[-1]["seq"] == MAX_TRAIL_ENTRIES + 10
+
+    merged = merge_trail(trail, trail + append_trail(trail, "step", "next")[-1:])
+    assert len(merged) == MAX_TRAIL_ENTRIES
+    assert merged[-1]["content"] == "next"
@@ -0,0 +1,119 @@
+"""Tests for the Valkey-backed workflow checkpointer."""
+
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from langgraph.graph import StateGraph, START, END
+
+from src.workflows.checkpointer import ValkeyCheckpointSaver
+
+
+class CounterState(TypedDict):
+    count: int
+    steps: Annotated[list, operator.add]
+
+
+def build_graph(checkpointer):
+    """Build a small three-step graph."""
+    builder = StateGraph(CounterState)
+    builder.add_node("first", lambda state: {"count": state["count"] + 1, "steps": ["first"]})
+    builder.add_node("second", lambda state: {"count": state["count"] + 1, "steps": ["second"]})
+    builder.add_node("third", lambda state: {"count": state["count"] + 1, "steps": ["third"]})
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", "third")
+    builder.add_edge("third", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+def server():
+    """Shared fake Valkey server, standing in for a real deployment."""
+    return FakeServer()
+
+
+def make_saver(server, **kwargs):
+    return ValkeyCheckpointSaver(FakeRedis(server=server), ttl=3600, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_round_trip(server):
+    """Test that the final state can be read back from Valkey."""
+    graph = build_graph(make_saver(server))
+    config = {"configurable": {"thread_id": "thread-1"}}
+
+    await graph.ainvoke({"count": 0, "steps": []}, config)
+    snapshot = await graph.aget_state(config)
+
+    assert snapshot.values["count"] == 3
+    assert snapshot.values["steps"] == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_other_replica_can_read_thread(server):
+    """Test that a second saver on the same server sees the thread."""
+    config = {"configurable": {"thread_id": "thread-2"}}
+    await build_graph(make_saver(server)).ainvoke({"count": 0, "steps": []}, config)
+
+    snapshot = await build_graph(make_saver(server)).aget_state(config)
+
+    assert snapshot.values["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_history_is_pruned(server):
+    """Test that only the newest checkpoints of a thread are kept."""
+    saver = make_saver(server, max_history=2)
+    config = {"configurable": {"thread_id": "thread-3"}}
+    await build_graph(saver).ainvoke({"count": 0, "steps": []}, config)
+
+    checkpoints = [checkpoint async for checkpoint in saver.alist(config)]
+
+    assert len(checkpoints) == 2
+    assert checkpoints[0].checkpoint["id"] > checkpoints[1].checkpoint["id"]
+
+
+@pytest.mark.asyncio
+async def test_pruned_checkpoints_take_their_blobs(server):
+    """Test that superseded channel values are deleted with the checkpoints that used them."""
+    saver = make_saver(server, max_history=2)
+    config = {"configurable": {"thread_id": "thread-6"}}
+    graph = build_graph(saver)
+
+    blob_counts = []
+    for _ in range(4):
+        await graph.ainvoke({"count": 0, "steps": []}, config)
+        blob_counts.append(len([key async for key in saver.client.scan_iter(match="workflow:checkpoint:blob:thread-6:*")]))
+
+    assert blob_counts[-1] == blob_counts[0]
+    snapshot = await graph.aget_state(config)
+    assert snapshot.values["count"] == 3 and len(snapshot.values["steps"]) == 12
+
+
+@pytest.mark.asyncio
+async def test_keys_expire(server):
+    """Test that every stored key carries the configured TTL."""
+    saver = make_saver(server)
+    config = {"configurable": {"thread_id": "thread-4"}}
+    await build_graph(saver).ainvoke({"count": 0, "steps": []}, config)
+
+    keys = [key async for key in saver.client.scan_iter(match=f"{saver.key_prefix}:*")]
+
+    assert keys
+    for key in keys:
+        assert 0 < await saver.client.ttl(key) <= 3600
+
+
+@pytest.mark.asyncio
+async def test_delete_thread(server):
+    """Test that deleting a thread removes all of its keys."""
+    saver = make_saver(server)
+    config = {"configurable": {"thread_id": "thread-5"}}
+    await build_graph(saver).ainvoke({"count": 0, "steps": []}, config)
+
+    await saver.adelete_thread("thread-5")
+
+    assert await saver.aget_tuple(config) is None
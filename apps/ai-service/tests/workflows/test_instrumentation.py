@@ -0,0 +1,58 @@
+"""Tests for per-node workflow metrics."""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import START, END
+from prometheus_client import REGISTRY
+
+from src.workflows.base import BaseWorkflow, WorkflowState
+
+
+class MeteredWorkflow(BaseWorkflow):
+    """Workflow with one succeeding node, one handled error and one wait."""
+
+    workflow_type = "metered"
+
+    def _setup_graph(self) -> None:
+        self.graph_builder.add_node("ok", self.ok)
+        self.graph_builder.add_node("flaky", self.flaky)
+        self.graph_builder.add_node("wait", self.wait)
+        self.graph_builder.add_edge(START, "ok")
+        self.graph_builder.add_edge("ok", "flaky")
+        self.graph_builder.add_edge("flaky", "wait")
+        self.graph_builder.add_edge("wait", END)
+
+    async def ok(self, state: WorkflowState) -> WorkflowState:
+        state["data"]["payload"] = "x" * 1000
+        return state
+
+    async def flaky(self, state: WorkflowState) -> WorkflowState:
+        try:
+            raise RuntimeError("vendor API timed out")
+        except Exception as e:
+            return await self.handle_error(state, e, "flaky")
+
+    async def wait(self, state: WorkflowState) -> WorkflowState:
+        self.wait_for_event(state, "never")
+        return state
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, {"workflow_type": "metered", **labels}) or 0
+
+
+@pytest.mark.asyncio
+async def test_nodes_are_instrumented():
+    """Test that durations, handled errors, retries and state size are recorded per node."""
+    workflow = MeteredWorkflow()
+    graph = workflow.compile(checkpointer=MemorySaver())
+    state = workflow.create_initial_state("thread-1", "org-1", "entity-1", "Test", {})
+
+    await graph.ainvoke(state, {"configurable": {"thread_id": "thread-1"}})
+
+    assert sample("workflow_node_duration_seconds_count", node="ok", outcome="success") == 1
+    assert sample("workflow_node_duration_seconds_count", node="flaky", outcome="error") == 1
+    assert sample("workflow_node_duration_seconds_count", node="wait", outcome="interrupted") == 1
+    assert sample("workflow_node_errors_total", node="flaky") == 1
+    assert sample("workflow_node_retries_total", node="flaky") == 1
+    assert sample("workflow_node_state_bytes_sum", node="ok") > 1000
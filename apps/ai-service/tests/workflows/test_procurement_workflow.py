@@ -1,8 +1,12 @@
 """Tests for Procurement Workflow state machine."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
+from src.config import get_settings
 from src.workflows.procurement import ProcurementWorkflow
 from src.workflows.base import WorkflowState
 
@@ -319,4 +323,43 @@ async def test_error_handling_in_workflow(workflow, initial_state):
         assert result["current_step"] == "handle_error"
         
         # Verify database update for error state
-        mock_db_context.procurementrequest.update.assert_called_once()
\ No newline at end of file
+        mock_db_context.procurementrequest.update.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_rfqs_are_sent_concurrently(workflow, initial_state):
+    """Test that RFQs go out in parallel and one failing vendor does not affect the others."""
+    state = initial_state.copy()
+    state["data"]["selected_vendors"] = [
+        {"id": f"vendor-{i}", "name": f"Vendor {i}", "email": f"v{i}@example.com"} for i in range(6)
+    ]
+
+    in_flight = 0
+    peak = 0
+
+    async def send_rfq_email(vendor_email, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if vendor_email == "v3@example.com":
+            raise RuntimeError("mailbox unavailable")
+        return f"msg-{vendor_email}"
+
+    db = MagicMock()
+    db.procurementrequest.update = AsyncMock()
+
+    @asynccontextmanager
+    async def fake_tenant(org_id):
+        yield db
+
+    with patch("src.workflows.procurement.EmailService") as mock_email_service, \
+         patch("src.workflows.procurement.with_tenant", fake_tenant):
+        mock_email_service.return_value.send_rfq_email = AsyncMock(side_effect=send_rfq_email)
+
+        result = await workflow.send_rfqs(state)
+
+    assert peak == min(6, get_settings().rfq_send_concurrency) > 1
+    assert result["data"]["rfq_sent_count"] == 5
+    assert [vendor["id"] for vendor in result["data"]["rfq_failed_vendors"]] == ["vendor-3"]
+    assert result["data"]["rfq_results"]["vendor-0"] == {"status": "sent", "message_id": "msg-v0@example.com"}
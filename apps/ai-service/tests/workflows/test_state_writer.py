@@ -0,0 +1,109 @@
+"""Tests for write-behind persistence of workflow state."""
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.workflows.state_writer import WorkflowStateWriter, strip_binary
+
+
+@pytest.fixture
+def db():
+    """Database client that records raw statements."""
+    client = MagicMock()
+    client.execute_raw = AsyncMock(return_value=1)
+    client.auditlog.create_many = AsyncMock(return_value=1)
+    return client
+
+
+@pytest.fixture
+def tenant(db):
+    @asynccontextmanager
+    async def _with_tenant(org_id):
+        yield db
+
+    with patch("src.workflows.state_writer.with_tenant", _with_tenant):
+        yield
+
+
+def make_writer(flush_interval=60.0):
+    return WorkflowStateWriter("exec-1", "org-1", "procurement", flush_interval=flush_interval)
+
+
+def sent_delta(call):
+    """Decode the stateData delta passed to a raw UPDATE."""
+    return json.loads(call.args[1])
+
+
+def test_strip_binary_replaces_bytes():
+    """Test that attachment bytes are replaced by their size."""
+    stripped = strip_binary({"attachments": [{"filename": "quote.pdf", "content": b"%PDF-1.7"}]})
+
+    assert stripped == {"attachments": [{"filename": "quote.pdf", "content": {"omitted_bytes": 8}}]}
+
+
+@pytest.mark.asyncio
+async def test_updates_are_coalesced_until_terminal_flush(db, tenant):
+    """Test that steps inside the flush interval are written once at the end."""
+    writer = make_writer()
+    for step in range(5):
+        writer.record({"node": {"current_step": f"step_{step}", "data": {"count": step}}})
+        await writer.maybe_flush()
+
+    db.execute_raw.assert_not_awaited()
+
+    await writer.flush(status="COMPLETED")
+
+    db.execute_raw.assert_awaited_once()
+    query = db.execute_raw.call_args.args[0]
+    assert '"status" = $3::"WorkflowStatus"' in query
+    assert '"completedAt" = NOW()' in query
+    assert sent_delta(db.execute_raw.call_args) == {"count": 4}
+
+
+@pytest.mark.asyncio
+async def test_only_changed_keys_are_written(db, tenant):
+    """Test that a flush only sends data keys that changed since the last one."""
+    writer = make_writer(flush_interval=0)
+    writer.record({"node": {"current_step": "a", "data": {"vendors": ["v1", "v2"], "count": 1}}})
+    await writer.maybe_flush()
+    writer.record({"node": {"current_step": "b", "data": {"vendors": ["v1", "v2"], "count": 2}}})
+    await writer.maybe_flush()
+
+    assert db.execute_raw.await_count == 2
+    assert sent_delta(db.execute_raw.call_args_list[1]) == {"count": 2}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_state_skips_write(db, tenant):
+    """Test that flushing without changes does not touch the database."""
+    writer = make_writer(flush_interval=0)
+    writer.record({"node": {"current_step": "a", "data": {"count": 1}}})
+    await writer.flush()
+    await writer.flush()
+
+    db.execute_raw.assert_awaited_once()
+    assert writer.bytes_written > 0
+
+
+@pytest.mark.asyncio
+async def test_trail_entries_are_batched_into_audit_log(db, tenant):
+    """Test that unseen trail entries are appended to the AuditLog once per flush."""
+    writer = make_writer()
+    writer.trail_seq = 1
+
+    trail = [
+        {"seq": 1, "kind": "start", "content": "started"},
+        {"seq": 2, "kind": "step", "content": "[extract] done"},
+    ]
+    writer.record({"extract": {"entity_type": "ProcurementRequest", "entity_id": "req-1", "messages": trail}})
+    writer.record({"classify": {"messages": trail + [{"seq": 3, "kind": "error", "content": "[ERROR] classify"}]}})
+    await writer.flush()
+    await writer.flush()
+
+    db.auditlog.create_many.assert_awaited_once()
+    rows = db.auditlog.create_many.await_args.kwargs["data"]
+    assert [row["action"] for row in rows] == ["WORKFLOW_STEP", "WORKFLOW_ERROR"]
+    assert all(row["requestId"] == "req-1" for row in rows)
@@ -0,0 +1,187 @@
+"""Tests for event-driven workflow wakeups."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import START, END
+from langgraph.types import Command
+
+from src.workflows.base import BaseWorkflow, WorkflowState
+from src.workflows.events import WorkflowEvent, WorkflowEventBus
+from src.workflows.manager import WorkflowManager
+
+
+class WaitingWorkflow(BaseWorkflow):
+    """Single-node workflow that waits for an approval event."""
+
+    def _setup_graph(self) -> None:
+        self.graph_builder.add_node("await_approval", self.await_approval)
+        self.graph_builder.add_edge(START, "await_approval")
+        self.graph_builder.add_edge("await_approval", END)
+
+    async def await_approval(self, state: WorkflowState) -> WorkflowState:
+        payload = self.wait_for_event(state, "quote_approved")
+        state["data"]["approved_quote_id"] = payload["quote_id"]
+        return state
+
+
+def make_event(name="quote_approved"):
+    return WorkflowEvent(
+        org_id="org-1",
+        entity_type="ProcurementRequest",
+        entity_id="request-1",
+        name=name,
+        payload={"quote_id": "quote-1"},
+    )
+
+
+def fake_tenant(db):
+    @asynccontextmanager
+    async def _with_tenant(org_id):
+        yield db
+    return _with_tenant
+
+
+@pytest.mark.asyncio
+async def test_event_bus_isolates_handler_failures():
+    """Test that a failing subscriber does not stop delivery to the others."""
+    bus = WorkflowEventBus()
+    received = []
+
+    async def failing(event):
+        raise RuntimeError("boom")
+
+    async def recording(event):
+        received.append(event["name"])
+
+    bus.subscribe(failing)
+    bus.subscribe(recording)
+    await bus.publish(make_event())
+
+    assert received == ["quote_approved"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_suspends_until_resumed():
+    """Test that a waiting node checkpoints the thread and resumes with the payload."""
+    workflow = WaitingWorkflow()
+    graph = workflow.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "thread-1"}}
+    state = workflow.create_initial_state("thread-1", "org-1", "request-1", "ProcurementRequest", {})
+
+    await graph.ainvoke(state, config)
+    snapshot = await graph.aget_state(config)
+
+    assert snapshot.next == ("await_approval",)
+    assert snapshot.interrupts[0].value["wait_for"] == ["quote_approved"]
+
+    await graph.ainvoke(Command(resume={"quote_id": "quote-1"}), config)
+    snapshot = await graph.aget_state(config)
+
+    assert snapshot.next == ()
+    assert snapshot.values["data"]["approved_quote_id"] == "quote-1"
+
+
+@pytest.mark.asyncio
+async def test_handle_event_resumes_matching_execution():
+    """Test that only executions waiting for the emitted event are resumed."""
+    manager = WorkflowManager()
+    db = MagicMock()
+    db.workflowexecution.find_many = AsyncMock(return_value=[
+        SimpleNamespace(
+            id="exec-1",
+            status="PENDING",
+            workflowType="procurement",
+            checkpoints={"thread_id": "thread-1", "waiting_for": ["quote_approved"]},
+        ),
+        SimpleNamespace(
+            id="exec-2",
+            status="PENDING",
+            workflowType="procurement",
+            checkpoints={"thread_id": "thread-2", "waiting_for": ["quote_received"]},
+        ),
+    ])
+    db.workflowexecution.update_many = AsyncMock(return_value=1)
+
+    with patch("src.workflows.manager.with_tenant", fake_tenant(db)), \
+         patch.object(manager.executor, "submit") as mock_submit:
+        await manager.handle_event(make_event())
+
+    db.workflowexecution.update_many.assert_awaited_once_with(
+        where={"id": "exec-1", "status": "PENDING"},
+        data={"status": "RUNNING"},
+    )
+    mock_submit.assert_called_once()
+    assert mock_submit.call_args.args[:2] == ("procurement", "exec-1")
+
+
+@pytest.mark.asyncio
+async def test_handle_event_skips_execution_claimed_elsewhere():
+    """Test that an execution already resumed by another replica is not resumed twice."""
+    manager = WorkflowManager()
+    db = MagicMock()
+    db.workflowexecution.find_many = AsyncMock(return_value=[
+        SimpleNamespace(
+            id="exec-1",
+            status="PENDING",
+            workflowType="procurement",
+            checkpoints={"thread_id": "thread-1", "waiting_for": ["quote_approved"]},
+        ),
+    ])
+    db.workflowexecution.update_many = AsyncMock(return_value=0)
+
+    with patch("src.workflows.manager.with_tenant", fake_tenant(db)), \
+         patch.object(manager.executor, "submit") as mock_submit:
+        await manager.handle_event(make_event())
+
+    mock_submit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_event_for_running_execution_is_delivered_when_it_suspends():
+    """Test that an event for an execution running in another process waits in Valkey for its suspend."""
+    manager = WorkflowManager()
+    db = MagicMock()
+    db.workflowexecution.find_many = AsyncMock(return_value=[
+        SimpleNamespace(id="exec-1", status="RUNNING", workflowType="procurement", checkpoints={}),
+    ])
+    db.workflowexecution.find_unique = AsyncMock(return_value=SimpleNamespace(status="RUNNING"))
+    db.workflowexecution.update_many = AsyncMock(return_value=1)
+    valkey = FakeRedis(server=FakeServer())
+
+    with patch("src.workflows.manager.with_tenant", fake_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=valkey), \
+         patch.object(manager.executor, "submit") as mock_submit:
+        await manager.handle_event(make_event())
+        mock_submit.assert_not_called()
+
+        await manager._deliver_parked_event("exec-1", "procurement", "thread-1", ["quote_approved"])
+        await manager._deliver_parked_event("exec-1", "procurement", "thread-1", ["quote_approved"])
+
+    mock_submit.assert_called_once()
+    assert mock_submit.call_args.args[:2] == ("procurement", "exec-1")
+
+
+@pytest.mark.asyncio
+async def test_event_parked_after_suspend_is_delivered():
+    """Test that an event parked just after its execution suspended still resumes it."""
+    manager = WorkflowManager()
+    db = MagicMock()
+    db.workflowexecution.find_unique = AsyncMock(return_value=SimpleNamespace(
+        status="PENDING",
+        workflowType="procurement",
+        checkpoints={"thread_id": "thread-1", "waiting_for": ["quote_approved"]},
+    ))
+    db.workflowexecution.update_many = AsyncMock(return_value=1)
+
+    with patch("src.workflows.manager.with_tenant", fake_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=FakeRedis(server=FakeServer())), \
+         patch.object(manager.executor, "submit") as mock_submit:
+        await manager._park_event("exec-1", make_event())
+
+    mock_submit.assert_called_once()
@@ -0,0 +1,91 @@
+"""Tests for the bounded workflow executor."""
+
+import asyncio
+
+import pytest
+from src.workflows.executor import WorkflowExecutor, WorkflowQueueFull, ExecutorShuttingDown
+
+
+@pytest.fixture
+def executor():
+    """Create an executor with one slot and a queue of one."""
+    return WorkflowExecutor(
+        concurrency_limits={"quote_processing": 1},
+        default_concurrency=5,
+        max_queue_size=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_enforced(executor):
+    """Test that no more than the configured number of executions run at once."""
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def run():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    first = executor.submit("quote_processing", "exec-1", run)
+    second = executor.submit("quote_processing", "exec-2", run)
+    await asyncio.sleep(0.01)
+
+    assert executor.stats()["quote_processing"] == {"queued": 1, "running": 1, "limit": 1}
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert peak == 1
+    assert executor.stats()["quote_processing"] == {"queued": 0, "running": 0, "limit": 1}
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_submissions(executor):
+    """Test that submissions beyond the queue bound are rejected."""
+    release = asyncio.Event()
+
+    async def run():
+        await release.wait()
+
+    executor.submit("quote_processing", "exec-1", run)
+    executor.submit("quote_processing", "exec-2", run)
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(WorkflowQueueFull):
+        executor.submit("quote_processing", "exec-3", run)
+
+    release.set()
+    await executor.shutdown(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_and_rejects(executor):
+    """Test that shutdown waits for running work and rejects new work."""
+    finished = []
+
+    async def run():
+        await asyncio.sleep(0.01)
+        finished.append(True)
+
+    executor.submit("procurement", "exec-1", run)
+    await executor.shutdown(timeout=1)
+
+    assert finished == [True]
+    with pytest.raises(ExecutorShuttingDown):
+        executor.submit("procurement", "exec-2", run)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_after_timeout(executor):
+    """Test that executions still running after the drain timeout are cancelled."""
+    async def run():
+        await asyncio.sleep(60)
+
+    task = executor.submit("procurement", "exec-1", run)
+    await executor.shutdown(timeout=0.01)
+
+    assert task.cancelled()
@@ -0,0 +1,69 @@
+"""Tests for workflow job dispatch to local executors and Celery workers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.config import get_settings
+from src.worker import celery_app
+from src.workflows.jobs import RUN_WORKFLOW_TASK, WorkflowJob, decode_job, encode_job
+from src.workflows.manager import WorkflowManager
+
+
+def make_job(workflow_type="quote_processing"):
+    return WorkflowJob(
+        execution_id="exec-1",
+        workflow_type=workflow_type,
+        org_id="org-1",
+        thread_id="thread-1",
+        entity_id="email-1",
+        entity_type="Email",
+        initial_state={"email_data": {"attachments": [{"content": b"%PDF-1.7"}]}},
+    )
+
+
+def test_job_round_trip_keeps_attachment_bytes():
+    """Test that attachment bytes survive the JSON encoding used on the broker."""
+    job = make_job()
+    encoded = encode_job(job)
+
+    assert isinstance(encoded["initial_state"]["email_data"]["attachments"][0]["content"], dict)
+    assert decode_job(encoded) == job
+
+
+def test_running_jobs_are_not_redelivered_early():
+    """Test that late-acknowledged jobs stay invisible for longer than Redis's one hour default."""
+    assert celery_app.conf.task_acks_late
+    assert celery_app.conf.broker_transport_options["visibility_timeout"] == get_settings().celery_visibility_timeout > 3600
+
+
+@pytest.mark.parametrize(
+    "workflow_type, queue",
+    [("quote_processing", "workflows.extraction"), ("procurement", "workflows")],
+)
+def test_celery_dispatch_routes_by_workflow_type(workflow_type, queue):
+    """Test that jobs go to the queue configured for their workflow type."""
+    manager = WorkflowManager()
+    manager.settings = manager.settings.model_copy(update={"workflow_dispatch": "celery"})
+
+    with patch.object(celery_app, "send_task") as mock_send, \
+         patch.object(manager.executor, "submit") as mock_submit:
+        manager._dispatch(make_job(workflow_type))
+
+    mock_submit.assert_not_called()
+    mock_send.assert_called_once()
+    assert mock_send.call_args.args[0] == RUN_WORKFLOW_TASK
+    assert mock_send.call_args.kwargs["queue"] == queue
+    assert mock_send.call_args.kwargs["task_id"] == "exec-1"
+
+
+def test_local_dispatch_uses_executor():
+    """Test that the default dispatch mode runs jobs in this process."""
+    manager = WorkflowManager()
+
+    with patch.object(celery_app, "send_task") as mock_send, \
+         patch.object(manager.executor, "submit") as mock_submit:
+        manager._dispatch(make_job())
+
+    mock_send.assert_not_called()
+    assert mock_submit.call_args.args[:2] == ("quote_processing", "exec-1")
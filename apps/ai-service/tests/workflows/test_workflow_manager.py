@@ -0,0 +1,367 @@
+"""Tests for the process-wide workflow manager."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import START, END
+
+from src.workflows.base import BaseWorkflow, WorkflowState
+from src.workflows.jobs import WorkflowJob
+from src.workflows.manager import CANCEL_CHANNEL, WorkflowManager, WorkflowStartTimeout, get_workflow_manager
+
+
+@pytest.fixture
+def manager():
+    """Create a fresh workflow manager instance."""
+    return WorkflowManager()
+
+
+@pytest.mark.asyncio
+async def test_warmup_compiles_every_workflow(manager):
+    """Test that warmup compiles each registered workflow type."""
+    timings = await manager.warmup()
+
+    assert set(timings.keys()) == set(manager.workflows.keys())
+    assert all(duration >= 0 for duration in timings.values())
+
+
+@pytest.mark.asyncio
+async def test_compiled_workflows_are_reused(manager):
+    """Test that a workflow type is only compiled once."""
+    await manager.warmup()
+    first = await manager.get_workflow("procurement")
+    second = await manager.get_workflow("procurement")
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_unknown_workflow_type(manager):
+    """Test that unknown workflow types are rejected."""
+    with pytest.raises(ValueError):
+        await manager.get_workflow("does_not_exist")
+
+
+def test_get_workflow_manager_is_process_wide():
+    """Test that the dependency returns the same manager every time."""
+    assert get_workflow_manager() is get_workflow_manager()
+
+
+class FlakyWorkflow(BaseWorkflow):
+    """Two-step workflow whose second step fails on its first attempt."""
+
+    calls = {"first": 0, "second": 0}
+
+    def _setup_graph(self) -> None:
+        self.graph_builder.add_node("first", self.first)
+        self.graph_builder.add_node("second", self.second)
+        self.graph_builder.add_edge(START, "first")
+        self.graph_builder.add_edge("first", "second")
+        self.graph_builder.add_edge("second", END)
+
+    async def first(self, state: WorkflowState) -> WorkflowState:
+        self.calls["first"] += 1
+        state["data"]["first_done"] = True
+        return state
+
+    async def second(self, state: WorkflowState) -> WorkflowState:
+        self.calls["second"] += 1
+        if self.calls["second"] == 1:
+            raise RuntimeError("LLM provider unavailable")
+        state["data"]["second_done"] = True
+        return state
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_from_last_checkpoint():
+    """Test that resuming a failed execution does not re-run completed nodes."""
+    FlakyWorkflow.calls = {"first": 0, "second": 0}
+    manager = WorkflowManager()
+    manager.checkpointer = MemorySaver()
+    manager.workflows["flaky"] = FlakyWorkflow
+    db = MagicMock()
+    db.execute_raw = AsyncMock(return_value=1)
+    db.auditlog.create_many = AsyncMock(return_value=1)
+    db.workflowexecution.find_unique = AsyncMock(return_value=MagicMock(status="RUNNING"))
+
+    @asynccontextmanager
+    async def fake_tenant(org_id):
+        yield db
+
+    job = WorkflowJob(
+        execution_id="exec-1",
+        workflow_type="flaky",
+        org_id="org-1",
+        thread_id="thread-1",
+        entity_id="request-1",
+        entity_type="ProcurementRequest",
+    )
+
+    with patch("src.workflows.state_writer.with_tenant", fake_tenant), \
+         patch("src.workflows.manager.with_tenant", fake_tenant):
+        await manager._run_job({**job, "initial_state": {}})
+        assert "FAILED" in db.execute_raw.call_args.args
+
+        await manager._run_job({**job, "state_data": {"first_done": True}})
+
+    snapshot = await (await manager.get_workflow("flaky")).aget_state(
+        {"configurable": {"thread_id": "thread-1"}}
+    )
+    assert FlakyWorkflow.calls == {"first": 1, "second": 2}
+    assert snapshot.values["data"] == {"first_done": True, "second_done": True}
+    assert "COMPLETED" in db.execute_raw.call_args.args
+
+
+@pytest.mark.asyncio
+async def test_redelivered_start_job_continues_from_checkpoint():
+    """Test that a start job delivered again does not re-run nodes that already completed."""
+    FlakyWorkflow.calls = {"first": 0, "second": 0}
+    manager = WorkflowManager()
+    manager.checkpointer = MemorySaver()
+    manager.workflows["flaky"] = FlakyWorkflow
+    db = MagicMock()
+    db.execute_raw = AsyncMock(return_value=1)
+    db.auditlog.create_many = AsyncMock(return_value=1)
+    db.workflowexecution.find_unique = AsyncMock(return_value=MagicMock(status="RUNNING"))
+    job = WorkflowJob(
+        execution_id="exec-1",
+        workflow_type="flaky",
+        org_id="org-1",
+        thread_id="thread-1",
+        entity_id="request-1",
+        entity_type="ProcurementRequest",
+        initial_state={},
+    )
+
+    with patch("src.workflows.state_writer.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.with_tenant", fake_db_tenant(db)):
+        await manager._run_job(job)
+        await manager._run_job(job)
+        assert FlakyWorkflow.calls == {"first": 1, "second": 2}
+
+        # Once the execution finished, a further redelivery is a no-op
+        db.workflowexecution.find_unique.return_value = MagicMock(status="COMPLETED")
+        await manager._run_job(job)
+
+    assert FlakyWorkflow.calls == {"first": 1, "second": 2}
+
+
+def fake_db_tenant(db):
+    @asynccontextmanager
+    async def _with_tenant(org_id):
+        yield db
+    return _with_tenant
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_running_execution():
+    """Test that cancelling an execution cancels its task in this process."""
+    manager = WorkflowManager()
+    db = MagicMock()
+    db.workflowexecution.update_many = AsyncMock(return_value=1)
+    db.workflowexecution.find_unique = AsyncMock(return_value=MagicMock(workflowType="quote_processing"))
+    task = manager.executor.submit("quote_processing", "exec-1", lambda: asyncio.sleep(60))
+    await asyncio.sleep(0)
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)):
+        await manager.cancel_workflow("exec-1", "org-1")
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert manager.executor.stats()["quote_processing"]["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_finished_execution_is_rejected():
+    """Test that a finished execution cannot be cancelled."""
+    manager = WorkflowManager()
+    db = MagicMock()
+    db.workflowexecution.update_many = AsyncMock(return_value=0)
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)):
+        with pytest.raises(ValueError):
+            await manager.cancel_workflow("exec-1", "org-1")
+
+
+@pytest.mark.asyncio
+async def test_cancellation_reaches_other_process():
+    """Test that a cancellation published by another process cancels the local task."""
+    valkey = FakeRedis(server=FakeServer())
+    manager = WorkflowManager()
+    task = manager.executor.submit("quote_processing", "exec-1", lambda: asyncio.sleep(60))
+
+    with patch("src.workflows.manager.get_valkey_client", return_value=valkey):
+        await manager.start_cancellation_listener()
+        for _ in range(50):
+            if await valkey.publish(CANCEL_CHANNEL, "exec-1"):
+                break
+            await asyncio.sleep(0.01)
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=1)
+        await manager.stop_cancellation_listener()
+
+
+@pytest.mark.asyncio
+async def test_start_many_inserts_batch_once():
+    """Test that a batch start inserts all executions in one statement and dispatches each."""
+    manager = WorkflowManager()
+    manager._dispatch = MagicMock()
+    db = MagicMock()
+    db.workflowexecution.create_many = AsyncMock(return_value=3)
+    db.workflowexecution.find_many = AsyncMock(return_value=[])
+    requests = [
+        {"workflow_type": "quote_processing", "entity_id": f"quote-{i}", "entity_type": "Quote", "initial_state": {}}
+        for i in range(3)
+    ]
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=FakeRedis(server=FakeServer())):
+        execution_ids = await manager.start_many("org-1", requests)
+
+    db.workflowexecution.create_many.assert_awaited_once()
+    rows = db.workflowexecution.create_many.await_args.kwargs["data"]
+    assert [row["id"] for row in rows] == execution_ids
+    assert [row["entityId"] for row in rows] == ["quote-0", "quote-1", "quote-2"]
+    assert manager._dispatch.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_start_many_deduplicates_entities():
+    """Test that a batch reuses running executions, repeated entities and an Idempotency-Key."""
+    manager = WorkflowManager()
+    manager._dispatch = MagicMock()
+    db = MagicMock()
+    db.workflowexecution.create_many = AsyncMock(return_value=1)
+    db.workflowexecution.find_many = AsyncMock(return_value=[
+        MagicMock(id="exec-running", workflowType="quote_processing", entityId="quote-0"),
+        MagicMock(id="exec-other-type", workflowType="procurement", entityId="quote-1"),
+    ])
+    requests = [
+        {"workflow_type": "quote_processing", "entity_id": entity_id, "entity_type": "Quote", "initial_state": {}}
+        for entity_id in ["quote-0", "quote-1", "quote-1"]
+    ]
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=FakeRedis(server=FakeServer())):
+        execution_ids = await manager.start_many("org-1", requests, idempotency_key="batch-1")
+        retried = await manager.start_many("org-1", requests, idempotency_key="batch-1")
+
+    rows = db.workflowexecution.create_many.await_args.kwargs["data"]
+    assert [row["entityId"] for row in rows] == ["quote-1"]
+    assert execution_ids == ["exec-running", rows[0]["id"], rows[0]["id"]]
+    assert retried == execution_ids
+    db.workflowexecution.create_many.assert_awaited_once()
+    manager._dispatch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_start_lock_wait_is_bounded():
+    """Test that a start gives up once another holder keeps the entity's lock past the wait."""
+    manager = WorkflowManager()
+    manager.settings = manager.settings.model_copy(update={"workflow_start_lock_wait": 0.1})
+    valkey = FakeRedis(server=FakeServer())
+    await valkey.set("workflow:start:org-1:procurement:request-1", "someone-else")
+
+    with patch("src.workflows.manager.get_valkey_client", return_value=valkey):
+        with pytest.raises(WorkflowStartTimeout):
+            async with manager._start_lock("org-1", [("procurement", "request-2"), ("procurement", "request-1")]):
+                pass
+
+    # Locks taken before giving up are released
+    assert await valkey.get("workflow:start:org-1:procurement:request-2") is None
+
+
+def single_execution_db():
+    """Database whose find_first sees executions created earlier."""
+    db = MagicMock()
+    created = []
+
+    async def create(data):
+        await asyncio.sleep(0.01)
+        created.append(MagicMock(id=f"exec-{len(created) + 1}"))
+        return created[-1]
+
+    db.workflowexecution.create = AsyncMock(side_effect=create)
+    db.workflowexecution.find_first = AsyncMock(side_effect=lambda **_: created[-1] if created else None)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_concurrent_starts_for_entity_run_once():
+    """Test that concurrent starts for one entity launch a single execution."""
+    manager = WorkflowManager()
+    manager._dispatch = MagicMock()
+    db = single_execution_db()
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=FakeRedis(server=FakeServer())):
+        execution_ids = await asyncio.gather(*[
+            manager.start_workflow("procurement", "org-1", "request-1", "ProcurementRequest", {})
+            for _ in range(3)
+        ])
+
+    assert execution_ids == ["exec-1"] * 3
+    db.workflowexecution.create.assert_awaited_once()
+    manager._dispatch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_returns_same_execution():
+    """Test that a retried start with the same Idempotency-Key skips the database."""
+    manager = WorkflowManager()
+    manager._dispatch = MagicMock()
+    db = single_execution_db()
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=FakeRedis(server=FakeServer())):
+        first = await manager.start_workflow("procurement", "org-1", "request-1", "ProcurementRequest", {}, idempotency_key="k1")
+        second = await manager.start_workflow("procurement", "org-1", "request-1", "ProcurementRequest", {}, idempotency_key="k1")
+
+    assert first == second == "exec-1"
+    db.workflowexecution.find_first.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retries_with_one_idempotency_key_launch_once():
+    """Test that concurrent starts sharing an Idempotency-Key launch one execution even for different entities."""
+    manager = WorkflowManager()
+    manager._dispatch = MagicMock()
+    db = single_execution_db()
+    db.workflowexecution.find_first = AsyncMock(return_value=None)
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=FakeRedis(server=FakeServer())):
+        execution_ids = await asyncio.gather(*[
+            manager.start_workflow("procurement", "org-1", f"request-{i}", "ProcurementRequest", {}, idempotency_key="k1")
+            for i in range(3)
+        ])
+
+    assert execution_ids == ["exec-1"] * 3
+    db.workflowexecution.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_start_releases_idempotency_key():
+    """Test that a start that fails leaves its Idempotency-Key free for the retry."""
+    manager = WorkflowManager()
+    manager._dispatch = MagicMock()
+    db = single_execution_db()
+    db.workflowexecution.find_first = AsyncMock(side_effect=[RuntimeError("database unavailable"), None])
+    valkey = FakeRedis(server=FakeServer())
+
+    with patch("src.workflows.manager.with_tenant", fake_db_tenant(db)), \
+         patch("src.workflows.manager.get_valkey_client", return_value=valkey):
+        with pytest.raises(RuntimeError):
+            await manager.start_workflow("procurement", "org-1", "request-1", "ProcurementRequest", {}, idempotency_key="k1")
+        assert await valkey.get("workflow:idempotency:org-1:k1") is None
+
+        execution_id = await manager.start_workflow("procurement", "org-1", "request-1", "ProcurementRequest", {}, idempotency_key="k1")
+
+    assert execution_id == "exec-1"
+    assert await valkey.get("workflow:idempotency:org-1:k1") == b"exec-1"
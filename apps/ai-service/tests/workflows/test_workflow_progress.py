@@ -0,0 +1,71 @@
+"""Tests for live workflow progress streams."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from src.workflows import progress
+from src.workflows.progress import WorkflowProgressHub, publish_progress, stream_progress
+
+
+@pytest.fixture
+def valkey():
+    client = FakeRedis(server=FakeServer())
+    hub = WorkflowProgressHub(client, queue_size=2)
+
+    with patch("src.workflows.progress.get_valkey_client", return_value=client), \
+         patch.object(progress, "_progress_hub", hub):
+        yield client
+
+
+async def publish_when_subscribed(client, **event):
+    """Publish once the hub's pattern subscription is live."""
+    for _ in range(50):
+        if (await client.execute_command("PUBSUB", "NUMPAT")):
+            break
+        await asyncio.sleep(0.01)
+    await publish_progress(**event)
+
+
+def parse(message):
+    return json.loads(message.split("data: ", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_snapshot_then_steps_until_terminal(valkey):
+    """Test that an execution stream starts with a snapshot and ends on a terminal status."""
+    async def snapshot():
+        return {"execution_id": "exec-1", "status": "RUNNING", "current_step": "validate_request"}
+
+    stream = stream_progress("org-1", lambda event: event["execution_id"] == "exec-1", snapshot, until_terminal=True)
+    assert parse(await stream.__anext__())["current_step"] == "validate_request"
+
+    base = {"org_id": "org-1", "workflow_type": "procurement", "entity_type": "ProcurementRequest", "entity_id": "req-1"}
+    next_message = asyncio.create_task(stream.__anext__())
+    await publish_when_subscribed(valkey, **base, execution_id="exec-2", status="RUNNING", current_step="other")
+    await publish_progress(**base, execution_id="exec-1", status="RUNNING", current_step="select_vendors")
+    await publish_progress(**base, execution_id="exec-1", status="COMPLETED", current_step="complete")
+
+    assert parse(await asyncio.wait_for(next_message, 1))["current_step"] == "select_vendors"
+    assert parse(await asyncio.wait_for(stream.__anext__(), 1))["status"] == "COMPLETED"
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    await progress.get_progress_hub().stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_keeps_latest_events():
+    """Test that a full subscriber queue drops its oldest events."""
+    hub = WorkflowProgressHub(FakeRedis(server=FakeServer()), queue_size=2)
+
+    async with hub.subscribe("org-1") as queue:
+        for step in range(3):
+            hub._deliver("org-1", {"current_step": step})
+
+        assert [queue.get_nowait()["current_step"] for _ in range(2)] == [1, 2]
+
+    await hub.stop()
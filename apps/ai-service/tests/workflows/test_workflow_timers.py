@@ -0,0 +1,129 @@
+"""Tests for the Valkey-backed workflow deadline timers."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from src.workflows.timers import WorkflowTimerService
+
+
+@pytest.fixture
+def server():
+    """Shared fake Valkey server, standing in for a real deployment."""
+    return FakeServer()
+
+
+def make_service(server):
+    return WorkflowTimerService(FakeRedis(server=server))
+
+
+@pytest.mark.asyncio
+async def test_due_deadline_emits_event(server):
+    """Test that a passed deadline is fired and removed."""
+    service = make_service(server)
+    await service.schedule(
+        "org-1", "ProcurementRequest", "request-1", "quote_deadline_reached",
+        datetime.now() - timedelta(seconds=1),
+    )
+
+    with patch("src.workflows.timers.emit_workflow_event", new_callable=AsyncMock) as mock_emit:
+        next_due = await service.fire_due()
+
+    mock_emit.assert_awaited_once_with(
+        "org-1", "ProcurementRequest", "request-1", "quote_deadline_reached", {}, raise_errors=True
+    )
+    assert next_due is None
+    assert await service.client.zcard(service.key) == 0
+
+
+@pytest.mark.asyncio
+async def test_future_deadline_is_kept(server):
+    """Test that a deadline in the future is not fired and reports its due time."""
+    service = make_service(server)
+    deadline = datetime.now() + timedelta(hours=48)
+    await service.schedule("org-1", "ProcurementRequest", "request-1", "quote_deadline_reached", deadline)
+
+    with patch("src.workflows.timers.emit_workflow_event", new_callable=AsyncMock) as mock_emit:
+        next_due = await service.fire_due()
+
+    mock_emit.assert_not_awaited()
+    assert next_due == pytest.approx(deadline.timestamp())
+
+
+@pytest.mark.asyncio
+async def test_rescheduling_and_cancel(server):
+    """Test that registering the same deadline twice stores it once and cancel drops it."""
+    service = make_service(server)
+    deadline = datetime.now() + timedelta(hours=48)
+    for _ in range(2):
+        await service.schedule("org-1", "ProcurementRequest", "request-1", "quote_deadline_reached", deadline)
+
+    assert await service.client.zcard(service.key) == 1
+
+    await service.cancel("org-1", "ProcurementRequest", "request-1", "quote_deadline_reached")
+
+    assert await service.client.zcard(service.key) == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_fires_on_one_replica_only(server):
+    """Test that replicas sharing Valkey deliver a deadline exactly once."""
+    first, second = make_service(server), make_service(server)
+    await first.schedule(
+        "org-1", "ProcurementRequest", "request-1", "quote_deadline_reached",
+        datetime.now() - timedelta(seconds=1),
+    )
+
+    with patch("src.workflows.timers.emit_workflow_event", new_callable=AsyncMock) as mock_emit:
+        await first.fire_due()
+        await second.fire_due()
+
+    assert mock_emit.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_keeps_deadline(server):
+    """Test that a deadline whose event handler fails is retried instead of dropped."""
+    service = make_service(server)
+    await service.schedule(
+        "org-1", "ProcurementRequest", "request-1", "quote_deadline_reached",
+        datetime.now() - timedelta(seconds=1),
+    )
+
+    emit = AsyncMock(side_effect=[RuntimeError("resume failed"), None])
+    with patch("src.workflows.timers.emit_workflow_event", emit) as mock_emit:
+        next_due = await service.fire_due()
+        assert next_due == pytest.approx(datetime.now().timestamp() + service.retry_delay, abs=5)
+        assert await service.client.zcard(service.processing_key) == 0
+
+        # Once the retry delay has passed
+        member = (await service.client.zrange(service.key, 0, 0))[0]
+        await service.client.zadd(service.key, {member: 0})
+        assert await service.fire_due() is None
+
+    assert mock_emit.await_count == 2
+    assert mock_emit.await_args.kwargs["raise_errors"] is True
+    assert await service.client.zcard(service.key) == 0
+    assert await service.client.zcard(service.processing_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_retried(server):
+    """Test that a deadline claimed by a replica that died is delivered once its lease expires."""
+    crashed, survivor = make_service(server), make_service(server)
+    await crashed.schedule(
+        "org-1", "ProcurementRequest", "request-1", "quote_deadline_reached",
+        datetime.now() - timedelta(seconds=1),
+    )
+    member = (await crashed.client.zrange(crashed.key, 0, 0))[0]
+    # Claimed, then the process died before delivering
+    await crashed._move(member, crashed.key, crashed.processing_key, 0)
+
+    with patch("src.workflows.timers.emit_workflow_event", new_callable=AsyncMock) as mock_emit:
+        await survivor.fire_due()
+
+    mock_emit.assert_awaited_once()
+    assert await survivor.client.zcard(survivor.processing_key) == 0
@@ -0,0 +1,32 @@
+-- Composite indexes for the hot query shapes of the workflows and routers.
+--
+-- Matches the @@index declarations in schema.prisma (same names Prisma
+-- generates), so `prisma db push` sees them as already applied. For an
+-- existing database, run outside a transaction so the builds don't block
+-- writes:
+--
+--   psql "$DATABASE_URL" -f packages/db/migrations/20261017_hot_path_indexes.sql
+
+-- Quotes of a procurement request (monitor_responses, process_quotes, status endpoint)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "quotes_requestId_idx"
+    ON "quotes" ("requestId");
+
+-- Vendor lookup by sender address (quote processing)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "vendors_orgId_email_idx"
+    ON "vendors" ("orgId", "email");
+
+-- Active vendors of a tenant (vendor selection)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "vendors_orgId_isActive_idx"
+    ON "vendors" ("orgId", "isActive");
+
+-- Request lists filtered by status, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "procurement_requests_orgId_status_createdAt_idx"
+    ON "procurement_requests" ("orgId", "status", "createdAt");
+
+-- Executions of an entity (event resumption, start deduplication, status endpoint)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "workflow_executions_entityId_entityType_startedAt_idx"
+    ON "workflow_executions" ("entityId", "entityType", "startedAt");
+
+-- Email threads linked to a request
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "email_threads_requestId_idx"
+    ON "email_threads" ("requestId");